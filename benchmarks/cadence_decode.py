@@ -0,0 +1,66 @@
+"""Compare decoding of large JSON-Cadence documents with `cadence_object_hook` and with `decode_json`.
+
+Run with: `python -m benchmarks.cadence_decode`
+"""
+
+import json
+import timeit
+
+from flow_py_sdk import cadence
+
+
+def _struct(i: int) -> cadence.Struct:
+    return cadence.Struct(
+        "A.01cf0e2f2f715450.Test.Item",
+        [
+            ("itemId", cadence.UInt64(i)),
+            ("name", cadence.String(f"item {i}")),
+            ("owner", cadence.Address.from_hex("0x01cf0e2f2f715450")),
+            ("price", cadence.UFix64(i * 100_000_000)),
+            ("tags", cadence.Array([cadence.String("a"), cadence.String("b")])),
+            ("parent", cadence.Optional(cadence.UInt64(i - 1) if i else None)),
+        ],
+    )
+
+
+def _documents(size: int) -> dict[str, str]:
+    values = {
+        "array of structs": cadence.Array([_struct(i) for i in range(size)]),
+        "dictionary": cadence.Dictionary(
+            [
+                cadence.KeyValuePair(cadence.String(f"key {i}"), _struct(i))
+                for i in range(size)
+            ]
+        ),
+        "nested arrays": cadence.Array(
+            [cadence.Array([cadence.Int(j) for j in range(10)]) for _ in range(size)]
+        ),
+    }
+    return {
+        name: json.dumps(
+            value,
+            ensure_ascii=False,
+            cls=cadence.CadenceJsonEncoder,
+            separators=(",", ":"),
+        )
+        for name, value in values.items()
+    }
+
+
+def run(size: int = 500, number: int = 20):
+    for name, document in _documents(size).items():
+        hook = timeit.timeit(
+            lambda: json.loads(document, object_hook=cadence.cadence_object_hook),
+            number=number,
+        )
+        fast = timeit.timeit(lambda: cadence.decode_json(document), number=number)
+        print(
+            f"{name} ({len(document) // 1024} KiB): "
+            f"object_hook {hook / number * 1000:.2f} ms, "
+            f"decode_json {fast / number * 1000:.2f} ms, "
+            f"speedup {hook / fast:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    run()
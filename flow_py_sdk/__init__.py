@@ -1,18 +1,46 @@
 import logging
 
-from .client import flow_client, AccessAPI, entities
+from .client import (
+    flow_client,
+    pooled_flow_client,
+    ChannelPool,
+    Hedging,
+    AccessAPI,
+    entities,
+    TransactionPipeline,
+    SubmissionResult,
+    ProposerKeyPool,
+    ProposerKeyLease,
+    TransactionTracker,
+    TransactionStatusTracker,
+    BlockSealTracker,
+    EventFollower,
+    AccountCache,
+    ImmutableCache,
+    MemoryStore,
+    SQLiteStore,
+    ScriptResultCache,
+    SingleFlight,
+    RateLimiter,
+    MethodLimits,
+    RetryPolicy,
+)
 from .script import Script
-from .exceptions import PySDKError, NotCadenceValueError
+from .exceptions import PySDKError, NotCadenceValueError, TransactionError
 from .signer import (
     SignAlgo,
     HashAlgo,
     InMemorySigner,
     InMemoryVerifier,
+    VerifierCache,
     Signer,
+    AsyncSigner,
+    ExecutorSigner,
     Verifier,
 )
 from .account_key import AccountKey
 from .templates import create_account_template, TransactionTemplates
 from .tx import Tx, ProposalKey, TxSignature, TransactionStatus
+from .signing_pool import SigningPool
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,5 +1,6 @@
-from .decode import cadence_object_hook
+from .decode import cadence_object_hook, decode_json
 from .encode import CadenceJsonEncoder, encode_arguments
+from .json_backend import JsonBackend, set_json_backend, get_json_backend
 from .types import (
     Value,
     Void,
@@ -1,5 +1,6 @@
 from typing import Any, Callable, Type, Union
 
+from flow_py_sdk.cadence.json_backend import get_json_backend
 from flow_py_sdk.cadence.value import Value
 from flow_py_sdk.cadence.kind import Kind
 import logging
@@ -19,6 +20,26 @@ def add_cadence_kind_decoder(t: Type[Kind]):
 
 def decode(obj: dict[Any, Any]) -> Union[Value, Kind, dict]:
     try:
+        # Plain JSON objects are the common case, so they are checked first.
+        # Checking the exact type is a lot cheaper than the isinstance checks against the abstract base classes.
+        if type(obj) is dict:
+            # If obj has an idKey, treat as already decoded field or parameter
+            if c.idKey in obj:
+                return obj
+
+            # Check for kindKey or typeKey to determine appropriate decoder
+            if c.kindKey in obj:
+                decoder = _cadence_kind_decoders.get(obj[c.kindKey])
+                if decoder is not None:
+                    return decoder(obj)
+
+            if c.typeKey in obj:
+                decoder = _cadence_decoders.get(obj[c.typeKey])
+                if decoder is not None:
+                    return decoder(obj)
+
+            return obj  # Return the object if no decoder applies
+
         # Check if already decoded
         if isinstance(obj, Value) or isinstance(obj, Kind):
             return obj
@@ -59,3 +80,25 @@ def decode(obj: dict[Any, Any]) -> Union[Value, Kind, dict]:
 
 def cadence_object_hook(obj: [dict[Any, Any]]) -> Any:
     return decode(obj)
+
+
+def decode_json(data: Union[str, bytes]) -> Any:
+    """Decode a JSON-Cadence document.
+
+    This is equivalent to `json.loads(data, object_hook=cadence_object_hook)`, but faster.
+    The JSON is parsed to plain python objects first, with the selected JSON backend (see `set_json_backend`),
+    and then decoded starting at the root.
+    Every decoder decodes its own children, so each value is dispatched exactly once,
+    while wrapper objects (like composite fields or dictionary entries) are not dispatched at all.
+
+    Parameters
+    ----------
+    data : str | bytes
+        The JSON-Cadence document.
+
+    Returns
+    -------
+    Any
+        The decoded cadence value.
+    """
+    return decode(get_json_backend().loads(data))
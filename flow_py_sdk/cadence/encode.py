@@ -1,6 +1,7 @@
 import json
 from typing import Any, Optional as Optional, Tuple, Callable
 
+from flow_py_sdk.cadence.json_backend import get_json_backend
 from flow_py_sdk.cadence.kind import Kind
 from flow_py_sdk.cadence.types import Value
 
@@ -40,13 +41,8 @@ class CadenceJsonEncoder(json.JSONEncoder):
 def encode_arguments(arguments: list[Value]) -> list[bytes]:
     if arguments is None:
         return []
-    # the separators and the new line are there to get an identical json as the flow-go-sdk does (usually).
+    # All json backends produce an identical json to the one the flow-go-sdk does (usually).
     # It doesn't need to be identical, but it is convenient for comparative testing with the go-sdk.
-    return [
-        (
-            json.dumps(
-                a, ensure_ascii=False, cls=CadenceJsonEncoder, separators=(",", ":")
-            )
-        ).encode("utf-8")
-        for a in arguments
-    ]
+    # It does need to be stable though, because the encoded arguments are signed.
+    dumps = get_json_backend().dumps
+    return [dumps(a) for a in arguments]
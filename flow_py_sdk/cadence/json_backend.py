@@ -0,0 +1,133 @@
+import json
+import logging
+from typing import Any, Optional, Union
+
+from flow_py_sdk.cadence.kind import Kind
+from flow_py_sdk.cadence.value import Value
+
+log = logging.getLogger(__name__)
+
+
+def _encode_hook(o: Any) -> Any:
+    if isinstance(o, Value) or isinstance(o, Kind):
+        return o.encode()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class JsonBackend(object):
+    """Serializes and parses JSON-Cadence documents.
+
+    All backends produce byte-identical output: compact separators and non-ASCII characters
+    written as UTF-8. Transaction arguments are hashed as bytes when signing,
+    so a different serialization would produce different signatures.
+
+    Attributes
+    ----------
+    name : str
+        Name of the backend.
+    """
+
+    name: str = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize obj (which can contain cadence values) to UTF-8 encoded JSON."""
+        # the separators are there to get an identical json as the flow-go-sdk does (usually).
+        return json.dumps(
+            obj, ensure_ascii=False, default=_encode_hook, separators=(",", ":")
+        ).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse JSON into plain python objects. Fails with json.JSONDecodeError on invalid JSON."""
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, default=_encode_hook)
+        except self._orjson.JSONEncodeError:
+            # orjson only supports 64 bit integers and limits the nesting depth
+            return super().dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return self._orjson.loads(data)
+
+
+class MsgspecBackend(JsonBackend):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_hook)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            doc = (
+                data.decode("utf-8", errors="replace") if type(data) is bytes else data
+            )
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+
+
+_json_backends: dict[str, type[JsonBackend]] = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "json": JsonBackend,
+}
+
+_json_backend: Optional[JsonBackend] = None
+
+
+def set_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Select the JSON backend used to encode transaction and script arguments and to decode results.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        One of "orjson", "msgspec" or "json" (the standard library).
+        If None, the first installed backend in that order is used.
+
+    Returns
+    -------
+    JsonBackend
+        The selected backend.
+    """
+    global _json_backend
+    if name is not None:
+        if name not in _json_backends:
+            raise ValueError(
+                f"Unknown JSON backend {name}, expected one of {', '.join(_json_backends)}"
+            )
+        _json_backend = _json_backends[name]()
+        return _json_backend
+
+    for backend in _json_backends.values():
+        try:
+            _json_backend = backend()
+            break
+        except ImportError:
+            continue
+    log.debug(f"Using the {_json_backend.name} JSON backend")
+    return _json_backend
+
+
+def get_json_backend() -> JsonBackend:
+    """Get the selected JSON backend, selecting the fastest installed one on first use."""
+    if _json_backend is None:
+        return set_json_backend()
+    return _json_backend
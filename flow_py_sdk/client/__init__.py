@@ -1 +1,18 @@
 from .client import AccessAPI, flow_client
+from .key_pool import ProposerKeyPool, ProposerKeyLease
+from .tracker import TransactionTracker, TransactionStatusTracker, BlockSealTracker
+from .events import EventFollower
+from .single_flight import SingleFlight
+from .rate_limit import RateLimiter, MethodLimits, TokenBucket
+from .retry import RetryPolicy
+from .pool import ChannelPool, Endpoint, Hedging, pooled_flow_client
+from .pipeline import TransactionPipeline, SubmissionResult
+from .cache import (
+    LRUCache,
+    AccountCache,
+    ImmutableCache,
+    ImmutableStore,
+    MemoryStore,
+    SQLiteStore,
+    ScriptResultCache,
+)
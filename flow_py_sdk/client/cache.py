@@ -0,0 +1,284 @@
+import hashlib
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Annotated, Hashable, Optional, Type, TypeVar
+
+import betterproto
+
+from flow_py_sdk.client import entities
+from flow_py_sdk.lru_cache import LRUCache
+
+
+class AccountCache(LRUCache):
+    """Caches accounts fetched by an AccessAPI
+
+    An account at a given block height never changes, so it is cached until it is evicted.
+    An account at the latest block is cached for `latest_ttl` seconds.
+    The cached accounts are shared between callers and should not be modified.
+    Reads that need the current state of an account (like the sequence number after
+    a mismatch) skip the cache with `use_cache=False`.
+
+    To cache the accounts of a client, set its account cache:
+    `client.account_cache = AccountCache()`
+
+    Attributes
+    ----------
+    latest_ttl : float
+        Time for which accounts at the latest block are cached.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, *, latest_ttl: Annotated[float, "seconds"] = 1.0
+    ) -> None:
+        super().__init__(max_size)
+        self.latest_ttl: float = latest_ttl
+
+    def get_account(
+        self, address: bytes, block_height: Optional[int] = None
+    ) -> Optional[entities.Account]:
+        """Get a cached account, at the given block height or at the latest block if block_height is None."""
+        return self.get((address, block_height))
+
+    def put_account(
+        self,
+        address: bytes,
+        account: entities.Account,
+        block_height: Optional[int] = None,
+    ) -> None:
+        """Cache an account, at the given block height or at the latest block if block_height is None."""
+        self.put(
+            (address, block_height),
+            account,
+            ttl=self.latest_ttl if block_height is None else None,
+        )
+
+
+class ScriptResultCache(LRUCache):
+    """Caches the results of scripts executed by an AccessAPI at a given block
+
+    A script executed at a given block ID or height always returns the same result, so results
+    are cached by a hash of the script code, its encoded arguments and the block.
+    Scripts executed at the latest block are not cached.
+    Results are stored as JSON-Cadence bytes and decoded on every hit,
+    so callers never share the decoded values.
+
+    To cache the script results of a client, set its script cache:
+    `client.script_cache = ScriptResultCache()`
+
+    Attributes
+    ----------
+    max_bytes : int
+        Maximum total size of the cached results. The least recently used results are evicted first.
+    size_bytes : int
+        Total size of the cached results.
+    """
+
+    def __init__(self, max_size: int = 1024, *, max_bytes: int = 64 << 20) -> None:
+        super().__init__(max_size)
+        self.max_bytes: int = max_bytes
+        self.size_bytes: int = 0
+
+    @staticmethod
+    def key(
+        script: bytes,
+        arguments: list[bytes],
+        *,
+        block_id: Optional[bytes] = None,
+        block_height: Optional[int] = None,
+    ) -> bytes:
+        """The cache key of a script execution at a block ID, or at a block height if block_id is None."""
+        block = (
+            b"id:" + block_id if block_id is not None else b"height:%d" % block_height
+        )
+        h = hashlib.sha256()
+        for part in [script, block, *arguments]:
+            h.update(len(part).to_bytes(8, "big"))
+            h.update(part)
+        return h.digest()
+
+    def put(
+        self,
+        key: Hashable,
+        value: bytes,
+        ttl: Optional[Annotated[float, "seconds"]] = None,
+    ) -> None:
+        if len(value) > self.max_bytes:
+            return
+        super().put(key, value, ttl)
+        self.size_bytes += len(value)
+        while self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry[1])
+
+    def clear(self) -> None:
+        super().clear()
+        self.size_bytes = 0
+
+
+class ImmutableStore(ABC):
+    """Storage of an ImmutableCache
+
+    Maps string keys to serialized values. Values are never changed once they are stored.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a stored value, or None if the key is not stored."""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: bytes) -> None:
+        """Store a value."""
+        pass
+
+    def close(self) -> None:
+        """Release the resources of the store."""
+        pass
+
+
+class MemoryStore(ImmutableStore):
+    """Keeps up to `max_size` values in memory, evicting the least recently used value first."""
+
+    def __init__(self, max_size: int = 4096) -> None:
+        super().__init__()
+        self._entries: LRUCache = LRUCache(max_size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    def put(self, key: str, value: bytes) -> None:
+        self._entries.put(key, value)
+
+
+class SQLiteStore(ImmutableStore):
+    """Keeps values in an SQLite database file, so they survive restarts and can be shared between runs.
+
+    Values are never evicted. The database is accessed synchronously, which is fast
+    for local files, but does block the event loop for the duration of each lookup.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path: str = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS flow_data (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM flow_data").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connection.execute(
+            "SELECT value FROM flow_data WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key: str, value: bytes) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO flow_data (key, value) VALUES (?, ?)", (key, value)
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+M = TypeVar("M", bound=betterproto.Message)
+
+
+class ImmutableCache(object):
+    """Caches data fetched by an AccessAPI that can never change
+
+    Finalized blocks and block headers (by ID and by height), collections and transactions
+    (by ID) are immutable, so once fetched they can be served from the cache.
+    The data is stored serialized in a pluggable ImmutableStore: a `MemoryStore` by default,
+    or a `SQLiteStore` to keep it between runs.
+
+    To cache the immutable data of a client, set its immutable cache:
+    `client.immutable_cache = ImmutableCache()`
+
+    Attributes
+    ----------
+    store : ImmutableStore
+        Where the data is stored.
+    hits : int
+        Number of lookups that found the data.
+    misses : int
+        Number of lookups that did not find the data.
+    """
+
+    def __init__(self, store: Optional[ImmutableStore] = None) -> None:
+        super().__init__()
+        self.store: ImmutableStore = store if store is not None else MemoryStore()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(
+        self,
+        message_type: Type[M],
+        *,
+        id: Optional[bytes] = None,
+        height: Optional[int] = None,
+    ) -> Optional[M]:
+        """Get cached data by ID or by height.
+
+        Parameters
+        ----------
+        message_type : Type[betterproto.Message]
+            The protobuf message type of the data, for example `flow.entities.Block`.
+        id : Optional[bytes]
+            ID of the data.
+        height : Optional[int]
+            Height of the data, if id is None.
+
+        Returns
+        -------
+        Optional[betterproto.Message]
+            The data, or None if it is not cached.
+        """
+        kind = message_type.__name__
+        if id is None:
+            id = self.store.get(f"{kind}/height/{height}")
+        value = None if id is None else self.store.get(f"{kind}/{id.hex()}")
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return message_type().parse(value)
+
+    def put(
+        self, message: betterproto.Message, *, id: bytes, height: Optional[int] = None
+    ) -> None:
+        """Cache data by ID, and by height if it has one.
+
+        Parameters
+        ----------
+        message : betterproto.Message
+            The data.
+        id : bytes
+            ID of the data.
+        height : Optional[int]
+            Height of the data, if it has one.
+        """
+        kind = type(message).__name__
+        self.store.put(f"{kind}/{id.hex()}", bytes(message))
+        if height is not None:
+            self.store.put(f"{kind}/height/{height}", id)
+
+    def close(self) -> None:
+        """Close the store."""
+        self.store.close()
@@ -1,18 +1,25 @@
 import asyncio
-import json
 import logging
 from types import TracebackType
-from typing import Optional, Type, Annotated, List, Union
+from typing import Optional, Type, Annotated, List, Union, AsyncIterator
 
-import time
 from grpclib.client import Channel
 from grpclib.config import Configuration
 from grpclib.encoding.base import CodecBase, StatusDetailsCodecBase
 from grpclib.metadata import Deadline
 
 from flow_py_sdk import cadence
-from flow_py_sdk.cadence import Value, cadence_object_hook, encode_arguments
+from flow_py_sdk.cadence import Value, decode_json, encode_arguments
 from flow_py_sdk.client import entities
+from flow_py_sdk.client.cache import AccountCache, ImmutableCache, ScriptResultCache
+from flow_py_sdk.client.events import EventFollower, merge_events_response_results
+from flow_py_sdk.client.ranges import MaxHeightRange, height_chunks, ordered_fetch
+from flow_py_sdk.client.rate_limit import RateLimiter
+from flow_py_sdk.client.retry import RetryPolicy
+from flow_py_sdk.client.single_flight import SingleFlight
+from flow_py_sdk.client.tracker import TransactionTracker, TransactionStatusTracker
+from flow_py_sdk.exceptions import TransactionError
+from flow_py_sdk.proto.flow import entities as proto_entities
 from flow_py_sdk.proto.flow.access import (
     AccessAPIStub,
     PingResponse,
@@ -22,6 +29,9 @@ from flow_py_sdk.tx import Tx, TransactionStatus
 
 log = logging.getLogger(__name__)
 
+# Routes of calls that are not idempotent, so identical calls must not be coalesced, hedged or retried.
+_non_idempotent_routes = frozenset(["/flow.access.AccessAPI/SendTransaction"])
+
 
 class AccessAPI(AccessAPIStub):
     def __init__(
@@ -35,6 +45,63 @@ class AccessAPI(AccessAPIStub):
         super().__init__(
             channel=channel, timeout=timeout, deadline=deadline, metadata=metadata
         )
+        self.transaction_tracker: TransactionTracker = TransactionStatusTracker(self)
+        self.account_cache: Optional[AccountCache] = None
+        self.immutable_cache: Optional[ImmutableCache] = None
+        self.script_cache: Optional[ScriptResultCache] = None
+        self.single_flight: Optional[SingleFlight] = None
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.retry_policy: Optional[RetryPolicy] = None
+
+    async def _unary_unary(self, route: str, request, response_type, **kwargs):
+        # Concurrent identical requests share one call (see `single_flight`). Only calls without
+        # a deadline, metadata or call options are coalesced, so that a caller never gets the result
+        # of a call made under other options. Calls with the same timeout share the timeout of the first call.
+        if (
+            self.single_flight is None
+            or route in _non_idempotent_routes
+            or kwargs
+            or self.deadline is not None
+            or self.metadata is not None
+        ):
+            return await self._retried_unary_unary(
+                route, request, response_type, **kwargs
+            )
+        return await self.single_flight.do(
+            (route, bytes(request), self.timeout),
+            lambda: self._retried_unary_unary(route, request, response_type),
+        )
+
+    async def _retried_unary_unary(self, route: str, request, response_type, **kwargs):
+        # Failed calls are retried (see `retry_policy`), within the deadline of the call.
+        policy = self.retry_policy
+        if policy is None or (
+            route in _non_idempotent_routes and not policy.retry_send_transaction
+        ):
+            return await self._limited_unary_unary(
+                route, request, response_type, **kwargs
+            )
+
+        def attempt(deadline: Optional[Deadline]):
+            return self._limited_unary_unary(
+                route, request, response_type, **{**kwargs, "deadline": deadline}
+            )
+
+        deadline = kwargs.get("deadline")
+        return await policy.run(
+            route, attempt, self.deadline if deadline is None else deadline
+        )
+
+    async def _limited_unary_unary(self, route: str, request, response_type, **kwargs):
+        # Calls wait for the limits of their method (see `rate_limiter`).
+        def call():
+            return super(AccessAPI, self)._unary_unary(
+                route, request, response_type, **kwargs
+            )
+
+        if self.rate_limiter is None:
+            return await call()
+        return await self.rate_limiter.run(route, call)
 
     async def __aenter__(self) -> "AccessAPI":
         return self
@@ -45,6 +112,9 @@ class AccessAPI(AccessAPIStub):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
+        self.transaction_tracker.close()
+        if self.immutable_cache is not None:
+            self.immutable_cache.close()
         self.channel.close()
 
     async def get_latest_block_header(
@@ -82,7 +152,15 @@ class AccessAPI(AccessAPIStub):
             Return requested block header.
 
         """
+        if self.immutable_cache is not None:
+            cached = self.immutable_cache.get(proto_entities.BlockHeader, id=id)
+            if cached is not None:
+                return entities.BlockHeader.from_proto(cached)
         response = await super().get_block_header_by_i_d(id=id)
+        if self.immutable_cache is not None:
+            self.immutable_cache.put(
+                response.block, id=response.block.id, height=response.block.height
+            )
         return entities.BlockHeader.from_proto(response.block)
 
     async def get_block_header_by_height(
@@ -102,7 +180,15 @@ class AccessAPI(AccessAPIStub):
             Return requested block header.
 
         """
+        if self.immutable_cache is not None:
+            cached = self.immutable_cache.get(proto_entities.BlockHeader, height=height)
+            if cached is not None:
+                return entities.BlockHeader.from_proto(cached)
         response = await super().get_block_header_by_height(height=height)
+        if self.immutable_cache is not None:
+            self.immutable_cache.put(
+                response.block, id=response.block.id, height=response.block.height
+            )
         return entities.BlockHeader.from_proto(response.block)
 
     async def get_latest_block(self, *, is_sealed: bool = False) -> entities.Block:
@@ -138,7 +224,15 @@ class AccessAPI(AccessAPIStub):
             Return requested block.
 
         """
+        if self.immutable_cache is not None:
+            cached = self.immutable_cache.get(proto_entities.Block, id=id)
+            if cached is not None:
+                return entities.Block.from_proto(cached)
         response = await super().get_block_by_i_d(id=id)
+        if self.immutable_cache is not None:
+            self.immutable_cache.put(
+                response.block, id=response.block.id, height=response.block.height
+            )
         return entities.Block.from_proto(response.block)
 
     async def get_block_by_height(self, *, height: int = 0) -> entities.Block:
@@ -156,7 +250,15 @@ class AccessAPI(AccessAPIStub):
             Return requested block.
 
         """
+        if self.immutable_cache is not None:
+            cached = self.immutable_cache.get(proto_entities.Block, height=height)
+            if cached is not None:
+                return entities.Block.from_proto(cached)
         response = await super().get_block_by_height(height=height)
+        if self.immutable_cache is not None:
+            self.immutable_cache.put(
+                response.block, id=response.block.id, height=response.block.height
+            )
         return entities.Block.from_proto(response.block)
 
     async def get_collection_by_i_d(self, *, id: bytes = b"") -> entities.Collection:
@@ -174,7 +276,13 @@ class AccessAPI(AccessAPIStub):
             Return requested collection.
 
         """
+        if self.immutable_cache is not None:
+            cached = self.immutable_cache.get(proto_entities.Collection, id=id)
+            if cached is not None:
+                return entities.Collection.from_proto(cached)
         response = await super().get_collection_by_i_d(id=id)
+        if self.immutable_cache is not None:
+            self.immutable_cache.put(response.collection, id=response.collection.id)
         return entities.Collection.from_proto(response.collection)
 
     async def get_transaction(self, *, id: bytes = b"") -> entities.Transaction:
@@ -192,11 +300,20 @@ class AccessAPI(AccessAPIStub):
             Return requested transaction.
 
         """
+        if self.immutable_cache is not None:
+            cached = self.immutable_cache.get(proto_entities.Transaction, id=id)
+            if cached is not None:
+                return entities.Transaction.from_proto(cached)
         response = await super().get_transaction(id=id)
+        if self.immutable_cache is not None:
+            self.immutable_cache.put(response.transaction, id=id)
         return entities.Transaction.from_proto(response.transaction)
 
     async def get_account(
-        self, *, address: Union[bytes, cadence.Address, str] = b""
+        self,
+        *,
+        address: Union[bytes, cadence.Address, str] = b"",
+        use_cache: bool = True,
     ) -> entities.Account:
         """
         Get an account using its address.
@@ -206,6 +323,10 @@ class AccessAPI(AccessAPIStub):
         address : bytes | cadence.Address | str
             Address of requested account.
             Can be a bytes, cadence.Address or hex str.
+        use_cache : bool
+            Whether the account can be served from the account cache of the client.
+            If False, the account is always fetched (and the cache is updated), for example
+            to read a sequence number that must be current.
 
         Returns
         -------
@@ -214,11 +335,21 @@ class AccessAPI(AccessAPIStub):
 
         """
         address = cadence.Address.convert_to_bytes(address)
+        if self.account_cache is not None and use_cache:
+            account = self.account_cache.get_account(address)
+            if account is not None:
+                return account
         response = await super().get_account(address=address)
-        return entities.Account.from_proto(response.account)
+        account = entities.Account.from_proto(response.account)
+        if self.account_cache is not None:
+            self.account_cache.put_account(address, account)
+        return account
 
     async def get_account_at_latest_block(
-        self, *, address: Union[bytes, cadence.Address, str] = b""
+        self,
+        *,
+        address: Union[bytes, cadence.Address, str] = b"",
+        use_cache: bool = True,
     ) -> entities.Account:
         """
         Get an account by address at the latest sealed block.
@@ -228,6 +359,10 @@ class AccessAPI(AccessAPIStub):
         address : bytes | cadence.Address | str
             Address of requested account.
             Can be a bytes, cadence.Address or hex str.
+        use_cache : bool
+            Whether the account can be served from the account cache of the client.
+            If False, the account is always fetched (and the cache is updated), for example
+            to read a sequence number that must be current.
 
         Returns
         -------
@@ -236,8 +371,15 @@ class AccessAPI(AccessAPIStub):
 
         """
         address = cadence.Address.convert_to_bytes(address)
+        if self.account_cache is not None and use_cache:
+            account = self.account_cache.get_account(address)
+            if account is not None:
+                return account
         response = await super().get_account_at_latest_block(address=address)
-        return entities.Account.from_proto(response.account)
+        account = entities.Account.from_proto(response.account)
+        if self.account_cache is not None:
+            self.account_cache.put_account(address, account)
+        return account
 
     async def get_account_at_block_height(
         self,
@@ -263,10 +405,17 @@ class AccessAPI(AccessAPIStub):
 
         """
         address = cadence.Address.convert_to_bytes(address)
+        if self.account_cache is not None:
+            account = self.account_cache.get_account(address, block_height)
+            if account is not None:
+                return account
         response = await super().get_account_at_block_height(
             address=address, block_height=block_height
         )
-        return entities.Account.from_proto(response.account)
+        account = entities.Account.from_proto(response.account)
+        if self.account_cache is not None:
+            self.account_cache.put_account(address, account, block_height)
+        return account
 
     async def execute_script_at_latest_block(
         self, *, script: bytes = b"", arguments: List[bytes] = []
@@ -399,6 +548,156 @@ class AccessAPI(AccessAPIStub):
         )
         return [entities.EventsResponseResult.from_proto(er) for er in response.results]
 
+    async def scan_events(
+        self,
+        *,
+        type: Union[str, List[str]] = "",
+        start_height: int = 0,
+        end_height: int = 0,
+        chunk_size: int = MaxHeightRange,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[entities.EventsResponseResult]:
+        """
+        Stream the events of one or more types over an arbitrarily large height range.
+        The range is split into chunks the access node accepts, several chunks are fetched concurrently,
+        and the results are yielded one block at a time in height order.
+        Only up to `max_concurrency` chunks are held in memory at once.
+
+        When several event types are given, the types of a chunk are requested concurrently and their events are merged
+        into one result per block, ordered by (transaction_index, event_index).
+
+        Parameters
+        ----------
+        type : str | List[str]
+            Type or list of types of requested events.
+        start_height: int
+            Start of desired range.
+        end_height : int
+            End of desired range, inclusive.
+        chunk_size : int
+            Number of blocks requested in a single call.
+        max_concurrency : int
+            Maximum number of chunks fetched concurrently. Each chunk issues one call per event type.
+
+        Returns
+        -------
+        AsyncIterator[entities.EventsResponseResult]
+            The event results of each block in the range, in height order.
+
+        """
+        types = [type] if isinstance(type, str) else list(type)
+
+        async def fetch_type(
+            t: str, chunk: tuple[int, int]
+        ) -> list[entities.EventsResponseResult]:
+            log.debug(f"Fetching {t} events for heights {chunk[0]}-{chunk[1]}")
+            results = await self.get_events_for_height_range(
+                type=t, start_height=chunk[0], end_height=chunk[1]
+            )
+            return sorted(results, key=lambda r: r.block_height)
+
+        async def fetch_chunk(
+            chunk: tuple[int, int]
+        ) -> list[entities.EventsResponseResult]:
+            results = await asyncio.gather(*(fetch_type(t, chunk) for t in types))
+            return merge_events_response_results(list(results))
+
+        async for results in ordered_fetch(
+            height_chunks(start_height, end_height, chunk_size),
+            fetch_chunk,
+            max_concurrency,
+        ):
+            for result in results:
+                yield result
+
+    async def scan_blocks(
+        self,
+        *,
+        start_height: int = 0,
+        end_height: int = 0,
+        max_concurrency: int = 8,
+        include_collections: bool = False,
+    ) -> AsyncIterator[entities.Block]:
+        """
+        Stream the blocks of a height range.
+        Several blocks are fetched concurrently, and they are yielded in height order.
+        Only up to `max_concurrency` blocks are fetched ahead of the consumer,
+        so a slow consumer stops new blocks from being fetched.
+
+        Parameters
+        ----------
+        start_height: int
+            Start of desired range.
+        end_height : int
+            End of desired range, inclusive.
+        max_concurrency : int
+            Maximum number of blocks fetched concurrently.
+        include_collections : bool
+            Also fetch the collection of every collection guarantee of a block (concurrently),
+            and set them as the `collections` of the block.
+
+        Returns
+        -------
+        AsyncIterator[entities.Block]
+            The blocks of the range, in height order.
+
+        """
+
+        async def fetch_block(height: int) -> entities.Block:
+            block = await self.get_block_by_height(height=height)
+            if include_collections:
+                block.collections = list(
+                    await asyncio.gather(
+                        *(
+                            self.get_collection_by_i_d(id=g.collection_id)
+                            for g in block.collection_guarantees
+                        )
+                    )
+                )
+            return block
+
+        async for block in ordered_fetch(
+            range(start_height, end_height + 1), fetch_block, max_concurrency
+        ):
+            yield block
+
+    def follow_events(
+        self,
+        types: Union[str, List[str]],
+        from_height: int,
+        *,
+        min_interval: float = 0.25,
+        max_interval: float = 2.0,
+    ) -> EventFollower:
+        """
+        Follow events of one or more types from a block height, as new blocks get sealed.
+
+        Parameters
+        ----------
+        types : str | List[str]
+            Type or list of types of requested events.
+        from_height: int
+            First height to get the events of.
+        min_interval : float
+            Time between polls of the latest sealed block while new blocks are arriving.
+        max_interval : float
+            Maximum time between polls of the latest sealed block.
+
+        Returns
+        -------
+        EventFollower
+            Async iterator of event results, one per sealed block. Its `checkpoint` attribute
+            is the last fully processed height.
+
+        """
+        return EventFollower(
+            self,
+            types=types,
+            from_height=from_height,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
     async def get_network_parameters(self) -> entities.GetNetworkParametersResponse:
         """
         Retrieve the network parameters.
@@ -442,6 +741,18 @@ class AccessAPI(AccessAPIStub):
         s = script.code.encode("utf-8")
         a = encode_arguments(script.arguments)
 
+        cache_key = None
+        if self.script_cache is not None and (
+            at_block_id is not None or at_block_height is not None
+        ):
+            cache_key = self.script_cache.key(
+                s, a, block_id=at_block_id, block_height=at_block_height
+            )
+            result = self.script_cache.get(cache_key)
+            if result is not None:
+                log.debug(f"Script result cached")
+                return decode_json(result)
+
         if at_block_id is not None:
             log.debug(f"Executing script at block id {at_block_id.hex()}")
             result = await self.execute_script_at_block_i_d(
@@ -460,9 +771,12 @@ class AccessAPI(AccessAPIStub):
 
         log.debug(f"Script Executed")
 
+        if cache_key is not None and result is not None:
+            self.script_cache.put(cache_key, result)
+
         if result is None or result is None:
             return None
-        cadence_value = json.loads(result, object_hook=cadence_object_hook)
+        cadence_value = decode_json(result)
         return cadence_value
 
     async def ping(self) -> PingResponse:
@@ -535,39 +849,59 @@ class AccessAPI(AccessAPIStub):
         """
         log.debug(f"Sending transaction")
         if tx.reference_block_id is None:
-            tx.reference_block_id = (await self.get_latest_block(is_sealed=False)).id
+            tx.reference_block_id = (
+                await self.get_latest_block_header(is_sealed=False)
+            ).id
 
-        result = await self.send_transaction(transaction=tx.to_signed_grpc())
+        result = await self.send_transaction(
+            transaction=await tx.to_signed_grpc_async()
+        )
         log.info(f"Sent transaction {result.id.hex()}")
         tx_result = await self.get_transaction_result(id=result.id)
         if tx_result.error_message:
-            raise Exception(tx_result.error_message)  # TODO wrap error
+            raise TransactionError(result.id, tx_result.error_message)
 
         if not wait_for_seal:
             return tx_result
 
         log.info(f"Waiting for transaction to seal")
+        tx_result = await self.wait_for_transaction(result.id, timeout=timeout)
 
-        end_time = time.monotonic() + timeout
-        while (
-            TransactionStatus(tx_result.status)
-            is not TransactionStatus.TransactionStatusSealed
-            and time.monotonic() < end_time
-        ):
-            await asyncio.sleep(1)
-            tx_result = await self.get_transaction_result(id=result.id)
+        log.info(f"Got transaction seal")
+        return tx_result
 
-        if (
-            TransactionStatus(tx_result.status)
-            is not TransactionStatus.TransactionStatusSealed
-        ):
-            raise TimeoutError(f"Waiting for transaction {result.id.hex()} to seal")
+    async def wait_for_transaction(
+        self,
+        id: bytes,
+        *,
+        status: TransactionStatus = TransactionStatus.TransactionStatusSealed,
+        timeout: Annotated[float, "seconds"] = 30.0,
+    ) -> entities.TransactionResultResponse:
+        """
+        Wait for a submitted transaction to reach the desired status.
+        The transaction is watched by the shared `transaction_tracker` of the client, instead of being polled by every waiting call.
 
-        if tx_result.error_message:
-            raise Exception(tx_result.error_message)  # TODO wrap error
+        Parameters
+        ----------
+        id: bytes
+            Id of the submitted transaction.
+        status: TransactionStatus
+            Status the transaction needs to reach. Defaults to sealed.
+        timeout: float
+            Time the function should wait for the status
 
-        log.info(f"Got transaction seal")
-        return tx_result
+        Returns
+        -------
+        entities.TransactionResultResponse
+        """
+        try:
+            return await asyncio.wait_for(
+                self.transaction_tracker.watch(id, status), timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Waiting for transaction {id.hex()} to reach {status.name}"
+            )
 
 
 def flow_client(
@@ -1,11 +1,11 @@
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from flow_py_sdk import cadence
 from flow_py_sdk.account_key import AccountKey
-from flow_py_sdk.cadence import cadence_object_hook
+from flow_py_sdk.cadence import decode_json
 from flow_py_sdk.proto.flow import entities, access
 
 
@@ -114,6 +114,7 @@ class Block(object):
         collection_guarantees: List[CollectionGuarantee],
         block_seals: List[BlockSeal],
         signatures: List[bytes],
+        collections: Optional[List[Collection]] = None,
     ) -> None:
         self.id: bytes = id
         self.parent_id: bytes = parent_id
@@ -122,6 +123,8 @@ class Block(object):
         self.collection_guarantees: List[CollectionGuarantee] = collection_guarantees
         self.block_seals: List[BlockSeal] = block_seals
         self.signatures: List[bytes] = signatures
+        # the collections of the guarantees, if they were fetched (see AccessAPI.scan_blocks)
+        self.collections: Optional[List[Collection]] = collections
 
     @classmethod
     def from_proto(cls, proto: entities.Block) -> "Block":
@@ -136,6 +139,10 @@ class Block(object):
         )
 
 
+# marks an event payload that was not decoded yet
+_not_decoded = object()
+
+
 class Event(object):
     def __init__(
         self,
@@ -150,20 +157,34 @@ class Event(object):
         self.transaction_index: int = transaction_index
         self.event_index: int = event_index
         self.payload: bytes = payload
+        self._value: Any = _not_decoded
+
+    @property
+    def value(self) -> cadence.Event:
+        """The decoded payload of the event.
 
+        The payload is only decoded when the value is first accessed, and the result is cached.
+        """
+        if self._value is _not_decoded:
+            self._value = self._decode_payload()
+        return self._value
+
+    @value.setter
+    def value(self, value: cadence.Event) -> None:
+        self._value = value
+
+    def _decode_payload(self) -> cadence.Event:
         try:
             # Attempt to decode the payload
-            self.value: cadence.Event = json.loads(
-                payload, object_hook=cadence_object_hook
-            )
+            return decode_json(self.payload)
         except json.JSONDecodeError as e:
             logging.error(
-                f"JSON decode error for event {event_index} with payload: {payload[:100]}... Error: {str(e)}"
+                f"JSON decode error for event {self.event_index} with payload: {self.payload[:100]}... Error: {str(e)}"
             )
             raise
         except Exception as e:
             logging.error(
-                f"Unexpected error deserializing payload for event {event_index} with payload: {payload[:100]}... Error: {str(e)}"
+                f"Unexpected error deserializing payload for event {self.event_index} with payload: {self.payload[:100]}... Error: {str(e)}"
             )
             raise
 
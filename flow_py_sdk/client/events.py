@@ -0,0 +1,128 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING, AsyncIterator, Union
+
+from flow_py_sdk.client import entities
+from flow_py_sdk.client.ranges import MaxHeightRange
+
+if TYPE_CHECKING:
+    from flow_py_sdk.client.client import AccessAPI
+
+log = logging.getLogger(__name__)
+
+
+def _event_order(event: entities.Event) -> tuple[int, int]:
+    return event.transaction_index, event.event_index
+
+
+def merge_events_response_results(
+    results: list[list[entities.EventsResponseResult]],
+) -> list[entities.EventsResponseResult]:
+    """Merge the results of several event queries over the same blocks into one result per block.
+
+    Each input list has to be in height order, with the events of each block in
+    (transaction_index, event_index) order, as returned by the access node.
+    The lists are merged, not sorted, so merging is linear in the number of events.
+
+    Parameters
+    ----------
+    results : list[list[entities.EventsResponseResult]]
+        The results of each query.
+
+    Returns
+    -------
+    list[entities.EventsResponseResult]
+        One result per block in height order, with the events of all queries
+        in (transaction_index, event_index) order.
+    """
+    if len(results) == 1:
+        return results[0]
+
+    merged = []
+    by_height = heapq.merge(*results, key=lambda r: r.block_height)
+    for _, block_results in itertools.groupby(by_height, key=lambda r: r.block_height):
+        block_results = list(block_results)
+        first = block_results[0]
+        merged.append(
+            entities.EventsResponseResult(
+                block_id=first.block_id,
+                block_height=first.block_height,
+                events=list(
+                    heapq.merge(*(r.events for r in block_results), key=_event_order)
+                ),
+                block_timestamp=first.block_timestamp,
+            )
+        )
+    return merged
+
+
+class EventFollower(object):
+    """Follows the events of one or more types as new blocks get sealed
+
+    The follower is an async iterator that yields one EventsResponseResult per sealed block,
+    starting at `from_height`, and then keeps waiting for new sealed blocks. Blocks that are
+    already sealed are fetched with `AccessAPI.scan_events`, so catching up on a large
+    backlog is done in chunks.
+
+    The latest sealed block header is polled every `min_interval` seconds while new blocks
+    are arriving, backing off up to `max_interval` seconds while the chain doesn't move.
+
+    Attributes
+    ----------
+    client : AccessAPI
+        The client used to query the chain.
+    types : list[str]
+        The followed event types.
+    checkpoint : int
+        Height of the last block that was fully processed. A block counts as processed once the
+        consumer asks for the next one. Persist it and pass `checkpoint + 1` as `from_height`
+        to resume after a restart without gaps or duplicates.
+    """
+
+    def __init__(
+        self,
+        client: "AccessAPI",
+        *,
+        types: Union[str, list[str]],
+        from_height: int,
+        min_interval: float = 0.25,
+        max_interval: float = 2.0,
+        chunk_size: int = MaxHeightRange,
+        max_concurrency: int = 4,
+    ) -> None:
+        super().__init__()
+        self.client: "AccessAPI" = client
+        self.types: list[str] = [types] if isinstance(types, str) else list(types)
+        self.checkpoint: int = from_height - 1
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.chunk_size: int = chunk_size
+        self.max_concurrency: int = max_concurrency
+
+    def __aiter__(self) -> AsyncIterator[entities.EventsResponseResult]:
+        return self._follow()
+
+    async def _follow(self) -> AsyncIterator[entities.EventsResponseResult]:
+        interval = self.min_interval
+        while True:
+            head = await self.client.get_latest_block_header(is_sealed=True)
+            if head.height <= self.checkpoint:
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, self.max_interval)
+                continue
+
+            interval = self.min_interval
+            log.debug(f"Following events from {self.checkpoint + 1} to {head.height}")
+            async for result in self.client.scan_events(
+                type=self.types,
+                start_height=self.checkpoint + 1,
+                end_height=head.height,
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+            ):
+                yield result
+                self.checkpoint = result.block_height
+            # blocks without any results are processed as well
+            self.checkpoint = head.height
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from typing import Optional, Union
+
+from flow_py_sdk.cadence import Address
+from flow_py_sdk.client.client import AccessAPI
+from flow_py_sdk.exceptions import PySDKError
+from flow_py_sdk.signer import AsyncSigner, Signer
+from flow_py_sdk.tx import ProposalKey, TransactionStatus
+
+log = logging.getLogger(__name__)
+
+
+class ProposerKeyLease(object):
+    """A proposal key leased from a ProposerKeyPool
+
+    Attributes
+    ----------
+    address : Address
+        Address of the account the key belongs to.
+    key_id : int
+        Index of the leased account key.
+    signer : Signer | AsyncSigner
+        Signer of the leased account key.
+    sequence_number : int
+        Sequence number the transaction using this lease has to use.
+    """
+
+    def __init__(
+        self,
+        *,
+        address: Address,
+        key_id: int,
+        signer: Union[Signer, AsyncSigner],
+        sequence_number: int,
+    ) -> None:
+        super().__init__()
+        self.address: Address = address
+        self.key_id: int = key_id
+        self.signer: Union[Signer, AsyncSigner] = signer
+        self.sequence_number: int = sequence_number
+
+    def proposal_key(self) -> ProposalKey:
+        return ProposalKey(
+            key_address=self.address,
+            key_id=self.key_id,
+            key_sequence_number=self.sequence_number,
+        )
+
+
+class ProposerKeyPool(object):
+    """The ProposerKeyPool rotates transactions across multiple proposal keys of one account
+
+    Flow processes transactions with the same proposal key one after another, so using N keys
+    of a single account allows N transactions to be in flight at the same time.
+    Each key is leased to one transaction at a time and returned to the pool once that transaction
+    reaches `release_status`. Sequence numbers are tracked in memory and are fetched from the chain
+    on first use, or after a key has been invalidated.
+
+    Attributes
+    ----------
+    client : AccessAPI
+        The client used to fetch the sequence numbers of the keys.
+    address : Address
+        Address of the account the keys belong to.
+    release_status : TransactionStatus
+        Status a transaction needs to reach before its key can be used again.
+    """
+
+    def __init__(
+        self,
+        client: AccessAPI,
+        *,
+        address: Address,
+        keys: list[tuple[int, Union[Signer, AsyncSigner]]],
+        release_status: TransactionStatus = TransactionStatus.TransactionStatusFinalized,
+    ) -> None:
+        super().__init__()
+        if not keys:
+            raise PySDKError("A proposer key pool needs at least one key")
+        self.client: AccessAPI = client
+        self.address: Address = address
+        self.release_status: TransactionStatus = release_status
+        self._signers: dict[int, Union[Signer, AsyncSigner]] = dict(keys)
+        # None marks a sequence number that needs to be fetched from the chain
+        self._sequence_numbers: dict[int, Optional[int]] = {
+            key_id: None for key_id in self._signers
+        }
+        self._free: Optional[asyncio.Queue] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __len__(self) -> int:
+        return len(self._signers)
+
+    @property
+    def key_ids(self) -> list[int]:
+        return list(self._signers)
+
+    async def lease(self) -> ProposerKeyLease:
+        """Lease a free key, waiting until one is returned if all keys are in use.
+
+        Returns
+        -------
+        ProposerKeyLease
+            The leased key with the sequence number to use.
+        """
+        key_id = await self._get_free().get()
+        try:
+            if self._sequence_numbers[key_id] is None:
+                await self._sync()
+        except BaseException:
+            self._get_free().put_nowait(key_id)
+            raise
+
+        return ProposerKeyLease(
+            address=self.address,
+            key_id=key_id,
+            signer=self._signers[key_id],
+            sequence_number=self._sequence_numbers[key_id],
+        )
+
+    def release(self, lease: ProposerKeyLease, *, used: bool = True) -> None:
+        """Return a leased key to the pool.
+
+        Parameters
+        ----------
+        lease : ProposerKeyLease
+            The lease to return.
+        used : bool
+            Whether the transaction using the lease consumed its sequence number.
+        """
+        if self._sequence_numbers[lease.key_id] is not None:
+            self._sequence_numbers[lease.key_id] = lease.sequence_number + (
+                1 if used else 0
+            )
+        self._get_free().put_nowait(lease.key_id)
+
+    def invalidate(self, key_id: int) -> None:
+        """Mark the sequence number of a key as unknown, so that it is fetched from the chain on its next lease.
+
+        Parameters
+        ----------
+        key_id : int
+            Index of the account key.
+        """
+        self._sequence_numbers[key_id] = None
+
+    async def _sync(self) -> None:
+        async with self._get_lock():
+            if all(n is not None for n in self._sequence_numbers.values()):
+                return
+
+            account = await self.client.get_account_at_latest_block(
+                address=self.address.bytes, use_cache=False
+            )
+            account_keys = {k.index: k for k in account.keys}
+            for key_id, sequence_number in self._sequence_numbers.items():
+                if sequence_number is not None:
+                    continue
+                key = account_keys.get(key_id)
+                if key is None:
+                    raise PySDKError(
+                        f"Account {self.address} does not have a key with index {key_id}"
+                    )
+                if key.revoked:
+                    raise PySDKError(
+                        f"Key {key_id} of account {self.address} is revoked"
+                    )
+                log.debug(
+                    f"Synced key {key_id} of account {self.address} to sequence number {key.sequence_number}"
+                )
+                self._sequence_numbers[key_id] = key.sequence_number
+
+    def _get_free(self) -> asyncio.Queue:
+        # created lazily, so that the queue belongs to the running event loop
+        if self._free is None:
+            self._free = asyncio.Queue()
+            for key_id in self._signers:
+                self._free.put_nowait(key_id)
+        return self._free
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
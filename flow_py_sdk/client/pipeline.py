@@ -0,0 +1,348 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Annotated,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Optional,
+    Union,
+)
+
+from flow_py_sdk.cadence import Address
+from flow_py_sdk.client import entities
+from flow_py_sdk.client.client import AccessAPI
+from flow_py_sdk.client.key_pool import ProposerKeyPool
+from flow_py_sdk.client.single_flight import SingleFlight
+from flow_py_sdk.exceptions import PySDKError, TransactionError
+from flow_py_sdk.signer import AsyncSigner, Signer
+from flow_py_sdk.tx import Tx, ProposalKey, TransactionStatus
+
+log = logging.getLogger(__name__)
+
+# Error code of a transaction whose proposal key sequence number does not match the on-chain one.
+# See: https://github.com/onflow/flow-go/blob/master/fvm/errors/codes.go
+InvalidProposalSeqNumberErrorCode = 1007
+
+
+def _is_sequence_number_mismatch(error: Exception) -> bool:
+    return (
+        isinstance(error, TransactionError)
+        and f"[Error Code: {InvalidProposalSeqNumberErrorCode}]" in error.error_message
+    )
+
+
+async def _aiter(items: Union[Iterable[Tx], AsyncIterable[Tx]]) -> AsyncIterator[Tx]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class SubmissionResult(object):
+    """The outcome of a single transaction submitted through a TransactionPipeline
+
+    Attributes
+    ----------
+    tx : Tx
+        The submitted transaction.
+    result : Optional[entities.TransactionResultResponse]
+        The transaction result, if the transaction reached the desired status.
+    error : Optional[Exception]
+        The error that stopped the transaction, if any.
+    """
+
+    def __init__(
+        self,
+        tx: Tx,
+        result: Optional[entities.TransactionResultResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.tx: Tx = tx
+        self.result: Optional[entities.TransactionResultResponse] = result
+        self.error: Optional[Exception] = error
+
+
+class TransactionPipeline(object):
+    """The TransactionPipeline submits a stream of transactions concurrently
+
+    The pipeline takes over the proposer role of every transaction it submits: any proposal key already
+    set on a transaction is replaced and the proposer signature is added by the pipeline. If a transaction
+    has no payer, the proposer also pays for it.
+
+    Proposal key sequence numbers are assigned locally, starting from the on-chain sequence number,
+    which is fetched once. Transactions are signed and sent one after another, so that the access node
+    receives them in sequence number order, while waiting for their results happens concurrently.
+    If a transaction fails with a sequence number mismatch, the sequence number is re-synced from the
+    chain and the transaction is submitted again.
+
+    Instead of a single proposal key, a ProposerKeyPool can be given. Each transaction then leases
+    a key from the pool for as long as it is in flight.
+
+    Transactions without a reference block share the ID of the latest block header, which is fetched
+    again once it is older than `reference_block_ttl`.
+
+    Attributes
+    ----------
+    client : AccessAPI
+        The client used to send transactions.
+    proposer : Optional[Address]
+        Address of the proposer account.
+    key_id : Optional[int]
+        Index of the proposer account key used as the proposal key.
+    signer : Optional[Signer | AsyncSigner]
+        Signer of the proposal key.
+    key_pool : Optional[ProposerKeyPool]
+        Pool of proposal keys to use instead of `proposer`, `key_id` and `signer`.
+    max_in_flight : int
+        Maximum number of transactions that are waiting for their result at the same time.
+    status : TransactionStatus
+        Status a transaction needs to reach for the pipeline to yield its result.
+    timeout : float
+        Time to wait for each transaction to reach `status`.
+    max_resubmits : int
+        How many times a transaction is re-submitted after a sequence number mismatch.
+    reference_block_ttl : float
+        Time for which the fetched reference block ID is used for new transactions.
+        Transactions expire 600 blocks (about 10 minutes) after their reference block.
+    """
+
+    def __init__(
+        self,
+        client: AccessAPI,
+        *,
+        proposer: Optional[Address] = None,
+        key_id: Optional[int] = None,
+        signer: Optional[Union[Signer, AsyncSigner]] = None,
+        key_pool: Optional[ProposerKeyPool] = None,
+        max_in_flight: int = 10,
+        status: TransactionStatus = TransactionStatus.TransactionStatusSealed,
+        timeout: Annotated[float, "seconds"] = 30.0,
+        max_resubmits: int = 3,
+        reference_block_ttl: Annotated[float, "seconds"] = 10.0,
+    ) -> None:
+        super().__init__()
+        if key_pool is None and (proposer is None or key_id is None or signer is None):
+            raise PySDKError(
+                "The pipeline needs either a key_pool, or a proposer, key_id and signer"
+            )
+        self.client: AccessAPI = client
+        self.proposer: Optional[Address] = proposer
+        self.key_id: Optional[int] = key_id
+        self.signer: Optional[Union[Signer, AsyncSigner]] = signer
+        self.key_pool: Optional[ProposerKeyPool] = key_pool
+        self.max_in_flight: int = max_in_flight
+        self.status: TransactionStatus = status
+        self.timeout: float = timeout
+        self.max_resubmits: int = max_resubmits
+        self.reference_block_ttl: float = reference_block_ttl
+
+        # (expires at, ID) of the reference block used for new transactions
+        self._reference_block: Optional[tuple[float, bytes]] = None
+        self._reference_block_fetch: SingleFlight = SingleFlight()
+        self._sequence_number: Optional[int] = None
+        # incremented every time the sequence number is re-synced from the chain
+        self._generation: int = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def submit(
+        self, transactions: Union[Iterable[Tx], AsyncIterable[Tx]]
+    ) -> AsyncIterator[SubmissionResult]:
+        """Submit transactions and yield their results in the order they complete.
+
+        New transactions are taken from `transactions` only while fewer than `max_in_flight`
+        transactions are waiting for their results.
+
+        Parameters
+        ----------
+        transactions : Iterable[Tx] | AsyncIterable[Tx]
+            The transactions to submit.
+
+        Returns
+        -------
+        AsyncIterator[SubmissionResult]
+            A result for every submitted transaction.
+        """
+        source = _aiter(transactions)
+        pending: set[asyncio.Future] = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    try:
+                        tx = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(self._run(tx)))
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _run(self, tx: Tx) -> SubmissionResult:
+        attempt = 0
+        while True:
+            try:
+                # fetched before taking a key or the lock, so that sending is not held up by it
+                if tx.reference_block_id is None:
+                    tx.reference_block_id = await self._reference_block_id()
+                if self.key_pool is None:
+                    result = await self._execute_sequenced(tx)
+                else:
+                    result = await self._execute_leased(tx)
+                return SubmissionResult(tx, result=result)
+            except Exception as e:
+                if not _is_sequence_number_mismatch(e) or attempt >= self.max_resubmits:
+                    return SubmissionResult(tx, error=e)
+                log.info(
+                    f"Sequence number mismatch for transaction {e.transaction_id.hex()}, re-submitting"
+                )
+                attempt += 1
+
+    async def _execute_sequenced(self, tx: Tx) -> entities.TransactionResultResponse:
+        async with self._get_lock():
+            if self._sequence_number is None:
+                await self._sync()
+            generation = self._generation
+            self._prepare(
+                tx,
+                ProposalKey(
+                    key_address=self.proposer,
+                    key_id=self.key_id,
+                    key_sequence_number=self._sequence_number,
+                ),
+                self.signer,
+            )
+            tx_id = await self._send(tx)
+            self._sequence_number += 1
+
+        try:
+            return await self.client.wait_for_transaction(
+                tx_id, status=self.status, timeout=self.timeout
+            )
+        except TransactionError as e:
+            if _is_sequence_number_mismatch(e):
+                await self._resync(generation)
+            raise
+
+    async def _execute_leased(self, tx: Tx) -> entities.TransactionResultResponse:
+        lease = await self.key_pool.lease()
+        release_status = min(
+            self.status, self.key_pool.release_status, key=lambda s: s.value
+        )
+        sent = False
+        try:
+            self._prepare(tx, lease.proposal_key(), lease.signer)
+            tx_id = await self._send(tx)
+            sent = True
+            result = await self.client.wait_for_transaction(
+                tx_id, status=release_status, timeout=self.timeout
+            )
+        except Exception:
+            # the sequence number of a sent transaction might or might not have been used
+            if sent:
+                self.key_pool.invalidate(lease.key_id)
+            self.key_pool.release(lease, used=sent)
+            raise
+        self.key_pool.release(lease)
+
+        if release_status is self.status:
+            return result
+        try:
+            return await self.client.wait_for_transaction(
+                tx_id, status=self.status, timeout=self.timeout
+            )
+        except TransactionError as e:
+            if _is_sequence_number_mismatch(e):
+                self.key_pool.invalidate(lease.key_id)
+            raise
+
+    async def _reference_block_id(self) -> bytes:
+        if (
+            self._reference_block is not None
+            and self._reference_block[0] > time.monotonic()
+        ):
+            return self._reference_block[1]
+        return await self._reference_block_fetch.do(
+            None, self._fetch_reference_block_id
+        )
+
+    async def _fetch_reference_block_id(self) -> bytes:
+        header = await self.client.get_latest_block_header(is_sealed=False)
+        self._reference_block = (time.monotonic() + self.reference_block_ttl, header.id)
+        return header.id
+
+    async def _send(self, tx: Tx) -> bytes:
+        response = await self.client.send_transaction(
+            transaction=await tx.to_signed_grpc_async()
+        )
+        log.debug(
+            f"Sent transaction {response.id.hex()} with sequence number {tx.proposal_key.key_sequence_number}"
+        )
+        return response.id
+
+    async def _resync(self, generation: int) -> None:
+        async with self._get_lock():
+            # another transaction might have already re-synced the sequence number
+            if generation == self._generation:
+                await self._sync()
+
+    async def _sync(self) -> None:
+        account = await self.client.get_account_at_latest_block(
+            address=self.proposer.bytes, use_cache=False
+        )
+        key = next((k for k in account.keys if k.index == self.key_id), None)
+        if key is None:
+            raise PySDKError(
+                f"Account {self.proposer} does not have a key with index {self.key_id}"
+            )
+        self._sequence_number = key.sequence_number
+        self._generation += 1
+
+    def _prepare(
+        self, tx: Tx, proposal_key: ProposalKey, signer: Union[Signer, AsyncSigner]
+    ) -> None:
+        # a re-submitted transaction needs to be signed again, possibly with another key
+        managed_key_ids = (
+            [self.key_id] if self.key_pool is None else self.key_pool.key_ids
+        )
+
+        def is_managed(s) -> bool:
+            return s.address == proposal_key.key_address and s.key_id in managed_key_ids
+
+        tx.payload_signatures = []
+        tx.envelope_signatures = []
+        tx.payload_signers = [s for s in tx.payload_signers if not is_managed(s)]
+        tx.envelope_signers = [s for s in tx.envelope_signers if not is_managed(s)]
+
+        tx.with_proposal_key(proposal_key)
+        if tx.payer is None:
+            tx.with_payer(proposal_key.key_address)
+
+        # the proposer only signs the envelope if it is also the payer
+        if tx.payer == proposal_key.key_address:
+            tx.with_envelope_signature(
+                proposal_key.key_address, proposal_key.key_id, signer
+            )
+        else:
+            tx.with_payload_signature(
+                proposal_key.key_address, proposal_key.key_id, signer
+            )
+
+    def _get_lock(self) -> asyncio.Lock:
+        # created lazily, so that the lock belongs to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
@@ -0,0 +1,519 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from types import TracebackType
+from typing import Annotated, Optional, Type, Union
+
+from grpclib.client import Channel, Stream
+from grpclib.config import Configuration
+from grpclib.const import Cardinality, Status
+from grpclib.encoding.base import CodecBase, StatusDetailsCodecBase
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+from grpclib.metadata import Deadline
+
+from flow_py_sdk.client.client import AccessAPI, _non_idempotent_routes
+
+log = logging.getLogger(__name__)
+
+# Statuses that say something about the health of the endpoint, rather than about the request.
+_endpoint_error_statuses = frozenset(
+    [
+        Status.UNAVAILABLE,
+        Status.DEADLINE_EXCEEDED,
+        Status.RESOURCE_EXHAUSTED,
+        Status.INTERNAL,
+        Status.UNKNOWN,
+    ]
+)
+
+
+# Latency assumed for endpoints without a measured latency, when no endpoint has been measured yet.
+_default_latency = 0.1
+
+
+def _is_endpoint_error(error: BaseException) -> bool:
+    if isinstance(error, GRPCError):
+        return error.status in _endpoint_error_statuses
+    return isinstance(
+        error, (OSError, StreamTerminatedError, asyncio.TimeoutError, ConnectionError)
+    )
+
+
+class Endpoint(object):
+    """An access node endpoint of a ChannelPool, and the health observed for it
+
+    Attributes
+    ----------
+    host : str
+        Host of the access node.
+    port : int
+        Port of the access node.
+    channel : Channel
+        The channel to the access node.
+    latency : Optional[float]
+        Exponentially weighted moving average of the latency of successful unary calls,
+        or None if no call completed yet.
+    error_rate : float
+        Exponentially weighted moving average of the fraction of calls that failed
+        because of the endpoint (connection errors, unavailable, deadline exceeded, ...).
+    failures : int
+        Number of consecutive failed calls.
+    in_flight : int
+        Number of calls in progress.
+    ejected_until : float
+        `time.monotonic()` until which the endpoint is not used, unless all endpoints are ejected.
+    """
+
+    def __init__(self, host: str, port: int, channel: Channel) -> None:
+        super().__init__()
+        self.host: str = host
+        self.port: int = port
+        self.channel: Channel = channel
+        self.latency: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.failures: int = 0
+        self.in_flight: int = 0
+        self.ejected_until: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.host}:{self.port})"
+
+    def score(self, unmeasured_latency: float = _default_latency) -> float:
+        """Expected cost of sending a call to this endpoint; lower is better.
+
+        An endpoint without measured latency scores 0 while it has no call in flight,
+        so every endpoint gets probed, one call at a time. While the probe is in flight,
+        `unmeasured_latency` stands in for the latency of the endpoint.
+        """
+        latency = self.latency
+        if latency is None:
+            if self.in_flight == 0:
+                return 0.0
+            latency = unmeasured_latency
+        return latency * (1 + self.in_flight) / max(1.0 - self.error_rate, 0.01)
+
+
+class _PooledStream(object):
+    # Wraps the stream of a call, to measure it.
+
+    def __init__(
+        self,
+        pool: "ChannelPool",
+        endpoint: Endpoint,
+        stream: Stream,
+        cardinality: Cardinality,
+    ) -> None:
+        self._pool = pool
+        self._endpoint = endpoint
+        self._stream = stream
+        self._cardinality = cardinality
+        self._start = 0.0
+
+    async def __aenter__(self) -> Stream:
+        self._start = time.monotonic()
+        self._endpoint.in_flight += 1
+        try:
+            return await self._stream.__aenter__()
+        except BaseException as e:
+            self._finish(e)
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Optional[bool]:
+        error = exc_val
+        try:
+            return await self._stream.__aexit__(exc_type, exc_val, exc_tb)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._finish(error)
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        self._endpoint.in_flight -= 1
+        if isinstance(error, asyncio.CancelledError):
+            return
+        # the latency of streaming calls says nothing about the endpoint
+        latency = (
+            time.monotonic() - self._start
+            if self._cardinality is Cardinality.UNARY_UNARY
+            else None
+        )
+        self._pool.record(
+            self._endpoint,
+            latency,
+            error is not None and _is_endpoint_error(error),
+        )
+
+
+class Hedging(object):
+    """Hedging policy of a ChannelPool
+
+    If an idempotent unary call has not answered after a delay, the same request is also sent
+    to another endpoint. The first successful response is used and the other call is cancelled.
+    The delay is the `percentile` of the latencies of the last `window` calls of the same method,
+    so only the slowest calls get hedged.
+
+    To hedge the calls of a pool, set its hedging policy:
+    `pool.hedging = Hedging()`
+
+    Attributes
+    ----------
+    percentile : float
+        Percentile of the recent latencies after which a call is hedged.
+    window : int
+        Number of recent latencies kept per method.
+    min_samples : int
+        Number of latencies of a method needed before the percentile is used.
+    default_delay : float
+        Delay used while there are fewer than `min_samples` latencies.
+    requests : int
+        Number of calls that could be hedged.
+    hedged : int
+        Number of calls for which a second request was sent.
+    hedge_wins : int
+        Number of calls answered by the second request.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        *,
+        window: int = 256,
+        min_samples: int = 16,
+        default_delay: Annotated[float, "seconds"] = 0.1,
+    ) -> None:
+        super().__init__()
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        self.percentile: float = percentile
+        self.window: int = window
+        self.min_samples: int = min_samples
+        self.default_delay: float = default_delay
+        self.requests: int = 0
+        self.hedged: int = 0
+        self.hedge_wins: int = 0
+        self._latencies: dict[str, deque[float]] = {}
+
+    def delay(self, route: str) -> float:
+        """Time after which a call of `route` is hedged."""
+        latencies = self._latencies.get(route)
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.default_delay
+        ordered = sorted(latencies)
+        return ordered[int(self.percentile * (len(ordered) - 1))]
+
+    def record(self, route: str, latency: float) -> None:
+        """Add the latency of a successful call of `route`."""
+        latencies = self._latencies.get(route)
+        if latencies is None:
+            latencies = self._latencies[route] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+
+class _HedgedStream(object):
+    # Stands in for the stream of a unary call, which betterproto only uses to send
+    # a single request and receive a single response.
+
+    def __init__(
+        self, pool: "ChannelPool", name: str, request_type, reply_type, kwargs
+    ) -> None:
+        self._pool = pool
+        self._name = name
+        self._request_type = request_type
+        self._reply_type = reply_type
+        self._kwargs = kwargs
+        self._request = None
+
+    async def __aenter__(self) -> "_HedgedStream":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        return None
+
+    async def send_message(self, message, *, end: bool = False) -> None:
+        self._request = message
+
+    async def recv_message(self):
+        return await self._pool._hedged_call(
+            self._name,
+            self._request_type,
+            self._reply_type,
+            self._request,
+            self._kwargs,
+        )
+
+
+class ChannelPool(object):
+    """Channels to several access nodes, used as the channel of an AccessAPI
+
+    Every call is routed to the endpoint with the lowest score (see `Endpoint.score`),
+    which combines the moving averages of its latency and error rate, and its calls in flight.
+    After `max_failures` consecutive failures an endpoint is ejected for `cooldown` seconds.
+    If all endpoints are ejected, the one that will come back first is used.
+
+    Calls are not retried on another endpoint; a failed call raises as it would with a single channel.
+    Slow idempotent calls can be hedged by setting `hedging` (see `Hedging`).
+
+    Parameters
+    ----------
+    endpoints : list[tuple[str, int]]
+        Host and port of every access node.
+    alpha : float
+        Weight of the newest observation in the moving averages.
+    max_failures : int
+        Consecutive failures after which an endpoint is ejected.
+    cooldown : float
+        Time for which an ejected endpoint is not used.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[tuple[str, int]],
+        *,
+        alpha: float = 0.3,
+        max_failures: int = 3,
+        cooldown: Annotated[float, "seconds"] = 30.0,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        codec: Optional[CodecBase] = None,
+        status_details_codec: Optional[StatusDetailsCodecBase] = None,
+        ssl=None,
+        config: Optional[Configuration] = None,
+    ) -> None:
+        super().__init__()
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha: float = alpha
+        self.max_failures: int = max_failures
+        self.cooldown: float = cooldown
+        self.hedging: Optional[Hedging] = None
+        self.endpoints: list[Endpoint] = [
+            Endpoint(
+                host,
+                port,
+                Channel(
+                    host=host,
+                    port=port,
+                    loop=loop,
+                    codec=codec,
+                    status_details_codec=status_details_codec,
+                    ssl=ssl,
+                    config=config,
+                ),
+            )
+            for host, port in endpoints
+        ]
+
+    def select(self, exclude: Optional[Endpoint] = None) -> Optional[Endpoint]:
+        """The endpoint the next call will be sent to.
+
+        If `exclude` is given, the best other endpoint that is not ejected, or None if there is none.
+        """
+        now = time.monotonic()
+        available = [
+            e for e in self.endpoints if e.ejected_until <= now and e is not exclude
+        ]
+        if not available:
+            if exclude is not None:
+                return None
+            return min(self.endpoints, key=lambda e: e.ejected_until)
+        # endpoints that are not measured yet (or again, after a cooldown) are assumed to be average
+        measured = [e.latency for e in self.endpoints if e.latency is not None]
+        unmeasured_latency = (
+            sum(measured) / len(measured) if measured else _default_latency
+        )
+        return min(available, key=lambda e: e.score(unmeasured_latency))
+
+    def request(
+        self,
+        name: str,
+        cardinality: Cardinality,
+        request_type,
+        reply_type,
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+        metadata=None,
+    ) -> Union[_PooledStream, _HedgedStream]:
+        if (
+            self.hedging is not None
+            and cardinality is Cardinality.UNARY_UNARY
+            and name not in _non_idempotent_routes
+        ):
+            return _HedgedStream(
+                self,
+                name,
+                request_type,
+                reply_type,
+                dict(timeout=timeout, deadline=deadline, metadata=metadata),
+            )
+        endpoint = self.select()
+        stream = endpoint.channel.request(
+            name,
+            cardinality,
+            request_type,
+            reply_type,
+            timeout=timeout,
+            deadline=deadline,
+            metadata=metadata,
+        )
+        return _PooledStream(self, endpoint, stream, cardinality)
+
+    async def _call(
+        self, endpoint: Endpoint, name: str, request_type, reply_type, request, kwargs
+    ):
+        start = time.monotonic()
+        stream = endpoint.channel.request(
+            name, Cardinality.UNARY_UNARY, request_type, reply_type, **kwargs
+        )
+        async with _PooledStream(
+            self, endpoint, stream, Cardinality.UNARY_UNARY
+        ) as stream:
+            await stream.send_message(request, end=True)
+            reply = await stream.recv_message()
+        self.hedging.record(name, time.monotonic() - start)
+        return reply
+
+    async def _hedged_call(self, name: str, request_type, reply_type, request, kwargs):
+        hedging = self.hedging
+        hedging.requests += 1
+        first = self.select()
+        calls = [
+            asyncio.ensure_future(
+                self._call(first, name, request_type, reply_type, request, kwargs)
+            )
+        ]
+        try:
+            done, _ = await asyncio.wait(calls, timeout=hedging.delay(name))
+            if not done:
+                second = self.select(exclude=first)
+                if second is not None:
+                    log.debug(f"Hedging {name} on {second}")
+                    hedging.hedged += 1
+                    calls.append(
+                        asyncio.ensure_future(
+                            self._call(
+                                second, name, request_type, reply_type, request, kwargs
+                            )
+                        )
+                    )
+
+            # the first successful response wins, errors are raised only if all calls fail
+            error = None
+            pending = set(calls)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for call in done:
+                    if call.exception() is not None:
+                        error = error or call.exception()
+                for call in done:
+                    if call.exception() is None:
+                        if call is not calls[0]:
+                            hedging.hedge_wins += 1
+                        return call.result()
+            raise error
+        finally:
+            for call in calls:
+                call.cancel()
+            # wait for the losing call to finish cancelling, so its endpoint no longer counts it as in flight
+            await asyncio.gather(*calls, return_exceptions=True)
+
+    def record(
+        self, endpoint: Endpoint, latency: Optional[float], failed: bool
+    ) -> None:
+        """Update the health of an endpoint with the outcome of a call.
+
+        Parameters
+        ----------
+        endpoint : Endpoint
+            The endpoint the call was sent to.
+        latency : Optional[float]
+            Duration of the call, if it was a unary call.
+        failed : bool
+            Whether the call failed because of the endpoint.
+        """
+        endpoint.error_rate += self.alpha * (float(failed) - endpoint.error_rate)
+        if failed:
+            endpoint.failures += 1
+            if endpoint.failures >= self.max_failures:
+                log.warning(
+                    f"Ejecting {endpoint} for {self.cooldown}s after {endpoint.failures} failures"
+                )
+                endpoint.ejected_until = time.monotonic() + self.cooldown
+                # start over after the cooldown, so the endpoint gets probed again
+                endpoint.failures = 0
+                endpoint.error_rate = 0.0
+                endpoint.latency = None
+            return
+
+        endpoint.failures = 0
+        if latency is not None:
+            endpoint.latency = (
+                latency
+                if endpoint.latency is None
+                else endpoint.latency + self.alpha * (latency - endpoint.latency)
+            )
+
+    def close(self) -> None:
+        for endpoint in self.endpoints:
+            endpoint.channel.close()
+
+
+def pooled_flow_client(
+    endpoints: list[tuple[str, int]],
+    *,
+    alpha: float = 0.3,
+    max_failures: int = 3,
+    cooldown: Annotated[float, "seconds"] = 30.0,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    codec: Optional[CodecBase] = None,
+    status_details_codec: Optional[StatusDetailsCodecBase] = None,
+    ssl=None,
+    config: Optional[Configuration] = None,
+    timeout: Optional[float] = None,
+    deadline: Optional["Deadline"] = None,
+    metadata=None,
+) -> AccessAPI:
+    """Create a client that balances its calls between several access nodes.
+
+    The client has the same methods as the one created by `flow_client`.
+    See `ChannelPool` for how calls are routed; the pool is the `channel` of the returned client.
+
+    Parameters
+    ----------
+    endpoints : list[tuple[str, int]]
+        Host and port of every access node.
+
+    Returns
+    -------
+    AccessAPI
+        The client.
+    """
+    pool = ChannelPool(
+        endpoints,
+        alpha=alpha,
+        max_failures=max_failures,
+        cooldown=cooldown,
+        loop=loop,
+        codec=codec,
+        status_details_codec=status_details_codec,
+        ssl=ssl,
+        config=config,
+    )
+    return AccessAPI(
+        channel=pool, timeout=timeout, deadline=deadline, metadata=metadata
+    )
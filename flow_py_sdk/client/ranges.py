@@ -0,0 +1,81 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+# Maximum number of blocks the access nodes accept in a single height range query.
+MaxHeightRange = 250
+
+
+def height_chunks(
+    start_height: int, end_height: int, chunk_size: int = MaxHeightRange
+) -> Iterator[tuple[int, int]]:
+    """Split the inclusive height range [start_height, end_height] into inclusive chunks of at most chunk_size blocks.
+
+    Parameters
+    ----------
+    start_height : int
+        Start of the range.
+    end_height : int
+        End of the range, inclusive.
+    chunk_size : int
+        Maximum number of blocks in a chunk.
+
+    Returns
+    -------
+    Iterator[tuple[int, int]]
+        The (start, end) heights of each chunk in ascending order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    for chunk_start in range(start_height, end_height + 1, chunk_size):
+        yield chunk_start, min(chunk_start + chunk_size - 1, end_height)
+
+
+async def ordered_fetch(
+    keys: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    max_concurrency: int,
+) -> AsyncIterator[T]:
+    """Fetch all keys concurrently and yield the results in the order of the keys.
+
+    At most max_concurrency fetches are running or waiting to be consumed at any time,
+    so a slow consumer stops new fetches from being started.
+
+    Parameters
+    ----------
+    keys : Iterable[K]
+        The keys to fetch.
+    fetch : Callable[[K], Awaitable[T]]
+        Fetches a single key.
+    max_concurrency : int
+        Maximum number of fetches ahead of the consumer.
+
+    Returns
+    -------
+    AsyncIterator[T]
+        The fetched results in key order.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    keys = iter(keys)
+    pending: deque[asyncio.Future] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_concurrency:
+                try:
+                    key = next(keys)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append(asyncio.ensure_future(fetch(key)))
+
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+from typing import Annotated, Awaitable, Callable, Optional, TypeVar
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket(object):
+    """Lets calls through at a sustained `rate`, with bursts of up to `burst` calls
+
+    The rate adapts to throttling by the server: every throttled call halves it (down to `min_rate`)
+    and pauses the bucket for `1 / rate`, and every successful call raises it again
+    by `recovery * max_rate`, up to `max_rate`.
+
+    Attributes
+    ----------
+    max_rate : float
+        The configured rate, in calls per second.
+    rate : float
+        The current rate, in calls per second.
+    burst : float
+        Maximum number of calls let through at once.
+    min_rate : float
+        The rate is never reduced below this.
+    recovery : float
+        Fraction of `max_rate` the rate is raised by after each successful call.
+    throttled : int
+        Number of calls that were throttled by the server.
+    """
+
+    def __init__(
+        self,
+        rate: Annotated[float, "calls per second"],
+        *,
+        burst: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        recovery: float = 0.05,
+    ) -> None:
+        super().__init__()
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate: float = rate
+        self.rate: float = rate
+        self.burst: float = burst if burst is not None else max(1.0, rate)
+        self.min_rate: float = min_rate if min_rate is not None else rate / 16
+        self.recovery: float = recovery
+        self.throttled: int = 0
+        self._tokens: float = self.burst
+        self._updated: float = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a call can be made. Waiting calls are let through in order."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def on_success(self) -> None:
+        """Raise the rate after a successful call."""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.recovery * self.max_rate)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Reduce the rate, and pause the bucket, after the server throttled a call.
+
+        Parameters
+        ----------
+        retry_after : Optional[float]
+            Time the server asked to wait before the next call. If None, `1 / rate` (after halving).
+        """
+        self.throttled += 1
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        if retry_after is None:
+            retry_after = 1 / self.rate
+        # negative tokens delay the next call until the pause is over
+        self._tokens = min(self._tokens, 0.0) - retry_after * self.rate
+        log.debug(f"Throttled, reduced the rate to {self.rate:.2f}/s")
+
+
+class MethodLimits(object):
+    """Limits of the calls of one RPC method (see RateLimiter)
+
+    Attributes
+    ----------
+    rate : Optional[float]
+        Sustained calls per second, or None for no rate limit.
+    burst : Optional[float]
+        Maximum number of calls let through at once. Defaults to one second worth of calls.
+    max_in_flight : Optional[int]
+        Maximum number of concurrent calls, or None for no limit.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[Annotated[float, "calls per second"]] = None,
+        *,
+        burst: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.rate: Optional[float] = rate
+        self.burst: Optional[float] = burst
+        self.max_in_flight: Optional[int] = max_in_flight
+
+
+class _MethodLimiter(object):
+    def __init__(self, limits: MethodLimits) -> None:
+        self.bucket: Optional[TokenBucket] = (
+            TokenBucket(limits.rate, burst=limits.burst)
+            if limits.rate is not None
+            else None
+        )
+        self.max_in_flight: Optional[int] = limits.max_in_flight
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        if self.max_in_flight is None:
+            return await self._run(call)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        async with self._semaphore:
+            return await self._run(call)
+
+    async def _run(self, call: Callable[[], Awaitable[T]]) -> T:
+        if self.bucket is None:
+            return await call()
+        await self.bucket.acquire()
+        try:
+            result = await call()
+        except GRPCError as e:
+            if e.status is Status.RESOURCE_EXHAUSTED:
+                self.bucket.on_throttled()
+            raise
+        self.bucket.on_success()
+        return result
+
+
+class RateLimiter(object):
+    """Limits the rate and concurrency of the calls of an AccessAPI, per RPC method
+
+    Calls wait for capacity instead of failing. When the access node throttles a call
+    (RESOURCE_EXHAUSTED), the rate of that method is reduced and then gradually restored
+    (see TokenBucket), so sustained load settles just under the quota of the access node.
+    The throttled call itself still fails.
+
+    To limit the calls of a client, set its rate limiter:
+    `client.rate_limiter = RateLimiter(MethodLimits(50, max_in_flight=10), methods={"GetBlockByHeight": MethodLimits(20)})`
+
+    Parameters
+    ----------
+    default : Optional[MethodLimits]
+        Limits of the methods not in `methods`, applied to each method separately.
+        If None, those methods are not limited.
+    methods : Optional[dict[str, MethodLimits]]
+        Limits by gRPC method name (for example "GetBlockByHeight", "ExecuteScriptAtLatestBlock").
+    """
+
+    def __init__(
+        self,
+        default: Optional[MethodLimits] = None,
+        *,
+        methods: Optional[dict[str, MethodLimits]] = None,
+    ) -> None:
+        super().__init__()
+        self.default: Optional[MethodLimits] = default
+        self.methods: dict[str, MethodLimits] = dict(methods or {})
+        self._limiters: dict[str, Optional[_MethodLimiter]] = {}
+
+    def bucket(self, method: str) -> Optional[TokenBucket]:
+        """The token bucket of a gRPC method, or None if its rate is not limited."""
+        limiter = self._limiter(method)
+        return None if limiter is None else limiter.bucket
+
+    def _limiter(self, method: str) -> Optional[_MethodLimiter]:
+        if method not in self._limiters:
+            limits = self.methods.get(method, self.default)
+            self._limiters[method] = None if limits is None else _MethodLimiter(limits)
+        return self._limiters[method]
+
+    async def run(self, route: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Make a call once the limits of its method allow it.
+
+        Parameters
+        ----------
+        route : str
+            The gRPC route of the call, for example "/flow.access.AccessAPI/GetBlockByHeight".
+        call : Callable[[], Awaitable[T]]
+            Makes the call.
+
+        Returns
+        -------
+        T
+            The result of the call.
+        """
+        limiter = self._limiter(route.rsplit("/", 1)[-1])
+        if limiter is None:
+            return await call()
+        return await limiter.run(call)
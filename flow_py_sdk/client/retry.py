@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import random
+from typing import Annotated, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+from grpclib.metadata import Deadline
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RetryPolicy(object):
+    """Retries the calls of an AccessAPI that failed with a transient error
+
+    A failed call is retried after a backoff drawn uniformly from
+    `[0, min(max_backoff, initial_backoff * multiplier ** retry)]` (full jitter),
+    until it succeeds, fails with an error that is not retryable, or `max_attempts` are used.
+
+    Every attempt uses the `timeout` of the client. Retrying stops early when the `deadline`
+    of the client, or the `timeout` of the policy (counted from the first attempt), would pass
+    during the backoff; that deadline also applies to every attempt.
+
+    Only idempotent calls are retried; `send_transaction` is retried only with `retry_send_transaction`.
+
+    To retry the calls of a client, set its retry policy:
+    `client.retry_policy = RetryPolicy()`
+
+    Attributes
+    ----------
+    max_attempts : int
+        Maximum number of attempts of a call, including the first.
+    initial_backoff : float
+        Upper bound of the backoff before the first retry.
+    max_backoff : float
+        Upper bound of any backoff.
+    multiplier : float
+        Growth of the backoff bound with every retry.
+    retryable_statuses : frozenset[Status]
+        gRPC statuses that are retried. Connection errors are always retried.
+    timeout : Optional[float]
+        Overall time for all attempts of a call, or None for no limit.
+    retry_send_transaction : bool
+        Whether send_transaction is retried. Resending a signed transaction cannot execute it twice,
+        but a retry can report an error for a transaction that was already accepted.
+    calls : int
+        Number of calls made under the policy.
+    retries : int
+        Number of retries.
+    retries_by_method : dict[str, int]
+        Number of retries per gRPC method.
+    failures : int
+        Number of calls that still failed with a retryable error when the attempts or the time ran out.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        *,
+        initial_backoff: Annotated[float, "seconds"] = 0.1,
+        max_backoff: Annotated[float, "seconds"] = 5.0,
+        multiplier: float = 2.0,
+        retryable_statuses: Iterable[Status] = (
+            Status.UNAVAILABLE,
+            Status.DEADLINE_EXCEEDED,
+            Status.RESOURCE_EXHAUSTED,
+            Status.ABORTED,
+        ),
+        timeout: Optional[Annotated[float, "seconds"]] = None,
+        retry_send_transaction: bool = False,
+    ) -> None:
+        super().__init__()
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts: int = max_attempts
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.multiplier: float = multiplier
+        self.retryable_statuses: frozenset[Status] = frozenset(retryable_statuses)
+        self.timeout: Optional[float] = timeout
+        self.retry_send_transaction: bool = retry_send_transaction
+        self.calls: int = 0
+        self.retries: int = 0
+        self.retries_by_method: dict[str, int] = {}
+        self.failures: int = 0
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether a call that failed with `error` should be retried."""
+        if isinstance(error, GRPCError):
+            return error.status in self.retryable_statuses
+        return isinstance(
+            error,
+            (ConnectionError, OSError, StreamTerminatedError, asyncio.TimeoutError),
+        )
+
+    def backoff(self, retry: int) -> float:
+        """Time to wait before retry number `retry` (counting from 0)."""
+        bound = min(self.max_backoff, self.initial_backoff * self.multiplier**retry)
+        return random.uniform(0, bound)
+
+    async def run(
+        self,
+        route: str,
+        call: Callable[[Optional[Deadline]], Awaitable[T]],
+        deadline: Optional[Deadline] = None,
+    ) -> T:
+        """Make a call, retrying it according to the policy.
+
+        Parameters
+        ----------
+        route : str
+            The gRPC route of the call, for example "/flow.access.AccessAPI/GetBlockByHeight".
+        call : Callable[[Optional[Deadline]], Awaitable[T]]
+            Makes one attempt of the call, with the given deadline.
+        deadline : Optional[Deadline]
+            Deadline of the call, if it has one.
+
+        Returns
+        -------
+        T
+            The result of the call.
+        """
+        self.calls += 1
+        if self.timeout is not None:
+            policy_deadline = Deadline.from_timeout(self.timeout)
+            if deadline is None or policy_deadline < deadline:
+                deadline = policy_deadline
+
+        method = route.rsplit("/", 1)[-1]
+        retry = 0
+        while True:
+            try:
+                return await call(deadline)
+            except Exception as e:
+                if not self.is_retryable(e):
+                    raise
+                backoff = self.backoff(retry)
+                if retry + 1 >= self.max_attempts or (
+                    deadline is not None and deadline.time_remaining() <= backoff
+                ):
+                    self.failures += 1
+                    raise
+                log.debug(f"Retrying {method} in {backoff:.3f}s after {e!r}")
+            await asyncio.sleep(backoff)
+            retry += 1
+            self.retries += 1
+            self.retries_by_method[method] = self.retries_by_method.get(method, 0) + 1
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(object):
+    """Shares one in-flight call between concurrent identical calls
+
+    While a call with a given key is in flight, further calls with the same key do not start
+    a new call, but wait for the result (or the exception) of the one in flight.
+    Once it completes, the next call with that key starts a new call.
+
+    To coalesce the identical concurrent calls of a client, set its single flight:
+    `client.single_flight = SingleFlight()`
+    Calls are only coalesced while the client has no deadline and no metadata.
+
+    Attributes
+    ----------
+    calls : int
+        Number of calls that were started.
+    shared : int
+        Number of calls that waited for a call already in flight, instead of starting one.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: int = 0
+        self.shared: int = 0
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Call `call`, unless a call with the same key is already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies calls that are interchangeable.
+        call : Callable[[], Awaitable[T]]
+            Starts the call.
+
+        Returns
+        -------
+        T
+            The result of the call in flight.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._done(key, f))
+            self.calls += 1
+        else:
+            self.shared += 1
+        # cancelling one of the waiting callers does not cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # mark the exception as retrieved, in case every caller was cancelled
+            future.exception()
@@ -0,0 +1,399 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+from flow_py_sdk.client import entities
+from flow_py_sdk.exceptions import TransactionError
+from flow_py_sdk.tx import TransactionStatus
+
+if TYPE_CHECKING:
+    from flow_py_sdk.client.client import AccessAPI
+
+log = logging.getLogger(__name__)
+
+
+def has_status(
+    tx_result: entities.TransactionResultResponse, status: TransactionStatus
+) -> bool:
+    # Expired is the last status in the enum, but it is not a successor of any other status.
+    current = TransactionStatus(tx_result.status)
+    if current is TransactionStatus.TransactionStatusExpired:
+        return status is TransactionStatus.TransactionStatusExpired
+    return current.value >= status.value
+
+
+class TransactionTracker(ABC):
+    """The TransactionTracker class
+
+    This is an abstract base class for objects that watch submitted transactions
+    and resolve a future once a transaction reaches the desired status.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @abstractmethod
+    def watch(
+        self,
+        id: bytes,
+        status: TransactionStatus = TransactionStatus.TransactionStatusSealed,
+    ) -> "asyncio.Future[entities.TransactionResultResponse]":
+        """Start watching a transaction.
+
+        Parameters
+        ----------
+        id : bytes
+            Id of the submitted transaction.
+        status : TransactionStatus
+            Status the transaction needs to reach.
+
+        Returns
+        -------
+        asyncio.Future[entities.TransactionResultResponse]
+            Resolved with the transaction result once the transaction reaches `status`.
+            Fails with TransactionError if the transaction errors or expires.
+            Cancelling the future stops watching the transaction.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop watching all transactions."""
+        pass
+
+
+class _Watch(object):
+    def __init__(self) -> None:
+        self.waiters: list[tuple[TransactionStatus, asyncio.Future]] = []
+
+
+class _BackgroundTracker(TransactionTracker, ABC):
+    # Keeps the waiters of all watched transactions and a single background task,
+    # which runs while there is at least one transaction being watched.
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._watched: dict[bytes, _Watch] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def watch(
+        self,
+        id: bytes,
+        status: TransactionStatus = TransactionStatus.TransactionStatusSealed,
+    ) -> "asyncio.Future[entities.TransactionResultResponse]":
+        future = asyncio.get_running_loop().create_future()
+
+        w = self._watched.get(id)
+        if w is None:
+            w = self._new_watch()
+            self._watched[id] = w
+        else:
+            self._rewatch(w)
+        w.waiters.append((status, future))
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        else:
+            self._wakeup.set()
+        return future
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for w in self._watched.values():
+            for _, future in w.waiters:
+                future.cancel()
+        self._watched.clear()
+
+    @abstractmethod
+    def _new_watch(self) -> _Watch:
+        pass
+
+    def _rewatch(self, w: _Watch) -> None:
+        pass
+
+    @abstractmethod
+    async def _run(self) -> None:
+        pass
+
+    async def _sleep(self, delay: float) -> None:
+        # sleep that is interrupted when a new transaction is watched
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def _resolve(
+        self, id: bytes, w: _Watch, tx_result: entities.TransactionResultResponse
+    ) -> None:
+        error = None
+        if tx_result.error_message:
+            error = TransactionError(id, tx_result.error_message)
+        elif (
+            TransactionStatus(tx_result.status)
+            is TransactionStatus.TransactionStatusExpired
+        ):
+            error = TransactionError(id, f"Transaction {id.hex()} expired")
+
+        waiting = []
+        for status, future in w.waiters:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            elif has_status(tx_result, status):
+                future.set_result(tx_result)
+            else:
+                waiting.append((status, future))
+        w.waiters = waiting
+
+    def _drop_done(self) -> None:
+        for id in list(self._watched):
+            w = self._watched[id]
+            w.waiters = [(s, f) for (s, f) in w.waiters if not f.done()]
+            if not w.waiters:
+                del self._watched[id]
+
+
+class _PolledWatch(_Watch):
+    def __init__(self, interval: float, next_poll: float) -> None:
+        super().__init__()
+        self.interval: float = interval
+        self.next_poll: float = next_poll
+        self.last_status: Optional[TransactionStatus] = None
+
+
+class TransactionStatusTracker(_BackgroundTracker):
+    """Polls the status of all watched transactions from a single background task
+
+    Every watched transaction is polled with `get_transaction_result`, first every `min_interval`
+    seconds and then less often (by a factor of `backoff` per poll, up to `max_interval`).
+    The interval is reset every time the status of the transaction changes.
+    At most `max_concurrency` polls are in flight at the same time.
+
+    Attributes
+    ----------
+    client : AccessAPI
+        The client used to poll transaction results.
+    max_concurrency : int
+        Maximum number of concurrent `get_transaction_result` calls.
+    min_interval : float
+        Initial time between polls of a transaction.
+    max_interval : float
+        Maximum time between polls of a transaction.
+    backoff : float
+        Factor the poll interval grows by after every poll.
+    """
+
+    def __init__(
+        self,
+        client: "AccessAPI",
+        *,
+        max_concurrency: int = 10,
+        min_interval: float = 0.5,
+        max_interval: float = 5.0,
+        backoff: float = 1.5,
+    ) -> None:
+        super().__init__()
+        self.client: "AccessAPI" = client
+        self.max_concurrency: int = max_concurrency
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+
+    def _new_watch(self) -> _PolledWatch:
+        return _PolledWatch(self.min_interval, asyncio.get_running_loop().time())
+
+    def _rewatch(self, w: _PolledWatch) -> None:
+        # poll again soon, so that the new waiter doesn't have to wait for the backed off interval
+        w.next_poll = min(
+            w.next_poll, asyncio.get_running_loop().time() + self.min_interval
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        while True:
+            self._drop_done()
+            if not self._watched:
+                return
+
+            now = loop.time()
+            due = [id for id, w in self._watched.items() if w.next_poll <= now]
+            if due:
+                await asyncio.gather(*(self._poll(id, semaphore) for id in due))
+                continue
+
+            await self._sleep(min(w.next_poll for w in self._watched.values()) - now)
+
+    async def _poll(self, id: bytes, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                tx_result = await self.client.get_transaction_result(id=id)
+            except Exception as e:
+                log.warning(f"Failed to get the result of transaction {id.hex()}: {e}")
+                tx_result = None
+
+        w = self._watched.get(id)
+        if w is None:
+            return
+
+        if tx_result is not None:
+            self._resolve(id, w, tx_result)
+            status = TransactionStatus(tx_result.status)
+            if status is not w.last_status:
+                w.last_status = status
+                w.interval = self.min_interval
+
+        w.next_poll = asyncio.get_running_loop().time() + w.interval
+        w.interval = min(w.interval * self.backoff, self.max_interval)
+
+
+class _BlockWatch(_Watch):
+    def __init__(self, since_height: Optional[int]) -> None:
+        super().__init__()
+        self.since_height: Optional[int] = since_height
+
+
+class BlockSealTracker(_BackgroundTracker):
+    """Detects sealed transactions by following sealed blocks instead of polling every transaction
+
+    The tracker polls the latest sealed block header and, for every new sealed block, fetches
+    its collections and looks for watched transaction ids in them. The result of a transaction
+    is fetched when it starts being watched (in case it already has the requested status),
+    and again when the transaction is found. The number of requests therefore grows with
+    the number of blocks, not with how long transactions are watched.
+
+    Only sealed blocks are followed, so a watched transaction that did not have the requested status
+    when it started being watched resolves once it is sealed, even if an earlier status was requested.
+    A transaction that is not found for `expiry_blocks` sealed blocks is looked up directly,
+    to detect expired (or missed) transactions.
+
+    To use it for all transactions of a client, replace the tracker of the client:
+    `client.transaction_tracker = BlockSealTracker(client)`
+
+    Attributes
+    ----------
+    client : AccessAPI
+        The client used to fetch blocks, collections and transaction results.
+    poll_interval : float
+        Time between polls of the latest sealed block header.
+    max_concurrency : int
+        Maximum number of concurrent requests while processing a block.
+    expiry_blocks : int
+        Number of sealed blocks after which a transaction that was not found is looked up directly.
+    """
+
+    def __init__(
+        self,
+        client: "AccessAPI",
+        *,
+        poll_interval: float = 1.0,
+        max_concurrency: int = 10,
+        expiry_blocks: int = 650,
+    ) -> None:
+        super().__init__()
+        self.client: "AccessAPI" = client
+        self.poll_interval: float = poll_interval
+        self.max_concurrency: int = max_concurrency
+        self.expiry_blocks: int = expiry_blocks
+        self._next_height: Optional[int] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._checks: set[asyncio.Task] = set()
+
+    def watch(
+        self,
+        id: bytes,
+        status: TransactionStatus = TransactionStatus.TransactionStatusSealed,
+    ) -> "asyncio.Future[entities.TransactionResultResponse]":
+        future = super().watch(id, status)
+        # A transaction that is already sealed is not in any of the blocks followed from now on,
+        # so its current result is fetched once.
+        check = asyncio.ensure_future(self._check(id))
+        self._checks.add(check)
+        check.add_done_callback(self._checks.discard)
+        return future
+
+    def close(self) -> None:
+        for check in self._checks:
+            check.cancel()
+        self._checks.clear()
+        super().close()
+
+    def _new_watch(self) -> _BlockWatch:
+        return _BlockWatch(self._next_height)
+
+    async def _check(self, id: bytes) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            await self._fetch_result(id, self._semaphore)
+        except Exception as e:
+            log.warning(f"Failed to get the result of transaction {id.hex()}: {e}")
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._next_height = None
+
+        while True:
+            self._drop_done()
+            if not self._watched:
+                return
+
+            try:
+                header = await self.client.get_latest_block_header(is_sealed=True)
+                if self._next_height is None:
+                    self._next_height = header.height
+                    for w in self._watched.values():
+                        w.since_height = header.height
+
+                while self._next_height <= header.height and self._watched:
+                    await self._process_block(self._next_height, semaphore)
+                    self._next_height += 1
+                    self._drop_done()
+
+                await self._check_expired(header.height, semaphore)
+            except Exception as e:
+                log.warning(f"Failed to follow sealed blocks: {e}")
+
+            await self._sleep(self.poll_interval)
+
+    async def _process_block(self, height: int, semaphore: asyncio.Semaphore) -> None:
+        block = await self.client.get_block_by_height(height=height)
+
+        async def get_collection(collection_id: bytes) -> entities.Collection:
+            async with semaphore:
+                return await self.client.get_collection_by_i_d(id=collection_id)
+
+        collections = await asyncio.gather(
+            *(get_collection(g.collection_id) for g in block.collection_guarantees)
+        )
+        found = [
+            id for c in collections for id in c.transaction_ids if id in self._watched
+        ]
+        if found:
+            log.debug(f"Found {len(found)} watched transactions in block {height}")
+            await asyncio.gather(*(self._fetch_result(id, semaphore) for id in found))
+
+    async def _check_expired(self, height: int, semaphore: asyncio.Semaphore) -> None:
+        expired = []
+        for id, w in self._watched.items():
+            if w.since_height is None:
+                w.since_height = height
+            elif height - w.since_height >= self.expiry_blocks:
+                w.since_height = height
+                expired.append(id)
+        await asyncio.gather(*(self._fetch_result(id, semaphore) for id in expired))
+
+    async def _fetch_result(self, id: bytes, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            tx_result = await self.client.get_transaction_result(id=id)
+        w = self._watched.get(id)
+        if w is not None:
+            self._resolve(id, w, tx_result)
@@ -30,3 +30,14 @@ class NotAddressError(PySDKError):
     @classmethod
     def from_value(cls, value) -> "NotAddressError":
         return NotAddressError(f"Value {value} is not a cadence address.")
+
+
+class TransactionError(PySDKError):
+    """
+    Transaction was submitted, but the network reported an error for it
+    """
+
+    def __init__(self, transaction_id: bytes, error_message: str) -> None:
+        super().__init__(error_message)
+        self.transaction_id: bytes = transaction_id
+        self.error_message: str = error_message
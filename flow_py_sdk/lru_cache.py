@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+from typing import Annotated, Any, Hashable, Optional
+
+
+class LRUCache(object):
+    """A size bounded cache that evicts the least recently used entry first
+
+    Entries can optionally expire after a time to live. Expired entries are removed when they are
+    looked up, or evicted like any other entry. The cache is not thread safe.
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum number of entries.
+    hits : int
+        Number of lookups that found an entry.
+    misses : int
+        Number of lookups that did not find an entry (or found an expired one).
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__()
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        # key -> (expires at or None, value)
+        self._entries: OrderedDict[Hashable, tuple[Optional[float], Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get the value of a key, or None if the key is not cached or expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._remove(key)
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[Annotated[float, "seconds"]] = None,
+    ) -> None:
+        """Cache a value, replacing the previous value of the key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key.
+        value : Any
+            The value, which must not be None.
+        ttl : Optional[float]
+            Time after which the entry expires. If None, the entry does not expire.
+        """
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._remove(key)
+        self._entries[key] = (expires_at, value)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
@@ -1,6 +1,13 @@
 from flow_py_sdk.signer.hash_algo import HashAlgo
 from flow_py_sdk.signer.sign_algo import SignAlgo
 from flow_py_sdk.signer.signer import Signer, TransactionDomainTag, UserDomainTag
+from flow_py_sdk.signer.async_signer import AsyncSigner, ExecutorSigner
 from flow_py_sdk.signer.verifier import Verifier
 from flow_py_sdk.signer.in_memory_verifier import InMemoryVerifier
 from flow_py_sdk.signer.in_memory_signer import InMemorySigner
+from flow_py_sdk.signer.verifier_cache import VerifierCache
+from flow_py_sdk.signer.crypto_backend import (
+    CryptoBackend,
+    set_crypto_backend,
+    get_crypto_backend,
+)
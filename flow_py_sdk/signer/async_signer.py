@@ -0,0 +1,96 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Optional
+
+from flow_py_sdk.signer.signer import Signer, TransactionDomainTag, UserDomainTag
+
+
+class AsyncSigner(ABC):
+    """The AsyncSigner class
+
+    This is an abstract base class for signers that sign asynchronously, for example remote signers
+    or hardware security modules. Transactions signed with an AsyncSigner have to be signed
+    with `Tx.to_signed_grpc_async`, which `AccessAPI.execute_transaction` does.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @abstractmethod
+    async def sign(self, message: bytes, tag: Optional[bytes] = None) -> bytes:
+        """The sign method signs a message with a tag and returns the signature
+
+        Parameters
+        ----------
+        message : bytes
+            The message to sign.
+        tag : str
+            The tag to sign with.
+
+        Returns
+        -------
+        bytes
+            The signed message.
+
+        """
+        pass
+
+    async def sign_transaction(self, message: bytes) -> bytes:
+        """The sign_transaction method signs a message with the transaction tag and returns the signature
+
+        Parameters
+        ----------
+        message : bytes
+            The message to sign.
+
+        Returns
+        -------
+        bytes
+            The signed message.
+
+        """
+        return await self.sign(message, TransactionDomainTag)
+
+    async def sign_user_message(self, message: bytes) -> bytes:
+        """The sign_user_message method signs a message with the user tag and returns the signature
+
+        Parameters
+        ----------
+        message : bytes
+            The message to sign.
+
+        Returns
+        -------
+        bytes
+            The signed message.
+
+        """
+        return await self.sign(message, UserDomainTag)
+
+
+class ExecutorSigner(AsyncSigner):
+    """Runs a synchronous Signer in an executor, so that signing does not block the event loop
+
+    With the default executor (a thread pool) the event loop is not blocked by signers that wait,
+    for example on the network. CPU bound signers (like the InMemorySigner) still hold the GIL
+    while signing, to sign those in parallel use a `concurrent.futures.ProcessPoolExecutor`,
+    in which case the signer needs to be picklable.
+
+    Attributes
+    ----------
+    signer : Signer
+        The synchronous signer.
+    executor : Optional[Executor]
+        The executor to sign in. If None the default executor of the event loop is used.
+    """
+
+    def __init__(self, signer: Signer, executor: Optional[Executor] = None) -> None:
+        super().__init__()
+        self.signer: Signer = signer
+        self.executor: Optional[Executor] = executor
+
+    async def sign(self, message: bytes, tag: Optional[bytes] = None) -> bytes:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.signer.sign, message, tag
+        )
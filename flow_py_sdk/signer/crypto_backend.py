@@ -0,0 +1,263 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import ecdsa
+
+from flow_py_sdk.signer.hash_algo import HashAlgo
+from flow_py_sdk.signer.sign_algo import SignAlgo
+
+log = logging.getLogger(__name__)
+
+
+class SigningKey(ABC):
+    """A private key of a CryptoBackend."""
+
+    @abstractmethod
+    def sign_digest(self, digest: bytes) -> bytes:
+        """Deterministically sign a message digest and return the raw signature (r||s)."""
+        pass
+
+    @abstractmethod
+    def public_key(self) -> bytes:
+        """The raw public key (x||y)."""
+        pass
+
+
+class VerifyingKey(ABC):
+    """A public key of a CryptoBackend."""
+
+    @abstractmethod
+    def verify_digest(self, signature: bytes, digest: bytes) -> bool:
+        """Check a raw signature (r||s) of a message digest."""
+        pass
+
+    def precompute(self) -> None:
+        """Speed up future verifications with this key, if the backend supports it."""
+        pass
+
+
+class CryptoBackend(ABC):
+    """Implements ECDSA for the InMemorySigner and InMemoryVerifier.
+
+    Signatures of all backends are encoded the same way (the raw r||s, as Flow expects them)
+    and signing is deterministic, but the signatures of different backends are not necessarily
+    identical, because they derive the deterministic nonces differently.
+
+    Attributes
+    ----------
+    name : str
+        Name of the backend.
+    """
+
+    name: str
+
+    @abstractmethod
+    def signing_key(
+        self, sign_algo: SignAlgo, hash_algo: HashAlgo, private_key: bytes
+    ) -> SigningKey:
+        pass
+
+    @abstractmethod
+    def verifying_key(
+        self, sign_algo: SignAlgo, hash_algo: HashAlgo, public_key: bytes
+    ) -> VerifyingKey:
+        pass
+
+
+class _EcdsaSigningKey(SigningKey):
+    def __init__(self, key: ecdsa.SigningKey) -> None:
+        self.key: ecdsa.SigningKey = key
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        return self.key.sign_digest_deterministic(digest)
+
+    def public_key(self) -> bytes:
+        return self.key.get_verifying_key().to_string()
+
+
+class _EcdsaVerifyingKey(VerifyingKey):
+    def __init__(self, key: ecdsa.VerifyingKey) -> None:
+        self.key: ecdsa.VerifyingKey = key
+
+    def verify_digest(self, signature: bytes, digest: bytes) -> bool:
+        try:
+            return self.key.verify_digest(signature, digest)
+        except ecdsa.keys.BadSignatureError:
+            return False
+
+    def precompute(self) -> None:
+        self.key.precompute()
+
+
+class EcdsaBackend(CryptoBackend):
+    """Pure python implementation, using the ecdsa package."""
+
+    name = "ecdsa"
+
+    def signing_key(
+        self, sign_algo: SignAlgo, hash_algo: HashAlgo, private_key: bytes
+    ) -> SigningKey:
+        return _EcdsaSigningKey(
+            ecdsa.SigningKey.from_string(
+                private_key, curve=sign_algo.get_signing_curve()
+            )
+        )
+
+    def verifying_key(
+        self, sign_algo: SignAlgo, hash_algo: HashAlgo, public_key: bytes
+    ) -> VerifyingKey:
+        curve = sign_algo.get_signing_curve()
+        # VerifyingKey.from_string creates a point without the curve order, which precompute needs
+        point = ecdsa.ellipticcurve.PointJacobi.from_bytes(
+            curve.curve, public_key, order=curve.order
+        )
+        return _EcdsaVerifyingKey(ecdsa.VerifyingKey.from_public_point(point, curve))
+
+
+class _CryptographySigningKey(SigningKey):
+    def __init__(self, backend: "CryptographyBackend", key, algorithm) -> None:
+        self._backend = backend
+        self.key = key
+        self._algorithm = algorithm
+        self._size = (key.curve.key_size + 7) // 8
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        r, s = self._backend._utils.decode_dss_signature(
+            self.key.sign(digest, self._algorithm)
+        )
+        return r.to_bytes(self._size, "big") + s.to_bytes(self._size, "big")
+
+    def public_key(self) -> bytes:
+        serialization = self._backend._serialization
+        return self.key.public_key().public_bytes(
+            serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+        )[1:]
+
+
+class _CryptographyVerifyingKey(VerifyingKey):
+    def __init__(self, backend: "CryptographyBackend", key, algorithm) -> None:
+        self._backend = backend
+        self.key = key
+        self._algorithm = algorithm
+        self._size = (key.curve.key_size + 7) // 8
+
+    def verify_digest(self, signature: bytes, digest: bytes) -> bool:
+        if len(signature) != 2 * self._size:
+            return False
+        der_signature = self._backend._utils.encode_dss_signature(
+            int.from_bytes(signature[: self._size], "big"),
+            int.from_bytes(signature[self._size :], "big"),
+        )
+        try:
+            self.key.verify(der_signature, digest, self._algorithm)
+            return True
+        except self._backend._invalid_signature:
+            return False
+
+
+class CryptographyBackend(CryptoBackend):
+    """Native implementation (OpenSSL), using the cryptography package."""
+
+    name = "cryptography"
+
+    def __init__(self) -> None:
+        from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, utils
+
+        try:
+            ec.ECDSA(hashes.SHA256(), deterministic_signing=True)
+        except (TypeError, UnsupportedAlgorithm) as e:
+            # older versions of cryptography (or of OpenSSL) cannot sign deterministically
+            raise ImportError(
+                "The installed cryptography package does not support deterministic ECDSA signing"
+            ) from e
+
+        self._ec = ec
+        self._utils = utils
+        self._serialization = serialization
+        self._invalid_signature = InvalidSignature
+        self._curves = {
+            SignAlgo.ECDSA_P256: ec.SECP256R1(),
+            SignAlgo.ECDSA_secp256k1: ec.SECP256K1(),
+        }
+        self._hashes = {
+            HashAlgo.SHA2_256: hashes.SHA256(),
+            HashAlgo.SHA2_384: hashes.SHA384(),
+            HashAlgo.SHA3_256: hashes.SHA3_256(),
+            HashAlgo.SHA3_384: hashes.SHA3_384(),
+        }
+
+    def signing_key(
+        self, sign_algo: SignAlgo, hash_algo: HashAlgo, private_key: bytes
+    ) -> SigningKey:
+        return _CryptographySigningKey(
+            self,
+            self._ec.derive_private_key(
+                int.from_bytes(private_key, "big"), self._curves[sign_algo]
+            ),
+            self._ec.ECDSA(
+                self._utils.Prehashed(self._hashes[hash_algo]),
+                deterministic_signing=True,
+            ),
+        )
+
+    def verifying_key(
+        self, sign_algo: SignAlgo, hash_algo: HashAlgo, public_key: bytes
+    ) -> VerifyingKey:
+        return _CryptographyVerifyingKey(
+            self,
+            self._ec.EllipticCurvePublicKey.from_encoded_point(
+                self._curves[sign_algo], b"\x04" + public_key
+            ),
+            self._ec.ECDSA(self._utils.Prehashed(self._hashes[hash_algo])),
+        )
+
+
+_crypto_backends: dict[str, type[CryptoBackend]] = {
+    "cryptography": CryptographyBackend,
+    "ecdsa": EcdsaBackend,
+}
+
+_crypto_backend: Optional[CryptoBackend] = None
+
+
+def set_crypto_backend(name: Optional[str] = None) -> CryptoBackend:
+    """Select the ECDSA implementation used by signers and verifiers created after this call.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        One of "cryptography" (native, if the cryptography package is installed) or "ecdsa" (pure python).
+        If None, the first available backend in that order is used.
+
+    Returns
+    -------
+    CryptoBackend
+        The selected backend.
+    """
+    global _crypto_backend
+    if name is not None:
+        if name not in _crypto_backends:
+            raise ValueError(
+                f"Unknown crypto backend {name}, expected one of {', '.join(_crypto_backends)}"
+            )
+        _crypto_backend = _crypto_backends[name]()
+        return _crypto_backend
+
+    for backend in _crypto_backends.values():
+        try:
+            _crypto_backend = backend()
+            break
+        except ImportError:
+            continue
+    log.debug(f"Using the {_crypto_backend.name} crypto backend")
+    return _crypto_backend
+
+
+def get_crypto_backend() -> CryptoBackend:
+    """Get the selected crypto backend, selecting the fastest available one on first use."""
+    if _crypto_backend is None:
+        return set_crypto_backend()
+    return _crypto_backend
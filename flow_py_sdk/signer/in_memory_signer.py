@@ -1,7 +1,6 @@
 from typing import Optional
 
-import ecdsa
-
+from flow_py_sdk.signer.crypto_backend import get_crypto_backend
 from flow_py_sdk.signer.hash_algo import HashAlgo
 from flow_py_sdk.signer.in_memory_verifier import InMemoryVerifier
 from flow_py_sdk.signer.sign_algo import SignAlgo
@@ -15,18 +14,20 @@ class InMemorySigner(Signer, Verifier):
     ) -> None:
         super().__init__()
         self.hash_algo = hash_algo
-        self.key = ecdsa.SigningKey.from_string(
-            bytes.fromhex(private_key_hex), curve=sign_algo.get_signing_curve()
+        self.sign_algo = sign_algo
+        self.key = get_crypto_backend().signing_key(
+            sign_algo, hash_algo, bytes.fromhex(private_key_hex)
         )
         self.verifier = InMemoryVerifier(
             hash_algo=hash_algo,
             sign_algo=sign_algo,
-            public_key_hex=self.key.get_verifying_key().to_string().hex(),
+            public_key_hex=self.key.public_key().hex(),
         )
+        self._private_key_hex = private_key_hex
 
     def sign(self, message: bytes, tag: Optional[bytes] = None) -> bytes:
         hash_ = self._hash_message(message, tag)
-        return self.key.sign_digest_deterministic(hash_)
+        return self.key.sign_digest(hash_)
 
     def verify(self, signature: bytes, message: bytes, tag: bytes) -> bool:
         return self.verifier.verify(signature, message, tag)
@@ -37,3 +38,14 @@ class InMemorySigner(Signer, Verifier):
             m.update(tag)
         m.update(message)
         return m.digest()
+
+    def __getstate__(self):
+        # keys of native crypto backends cannot be pickled, so the key is re-created when unpickling
+        return {
+            "hash_algo": self.hash_algo,
+            "sign_algo": self.sign_algo,
+            "private_key_hex": self._private_key_hex,
+        }
+
+    def __setstate__(self, state) -> None:
+        self.__init__(**state)
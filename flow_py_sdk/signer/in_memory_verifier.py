@@ -1,7 +1,6 @@
 from typing import Optional
 
-import ecdsa
-
+from flow_py_sdk.signer.crypto_backend import get_crypto_backend
 from flow_py_sdk.signer.hash_algo import HashAlgo
 from flow_py_sdk.signer.sign_algo import SignAlgo
 from flow_py_sdk.signer.verifier import Verifier
@@ -13,16 +12,22 @@ class InMemoryVerifier(Verifier):
     ) -> None:
         super().__init__()
         self.hash_algo = hash_algo
-        self.key = ecdsa.VerifyingKey.from_string(
-            bytes.fromhex(public_key_hex), curve=sign_algo.get_signing_curve()
+        self.sign_algo = sign_algo
+        self.public_key_hex = public_key_hex
+        self.key = get_crypto_backend().verifying_key(
+            sign_algo, hash_algo, bytes.fromhex(public_key_hex)
         )
 
     def verify(self, signature: bytes, message: bytes, tag: bytes) -> bool:
         hash_ = self._hash_message(message, tag)
-        try:
-            return self.key.verify_digest(signature, hash_)
-        except ecdsa.keys.BadSignatureError:
-            return False
+        return self.key.verify_digest(signature, hash_)
+
+    def precompute(self) -> None:
+        """Precompute tables that make verification with this key faster, if the crypto backend supports it.
+
+        This takes about as long as a few verifications, so it is only worth it for keys that verify often.
+        """
+        self.key.precompute()
 
     def _hash_message(self, message: bytes, tag: Optional[bytes] = None) -> bytes:
         m = self.hash_algo.create_hasher()
@@ -31,3 +36,14 @@ class InMemoryVerifier(Verifier):
         else:
             m.update(message)
         return m.digest()
+
+    def __getstate__(self):
+        # keys of native crypto backends cannot be pickled, so the key is re-created when unpickling
+        return {
+            "hash_algo": self.hash_algo,
+            "sign_algo": self.sign_algo,
+            "public_key_hex": self.public_key_hex,
+        }
+
+    def __setstate__(self, state) -> None:
+        self.__init__(**state)
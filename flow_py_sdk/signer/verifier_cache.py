@@ -0,0 +1,94 @@
+import threading
+from typing import Union
+
+from flow_py_sdk.lru_cache import LRUCache
+from flow_py_sdk.signer.hash_algo import HashAlgo
+from flow_py_sdk.signer.in_memory_verifier import InMemoryVerifier
+from flow_py_sdk.signer.sign_algo import SignAlgo
+
+
+class VerifierCache(object):
+    """A least recently used cache of InMemoryVerifiers
+
+    Creating a verifier parses the public key, and (with `precompute`) precomputes tables
+    that make every later verification with that key faster. When many signatures are verified
+    against a small set of public keys, keeping those verifiers around saves both.
+    The cache can be shared between threads.
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum number of cached verifiers. The least recently used verifier is evicted first.
+    precompute : bool
+        Whether to precompute the tables of new verifiers (see `InMemoryVerifier.precompute`).
+    hits : int
+        Number of lookups that found a cached verifier.
+    misses : int
+        Number of lookups that created a new verifier.
+    """
+
+    def __init__(self, max_size: int = 1024, *, precompute: bool = True) -> None:
+        super().__init__()
+        self.precompute: bool = precompute
+        self._verifiers: LRUCache = LRUCache(max_size)
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._verifiers.max_size
+
+    @property
+    def hits(self) -> int:
+        return self._verifiers.hits
+
+    @property
+    def misses(self) -> int:
+        return self._verifiers.misses
+
+    def __len__(self) -> int:
+        return len(self._verifiers)
+
+    def get(
+        self, *, public_key: Union[bytes, str], sign_algo: SignAlgo, hash_algo: HashAlgo
+    ) -> InMemoryVerifier:
+        """Get the verifier of a public key, creating it if it is not cached.
+
+        Parameters
+        ----------
+        public_key : bytes | str
+            The raw public key, or its hex encoding.
+        sign_algo : SignAlgo
+            Signature algorithm of the key.
+        hash_algo : HashAlgo
+            Hash algorithm of the key.
+
+        Returns
+        -------
+        InMemoryVerifier
+            The verifier for the key.
+        """
+        if isinstance(public_key, str):
+            public_key = bytes.fromhex(public_key.removeprefix("0x"))
+        key = (public_key, sign_algo, hash_algo)
+
+        with self._lock:
+            verifier = self._verifiers.get(key)
+        if verifier is not None:
+            return verifier
+
+        # created outside of the lock, because precomputing takes a while
+        verifier = InMemoryVerifier(
+            hash_algo=hash_algo, sign_algo=sign_algo, public_key_hex=public_key.hex()
+        )
+        if self.precompute:
+            verifier.precompute()
+
+        # another thread might have created the same verifier in the meantime, either one can be kept
+        with self._lock:
+            self._verifiers.put(key, verifier)
+        return verifier
+
+    def clear(self) -> None:
+        """Remove all cached verifiers."""
+        with self._lock:
+            self._verifiers.clear()
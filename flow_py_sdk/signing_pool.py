@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import multiprocessing.context
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import Callable, Optional, Type
+
+from flow_py_sdk.exceptions import PySDKError
+from flow_py_sdk.signer import Signer
+from flow_py_sdk.tx import Tx, TxSignature, _TxSigner
+
+log = logging.getLogger(__name__)
+
+# signers of the worker process, set once when the worker starts
+_worker_signers: list[Signer] = []
+
+
+def _init_worker(signers: list[Signer]) -> None:
+    global _worker_signers
+    _worker_signers = signers
+
+
+def _sign_in_worker(job: tuple[int, bytes]) -> bytes:
+    signer_index, message = job
+    return _worker_signers[signer_index].sign_transaction(message)
+
+
+class SigningPool(object):
+    """Signs batches of transactions on a pool of worker processes
+
+    Signing with an InMemorySigner is CPU bound and holds the GIL, so signing many transactions
+    in a single process only uses a single core. Every worker process of the pool gets a copy of
+    `signers` once, when it starts, after which only the messages to sign and the signatures are
+    sent between the processes.
+
+    Signed transactions keep their signatures, so `Tx.to_signed_grpc` does not sign them again.
+    Signers that are not part of the pool are signed with in the calling process.
+
+    The pool can be used as a context manager, which shuts down the worker processes on exit.
+
+    Attributes
+    ----------
+    signers : list[Signer]
+        The signers the worker processes sign with. They need to be picklable.
+    chunk_size : int
+        Number of signatures sent to a worker process at a time.
+    """
+
+    def __init__(
+        self,
+        signers: list[Signer],
+        *,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        super().__init__()
+        self.signers: list[Signer] = list(signers)
+        self.chunk_size: int = chunk_size
+        self._signer_indices: dict[int, int] = {
+            id(s): i for i, s in enumerate(self.signers)
+        }
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.signers,),
+        )
+
+    def __enter__(self) -> "SigningPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def sign(self, transactions: list[Tx]) -> list[Tx]:
+        """Add all missing payload and envelope signatures to the transactions.
+
+        The payload signatures of all transactions are added first, because the envelope
+        messages include them.
+
+        Parameters
+        ----------
+        transactions : list[Tx]
+            The transactions to sign.
+
+        Returns
+        -------
+        list[Tx]
+            The same transactions, in the same order, with all signatures added.
+        """
+        for tx in transactions:
+            tx._check_fields_for_signing()
+            tx._drop_stale_signatures()
+            if tx._has_async_signers():
+                raise PySDKError(
+                    "Transactions with asynchronous signers cannot be signed on a signing pool"
+                )
+
+        self._sign_all(
+            transactions,
+            Tx._unsigned_payload_signers,
+            Tx.payload_message,
+            lambda tx: tx.payload_signatures,
+        )
+        self._sign_all(
+            transactions,
+            Tx._unsigned_envelope_signers,
+            Tx.envelope_message,
+            lambda tx: tx.envelope_signatures,
+        )
+        return transactions
+
+    async def sign_async(self, transactions: list[Tx]) -> list[Tx]:
+        """Like `sign`, but waits for the worker processes without blocking the event loop.
+
+        The transactions must not be changed until signing is done.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.sign, transactions
+        )
+
+    def _sign_all(
+        self,
+        transactions: list[Tx],
+        get_signers: Callable[[Tx], list[_TxSigner]],
+        get_message: Callable[[Tx], bytes],
+        get_signatures: Callable[[Tx], list[TxSignature]],
+    ) -> None:
+        batch = []
+        jobs = []
+        for tx in transactions:
+            signers = get_signers(tx)
+            if not signers:
+                continue
+            message = get_message(tx)
+            batch.append((tx, signers, message))
+            jobs.extend(
+                (self._signer_indices[id(s.signer)], message)
+                for s in signers
+                if id(s.signer) in self._signer_indices
+            )
+        if not batch:
+            return
+
+        log.debug(f"Signing {len(jobs)} messages on the signing pool")
+        # map submits all jobs right away and yields the results in order
+        results = self._executor.map(_sign_in_worker, jobs, chunksize=self.chunk_size)
+        for tx, signers, message in batch:
+            signed = [
+                (
+                    next(results)
+                    if id(s.signer) in self._signer_indices
+                    else s.signer.sign_transaction(message)
+                )
+                for s in signers
+            ]
+            tx._add_signatures(get_signatures(tx), signers, signed, message)
@@ -1,13 +1,15 @@
+import asyncio
 import logging
 from enum import Enum
+from typing import Optional, Union
 
 import rlp
 
 from flow_py_sdk.cadence import Value, Address, encode_arguments
-from flow_py_sdk.exceptions import NotCadenceValueError
+from flow_py_sdk.exceptions import NotCadenceValueError, PySDKError
 from flow_py_sdk.frlp import rlp_encode_uint64
 from flow_py_sdk.proto.flow import entities
-from flow_py_sdk.signer import Signer
+from flow_py_sdk.signer import Signer, AsyncSigner
 
 log = logging.getLogger(__name__)
 
@@ -36,6 +38,8 @@ class TxSignature(object):
         self.key_id: int = key_id
         self.signer_index: int = signer_index
         self.signature: bytes = signature
+        # the message signed by one of the signers of the transaction, None if the signature was added directly
+        self._message: Optional[bytes] = None
 
     def rpc_form(self) -> entities.TransactionSignature:
         s = entities.TransactionSignature()
@@ -56,11 +60,13 @@ class ProposalKey(object):
 
 
 class _TxSigner(object):
-    def __init__(self, *, address: Address, key_id: int, signer: Signer) -> None:
+    def __init__(
+        self, *, address: Address, key_id: int, signer: Union[Signer, AsyncSigner]
+    ) -> None:
         super().__init__()
         self.address: Address = address
         self.key_id: int = key_id
-        self.signer: Signer = signer
+        self.signer: Union[Signer, AsyncSigner] = signer
 
 
 class Tx(object):
@@ -85,6 +91,15 @@ class Tx(object):
         self.payload_signers: list[_TxSigner] = []
         self.envelope_signers: list[_TxSigner] = []
 
+        # Memoized encodings, together with the fields they were computed from.
+        # Fields can be changed directly (not only with the with_*/add_* methods), so instead of
+        # invalidating the memoized values on every change, they are recomputed if the fields differ.
+        # Changes inside of an argument value are not detected.
+        self._encoded_arguments: Optional[tuple[tuple[Value, ...], list[bytes]]] = None
+        self._payload: Optional[tuple[tuple, list]] = None
+        # the payload message is only encoded when it is needed (the envelope embeds the payload form)
+        self._payload_message: Optional[tuple[list, bytes]] = None
+
     def with_gas_limit(self, gas_limit: int) -> "Tx":
         self.gas_limit = gas_limit
         return self
@@ -101,21 +116,49 @@ class Tx(object):
         self.proposal_key = proposal_key
         return self
 
-    def _payload_form(self):
-        return [
-            self.code.encode("utf-8"),
-            encode_arguments(self.arguments),
+    def _get_encoded_arguments(self) -> list[bytes]:
+        arguments = tuple(self.arguments)
+        # tuples compare by identity first, so this is cheap if the arguments didn't change
+        if self._encoded_arguments is None or arguments != self._encoded_arguments[0]:
+            self._encoded_arguments = (arguments, encode_arguments(self.arguments))
+        return self._encoded_arguments[1]
+
+    def _payload_form(self) -> list:
+        fields = (
+            self.code,
             self.reference_block_id,
-            rlp_encode_uint64(self.gas_limit),
+            self.gas_limit,
             self.proposal_key.key_address.bytes,
-            rlp_encode_uint64(self.proposal_key.key_id),
-            rlp_encode_uint64(self.proposal_key.key_sequence_number),
+            self.proposal_key.key_id,
+            self.proposal_key.key_sequence_number,
             self.payer.bytes,
-            [a.bytes for a in self.authorizers],
-        ]
+            tuple(a.bytes for a in self.authorizers),
+        )
+        encoded_arguments = self._get_encoded_arguments()
+        if (
+            self._payload is None
+            or fields != self._payload[0]
+            or encoded_arguments is not self._payload[1][1]
+        ):
+            form = [
+                self.code.encode("utf-8"),
+                encoded_arguments,
+                self.reference_block_id,
+                rlp_encode_uint64(self.gas_limit),
+                self.proposal_key.key_address.bytes,
+                rlp_encode_uint64(self.proposal_key.key_id),
+                rlp_encode_uint64(self.proposal_key.key_sequence_number),
+                self.payer.bytes,
+                [a.bytes for a in self.authorizers],
+            ]
+            self._payload = (fields, form)
+        return self._payload[1]
 
     def payload_message(self) -> bytes:
-        return rlp.encode(self._payload_form())
+        form = self._payload_form()
+        if self._payload_message is None or self._payload_message[0] is not form:
+            self._payload_message = (form, rlp.encode(form))
+        return self._payload_message[1]
 
     def envelope_message(self) -> bytes:
         return rlp.encode(
@@ -151,8 +194,11 @@ class Tx(object):
 
         return signers
 
+    def _signer_indices(self) -> dict[Address, int]:
+        return {address: i for i, address in enumerate(self._signer_list())}
+
     def with_payload_signature(
-        self, address: Address, key_id: int, signer: Signer
+        self, address: Address, key_id: int, signer: Union[Signer, AsyncSigner]
     ) -> "Tx":
         if self._missing_fields_for_signing():
             raise Exception(
@@ -164,7 +210,7 @@ class Tx(object):
         return self
 
     def with_envelope_signature(
-        self, address: Address, key_id: int, signer: Signer
+        self, address: Address, key_id: int, signer: Union[Signer, AsyncSigner]
     ) -> "Tx":
         if self._missing_fields_for_signing():
             raise Exception(
@@ -175,22 +221,122 @@ class Tx(object):
         )
         return self
 
-    def _submit_signature(self) -> "Tx":
+    def _check_fields_for_signing(self) -> None:
         if self._missing_fields_for_signing():
             raise Exception(
                 f"The transaction needs [{', '.join(self._missing_fields_for_signing())}] before it can be signed"
             )
-        for s in self.payload_signers:
-            signature = s.signer.sign_transaction(self.payload_message())
-            signer_index = self._signer_list().index(s.address)
-            ts = TxSignature(s.address, s.key_id, signer_index, signature)
-            self.payload_signatures.append(ts)
-
-        for s in self.envelope_signers:
-            signature = s.signer.sign_transaction(self.envelope_message())
-            signer_index = self._signer_list().index(s.address)
-            ts = TxSignature(s.address, s.key_id, signer_index, signature)
-            self.envelope_signatures.append(ts)
+
+    @staticmethod
+    def _unsigned(
+        signers: list[_TxSigner], signatures: list[TxSignature]
+    ) -> list[_TxSigner]:
+        # signers that already signed are skipped, so that a transaction can be signed ahead of time
+        signed = {(s.address, s.key_id) for s in signatures if s._message is not None}
+        return [s for s in signers if (s.address, s.key_id) not in signed]
+
+    def _drop_stale_signatures(self) -> None:
+        # signatures of the signers are dropped (and signed again) if the transaction changed since,
+        # dropping the payload signatures also changes the envelope message.
+        # The messages are only encoded if there are signatures to check.
+        if any(s._message is not None for s in self.payload_signatures):
+            message = self.payload_message()
+            self.payload_signatures = [
+                s
+                for s in self.payload_signatures
+                if s._message is None or s._message == message
+            ]
+        if any(s._message is not None for s in self.envelope_signatures):
+            message = self.envelope_message()
+            self.envelope_signatures = [
+                s
+                for s in self.envelope_signatures
+                if s._message is None or s._message == message
+            ]
+
+    def _unsigned_payload_signers(self) -> list[_TxSigner]:
+        return self._unsigned(self.payload_signers, self.payload_signatures)
+
+    def _unsigned_envelope_signers(self) -> list[_TxSigner]:
+        return self._unsigned(self.envelope_signers, self.envelope_signatures)
+
+    def _has_async_signers(self) -> bool:
+        return any(
+            isinstance(s.signer, AsyncSigner)
+            for s in self._unsigned_payload_signers()
+            + self._unsigned_envelope_signers()
+        )
+
+    def _add_signatures(
+        self,
+        signatures: list[TxSignature],
+        signers: list[_TxSigner],
+        signed: list[bytes],
+        message: bytes,
+    ) -> None:
+        signer_indices = self._signer_indices()
+        for s, signature in zip(signers, signed):
+            tx_signature = TxSignature(
+                s.address, s.key_id, signer_indices[s.address], signature
+            )
+            tx_signature._message = message
+            signatures.append(tx_signature)
+
+    def _submit_signature(self) -> "Tx":
+        self._check_fields_for_signing()
+        self._drop_stale_signatures()
+        if self._has_async_signers():
+            raise PySDKError(
+                "The transaction has asynchronous signers, it needs to be signed with to_signed_grpc_async"
+            )
+
+        signers = self._unsigned_payload_signers()
+        if signers:
+            payload_message = self.payload_message()
+            self._add_signatures(
+                self.payload_signatures,
+                signers,
+                [s.signer.sign_transaction(payload_message) for s in signers],
+                payload_message,
+            )
+
+        signers = self._unsigned_envelope_signers()
+        if signers:
+            # the envelope includes the payload signatures, so it can only be built once they are all added
+            envelope_message = self.envelope_message()
+            self._add_signatures(
+                self.envelope_signatures,
+                signers,
+                [s.signer.sign_transaction(envelope_message) for s in signers],
+                envelope_message,
+            )
+        return self
+
+    async def _submit_signature_async(self) -> "Tx":
+        self._check_fields_for_signing()
+        self._drop_stale_signatures()
+
+        async def sign(s: _TxSigner, message: bytes) -> bytes:
+            if isinstance(s.signer, AsyncSigner):
+                return await s.signer.sign_transaction(message)
+            return s.signer.sign_transaction(message)
+
+        # asynchronous signers of the same message sign concurrently
+        signers = self._unsigned_payload_signers()
+        if signers:
+            payload_message = self.payload_message()
+            signed = await asyncio.gather(*(sign(s, payload_message) for s in signers))
+            self._add_signatures(
+                self.payload_signatures, signers, signed, payload_message
+            )
+
+        signers = self._unsigned_envelope_signers()
+        if signers:
+            envelope_message = self.envelope_message()
+            signed = await asyncio.gather(*(sign(s, envelope_message) for s in signers))
+            self._add_signatures(
+                self.envelope_signatures, signers, signed, envelope_message
+            )
         return self
 
     def add_authorizers(self, *args: Address) -> "Tx":
@@ -214,9 +360,20 @@ class Tx(object):
 
     def to_signed_grpc(self) -> entities.Transaction:
         self._submit_signature()
+        return self._to_grpc()
+
+    async def to_signed_grpc_async(self) -> entities.Transaction:
+        """Sign the transaction like `to_signed_grpc`, but awaiting asynchronous signers (see AsyncSigner).
+
+        Synchronous signers are called directly, wrap them in an ExecutorSigner to sign them in an executor.
+        """
+        await self._submit_signature_async()
+        return self._to_grpc()
+
+    def _to_grpc(self) -> entities.Transaction:
         tx = entities.Transaction()
         tx.script = self.code.encode("utf-8")
-        tx.arguments = encode_arguments(self.arguments)
+        tx.arguments = self._get_encoded_arguments()
         tx.reference_block_id = self.reference_block_id
         tx.gas_limit = self.gas_limit
         tx.payer = self.payer.bytes
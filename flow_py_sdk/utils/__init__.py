@@ -1 +1,5 @@
-from .verify_user_signature import verify_user_signature, CompositeSignature
+from .verify_user_signature import (
+    verify_user_signature,
+    CompositeSignature,
+    UserSignatureVerifier,
+)
@@ -1,9 +1,16 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from types import TracebackType
+from typing import Annotated, Iterable, Optional, Type
 
 from flow_py_sdk import cadence
+from flow_py_sdk.account_key import AccountKey
 from flow_py_sdk.exceptions import PySDKError
+from flow_py_sdk.signer import HashAlgo, SignAlgo, VerifierCache
 from flow_py_sdk.templates import TransactionTemplates
-from flow_py_sdk.client import AccessAPI
+from flow_py_sdk.client import AccessAPI, SingleFlight
+from flow_py_sdk.lru_cache import LRUCache
 from flow_py_sdk.script import Script
 
 
@@ -48,3 +55,199 @@ async def verify_user_signature(
         return False
 
     return script_result.as_type(cadence.Bool).value
+
+
+# verifiers of the worker process (or thread), created on first use
+_worker_verifiers: Optional[VerifierCache] = None
+
+
+def _verify_signatures(
+    jobs: list[tuple[tuple[bytes, SignAlgo, HashAlgo], bytes, bytes]]
+) -> list[bool]:
+    global _worker_verifiers
+    if _worker_verifiers is None:
+        _worker_verifiers = VerifierCache()
+    results = []
+    for (public_key, sign_algo, hash_algo), signature, message in jobs:
+        verifier = _worker_verifiers.get(
+            public_key=public_key, sign_algo=sign_algo, hash_algo=hash_algo
+        )
+        results.append(verifier.verify_user_message(signature, message))
+    return results
+
+
+class UserSignatureVerifier(object):
+    """Verifies user message signatures locally, instead of running a script on the access node
+
+    The keys of an account are fetched once and cached for `account_ttl` seconds,
+    for up to `max_accounts` accounts (the least recently used account is evicted first).
+    A message is valid if all of its signatures are valid signatures of unrevoked keys of the account,
+    made with the user domain tag, and the weights of the keys add up to at least `AccountKey.weight_threshold`.
+    Unlike the script used by `verify_user_signature`, multiple signatures of the same key only count once.
+
+    `verify_batch` checks many messages at once, spread over a pool of worker processes.
+    The verifier can be used as an async context manager, which shuts down the worker processes on exit.
+
+    Attributes
+    ----------
+    client : AccessAPI
+        The client used to fetch the account keys.
+    account_ttl : float
+        Time for which fetched account keys are used.
+    max_accounts : int
+        Maximum number of accounts whose keys are cached.
+    max_workers : Optional[int]
+        Number of worker processes of `verify_batch`. Defaults to the number of CPUs.
+    chunk_size : int
+        Number of signatures sent to a worker process at a time.
+    """
+
+    def __init__(
+        self,
+        client: AccessAPI,
+        *,
+        account_ttl: Annotated[float, "seconds"] = 60.0,
+        max_accounts: int = 1024,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256,
+    ) -> None:
+        super().__init__()
+        self.client: AccessAPI = client
+        self.account_ttl: float = account_ttl
+        self.max_accounts: int = max_accounts
+        self.max_workers: Optional[int] = max_workers
+        self.chunk_size: int = chunk_size
+        self._accounts: LRUCache = LRUCache(max_accounts)
+        # concurrent lookups of the same account share one request
+        self._fetching: SingleFlight = SingleFlight()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def __aenter__(self) -> "UserSignatureVerifier":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def verify(
+        self, message: bytes, composite_signatures: list[CompositeSignature]
+    ) -> bool:
+        """Verify the signatures of a single message in the calling thread.
+
+        Parameters
+        ----------
+        message : bytes
+            The signed message.
+        composite_signatures : list[CompositeSignature]
+            Signatures of the message, all from the same account.
+
+        Returns
+        -------
+        bool
+            Whether the signatures are valid and have enough weight.
+        """
+        plan = await self._plan(message, composite_signatures)
+        if plan is None:
+            return False
+        jobs, weights = plan
+        return self._enough_weight(_verify_signatures(jobs), weights)
+
+    async def verify_batch(
+        self, batch: Iterable[tuple[bytes, list[CompositeSignature]]]
+    ) -> list[bool]:
+        """Verify the signatures of many messages in parallel, on a pool of worker processes.
+
+        Parameters
+        ----------
+        batch : Iterable[tuple[bytes, list[CompositeSignature]]]
+            Pairs of a message and its signatures.
+
+        Returns
+        -------
+        list[bool]
+            For each message, in order, whether its signatures are valid and have enough weight.
+        """
+        plans = await asyncio.gather(
+            *(self._plan(message, signatures) for message, signatures in batch)
+        )
+        jobs = [job for plan in plans if plan is not None for job in plan[0]]
+        if not jobs:
+            return [False for _ in plans]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor,
+                    _verify_signatures,
+                    jobs[i : i + self.chunk_size],
+                )
+                for i in range(0, len(jobs), self.chunk_size)
+            )
+        )
+        results = iter([valid for chunk in chunks for valid in chunk])
+
+        return [
+            plan is not None
+            and self._enough_weight([next(results) for _ in plan[0]], plan[1])
+            for plan in plans
+        ]
+
+    async def _plan(
+        self, message: bytes, composite_signatures: list[CompositeSignature]
+    ) -> Optional[tuple[list, list[int]]]:
+        # the signatures to check and the weights of their keys, or None if the signatures are invalid regardless
+        if len(composite_signatures) == 0:
+            return None
+        if any(x.addr != composite_signatures[0].addr for x in composite_signatures):
+            raise PySDKError("All signatures must be from the same address")
+
+        keys = await self._get_keys(
+            cadence.Address.from_hex(composite_signatures[0].addr)
+        )
+        jobs = []
+        weights = []
+        seen = set()
+        for s in composite_signatures:
+            key = keys.get(s.keyId)
+            if key is None or key.revoked:
+                return None
+            try:
+                signature = bytes.fromhex(s.signature.removeprefix("0x"))
+            except ValueError:
+                return None
+            jobs.append(
+                ((key.public_key, key.sign_algo, key.hash_algo), signature, message)
+            )
+            # a key only counts once towards the threshold, no matter how many times it signed
+            weights.append(0 if s.keyId in seen else key.weight)
+            seen.add(s.keyId)
+        return jobs, weights
+
+    @staticmethod
+    def _enough_weight(valid: list[bool], weights: list[int]) -> bool:
+        return all(valid) and sum(weights) >= AccountKey.weight_threshold
+
+    async def _get_keys(self, address: cadence.Address) -> dict[int, AccountKey]:
+        keys = self._accounts.get(address.bytes)
+        if keys is not None:
+            return keys
+        return await self._fetching.do(address.bytes, lambda: self._fetch_keys(address))
+
+    async def _fetch_keys(self, address: cadence.Address) -> dict[int, AccountKey]:
+        account = await self.client.get_account_at_latest_block(address=address.bytes)
+        keys = {k.index: k for k in account.keys}
+        self._accounts.put(address.bytes, keys, ttl=self.account_ttl)
+        return keys
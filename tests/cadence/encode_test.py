@@ -40,6 +40,7 @@ class TestEncode(unittest.TestCase):
     def _decode(self, actual_json: str, expected_val: cadence.Value):
         cadence_val = json.loads(actual_json, object_hook=cadence.cadence_object_hook)
         self.assertEqual(expected_val, cadence_val)
+        self.assertEqual(expected_val, cadence.decode_json(actual_json))
 
     def testEncodeOptional(self):
         self._encodeAndDecodeAll(
@@ -0,0 +1,79 @@
+import importlib.util
+import json
+import unittest
+
+from flow_py_sdk import cadence
+from flow_py_sdk.cadence.decode import decode
+from flow_py_sdk.cadence.json_backend import (
+    JsonBackend,
+    OrjsonBackend,
+    MsgspecBackend,
+)
+
+
+def _installed_backends() -> list[JsonBackend]:
+    backends = [JsonBackend()]
+    if importlib.util.find_spec("orjson") is not None:
+        backends.append(OrjsonBackend())
+    if importlib.util.find_spec("msgspec") is not None:
+        backends.append(MsgspecBackend())
+    return backends
+
+
+_values = [
+    cadence.Optional(None),
+    cadence.Bool(True),
+    cadence.String("".join(chr(i) for i in range(0x80))),
+    cadence.String("ünicode   \U0001f600 ﻿"),
+    cadence.Int(2**200),
+    cadence.Address.from_hex("0x01cf0e2f2f715450"),
+    cadence.Array([cadence.UFix64(123_405_600_000), cadence.Int8(-1)]),
+    cadence.Dictionary(
+        [cadence.KeyValuePair(cadence.String("a"), cadence.Optional(cadence.Int(1)))]
+    ),
+    cadence.Struct(
+        "A.01cf0e2f2f715450.Test.S",
+        [("a", cadence.String('"quoted"\\')), ("b", cadence.UInt64(2**64 - 1))],
+    ),
+    cadence.TypeValue(cadence.ConstantSizedArrayKind(cadence.StringKind(), 3)),
+]
+
+
+class TestJsonBackend(unittest.TestCase):
+    def testDumpsIsByteIdentical(self):
+        for backend in _installed_backends():
+            for value in _values:
+                with self.subTest(msg=f"{backend.name} {value}"):
+                    expected = json.dumps(
+                        value,
+                        ensure_ascii=False,
+                        cls=cadence.CadenceJsonEncoder,
+                        separators=(",", ":"),
+                    ).encode("utf-8")
+                    self.assertEqual(expected, backend.dumps(value))
+
+    def testDecodeJson(self):
+        for backend in _installed_backends():
+            for value in _values:
+                with self.subTest(msg=f"{backend.name} {value}"):
+                    self.assertEqual(value, decode(backend.loads(backend.dumps(value))))
+
+    def testLoadsInvalidJson(self):
+        for backend in _installed_backends():
+            with self.subTest(msg=backend.name):
+                with self.assertRaises(json.JSONDecodeError):
+                    backend.loads(b'{"type":')
+
+    def testSetJsonBackend(self):
+        previous = cadence.get_json_backend()
+        try:
+            self.assertEqual("json", cadence.set_json_backend("json").name)
+            self.assertEqual("json", cadence.get_json_backend().name)
+            self.assertEqual(
+                [b'{"type":"Int","value":"1"}'],
+                cadence.encode_arguments([cadence.Int(1)]),
+            )
+            with self.assertRaises(ValueError):
+                cadence.set_json_backend("unknown")
+        finally:
+            cadence.set_json_backend(previous.name)
@@ -0,0 +1,87 @@
+import asyncio
+import random
+import unittest
+
+from grpclib.client import Channel
+
+from flow_py_sdk import AccessAPI
+from flow_py_sdk.client import entities
+
+
+class _FakeBlocksAPI(AccessAPI):
+    def __init__(self):
+        super().__init__(Channel())
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.collection_requests: list[bytes] = []
+
+    async def get_block_by_height(self, *, height: int = 0) -> entities.Block:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(random.random() / 100)
+        self.in_flight -= 1
+        # every block has as many collections as its height modulo 3
+        guarantees = [
+            entities.CollectionGuarantee(bytes([height % 256, i]), [])
+            for i in range(height % 3)
+        ]
+        return entities.Block(
+            height.to_bytes(8, "big"), b"", height, None, guarantees, [], []
+        )
+
+    async def get_collection_by_i_d(self, *, id: bytes = b"") -> entities.Collection:
+        self.collection_requests.append(id)
+        await asyncio.sleep(random.random() / 100)
+        return entities.Collection(id, [id + b"tx"])
+
+
+class TestScanBlocks(unittest.IsolatedAsyncioTestCase):
+    async def test_scan_blocks_in_order(self):
+        client = _FakeBlocksAPI()
+
+        blocks = [
+            b
+            async for b in client.scan_blocks(
+                start_height=5, end_height=100, max_concurrency=4
+            )
+        ]
+
+        self.assertEqual(list(range(5, 101)), [b.height for b in blocks])
+        self.assertLessEqual(client.max_in_flight, 4)
+        self.assertGreater(client.max_in_flight, 1)
+        self.assertTrue(all(b.collections is None for b in blocks))
+        self.assertEqual([], client.collection_requests)
+
+    async def test_scan_blocks_with_collections(self):
+        client = _FakeBlocksAPI()
+
+        blocks = [
+            b
+            async for b in client.scan_blocks(
+                start_height=0, end_height=20, include_collections=True
+            )
+        ]
+
+        for block in blocks:
+            self.assertEqual(
+                [g.collection_id for g in block.collection_guarantees],
+                [c.id for c in block.collections],
+            )
+        self.assertEqual(21, len(client.collection_requests))
+
+    async def test_slow_consumer_limits_fetching(self):
+        client = _FakeBlocksAPI()
+        fetched = []
+        original = client.get_block_by_height
+
+        async def get_block_by_height(*, height: int = 0):
+            fetched.append(height)
+            return await original(height=height)
+
+        client.get_block_by_height = get_block_by_height
+        blocks = client.scan_blocks(start_height=0, end_height=1000, max_concurrency=3)
+
+        await blocks.__anext__()
+        await asyncio.sleep(0.05)
+        self.assertLessEqual(len(fetched), 4)
+        await blocks.aclose()
@@ -0,0 +1,229 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from flow_py_sdk import (
+    AccessAPI,
+    AccountCache,
+    ImmutableCache,
+    SQLiteStore,
+    Script,
+    ScriptResultCache,
+    cadence,
+)
+from flow_py_sdk.client import entities
+from flow_py_sdk.client.cache import MemoryStore
+from flow_py_sdk.proto.flow.access import (
+    AccessAPIStub,
+    AccountResponse,
+    BlockResponse,
+    ExecuteScriptResponse,
+    TransactionResponse,
+)
+from flow_py_sdk.proto.flow.entities import Account, Block, Transaction
+
+
+class TestAccountCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = AccessAPI(mock.MagicMock())
+        self.client.account_cache = AccountCache(latest_ttl=60.0)
+        self.address = bytes.fromhex("01cf0e2f2f715450")
+        self.response = AccountResponse(account=Account(address=self.address))
+
+    async def test_caches_account_at_block_height(self):
+        with mock.patch.object(
+            AccessAPIStub,
+            "get_account_at_block_height",
+            mock.AsyncMock(return_value=self.response),
+        ) as get:
+            first = await self.client.get_account_at_block_height(
+                address=self.address, block_height=5
+            )
+            second = await self.client.get_account_at_block_height(
+                address="01cf0e2f2f715450", block_height=5
+            )
+            await self.client.get_account_at_block_height(
+                address=self.address, block_height=6
+            )
+
+        self.assertIsInstance(first, entities.Account)
+        self.assertIs(first, second)
+        self.assertEqual(2, get.await_count)
+        self.assertEqual(1, self.client.account_cache.hits)
+
+    async def test_latest_account_expires(self):
+        with mock.patch.object(
+            AccessAPIStub,
+            "get_account_at_latest_block",
+            mock.AsyncMock(return_value=self.response),
+        ) as get:
+            await self.client.get_account_at_latest_block(address=self.address)
+            await self.client.get_account_at_latest_block(address=self.address)
+            self.assertEqual(1, get.await_count)
+
+            self.client.account_cache.latest_ttl = 0.0
+            self.client.account_cache.clear()
+            await self.client.get_account_at_latest_block(address=self.address)
+            await self.client.get_account_at_latest_block(address=self.address)
+            self.assertEqual(3, get.await_count)
+
+    async def test_fresh_latest_account(self):
+        with mock.patch.object(
+            AccessAPIStub,
+            "get_account_at_latest_block",
+            mock.AsyncMock(return_value=self.response),
+        ) as get:
+            await self.client.get_account_at_latest_block(address=self.address)
+            fresh = await self.client.get_account_at_latest_block(
+                address=self.address, use_cache=False
+            )
+            cached = await self.client.get_account_at_latest_block(address=self.address)
+
+        self.assertEqual(2, get.await_count)
+        self.assertIs(fresh, cached)
+
+    async def test_no_cache_by_default(self):
+        self.client.account_cache = None
+        with mock.patch.object(
+            AccessAPIStub,
+            "get_account_at_block_height",
+            mock.AsyncMock(return_value=self.response),
+        ) as get:
+            await self.client.get_account_at_block_height(
+                address=self.address, block_height=5
+            )
+            await self.client.get_account_at_block_height(
+                address=self.address, block_height=5
+            )
+        self.assertEqual(2, get.await_count)
+
+
+class TestImmutableCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = AccessAPI(mock.MagicMock())
+        self.client.immutable_cache = ImmutableCache()
+        self.block = Block(id=b"\x01" * 32, parent_id=b"\x02" * 32, height=42)
+
+    async def test_caches_blocks_by_id_and_height(self):
+        with mock.patch.object(
+            AccessAPIStub,
+            "get_block_by_height",
+            mock.AsyncMock(return_value=BlockResponse(block=self.block)),
+        ) as get_by_height, mock.patch.object(
+            AccessAPIStub, "get_block_by_i_d", mock.AsyncMock()
+        ) as get_by_id:
+            first = await self.client.get_block_by_height(height=42)
+            by_height = await self.client.get_block_by_height(height=42)
+            by_id = await self.client.get_block_by_i_d(id=self.block.id)
+
+        self.assertEqual(1, get_by_height.await_count)
+        self.assertEqual(0, get_by_id.await_count)
+        for block in [first, by_height, by_id]:
+            self.assertIsInstance(block, entities.Block)
+            self.assertEqual(self.block.id, block.id)
+            self.assertEqual(42, block.height)
+        self.assertEqual(
+            (2, 1),
+            (self.client.immutable_cache.hits, self.client.immutable_cache.misses),
+        )
+
+    async def test_caches_transactions(self):
+        transaction = Transaction(script=b"transaction {}", gas_limit=100)
+        with mock.patch.object(
+            AccessAPIStub,
+            "get_transaction",
+            mock.AsyncMock(return_value=TransactionResponse(transaction=transaction)),
+        ) as get:
+            first = await self.client.get_transaction(id=b"\x03" * 32)
+            second = await self.client.get_transaction(id=b"\x03" * 32)
+
+        self.assertEqual(1, get.await_count)
+        self.assertEqual(first.script, second.script)
+        self.assertEqual(100, second.gas_limit)
+
+    def test_kinds_do_not_collide(self):
+        cache = ImmutableCache(MemoryStore())
+        cache.put(self.block, id=self.block.id, height=self.block.height)
+
+        self.assertIsNone(cache.get(Transaction, id=self.block.id))
+        self.assertIsNone(cache.get(Block, height=43))
+        self.assertEqual(self.block, cache.get(Block, height=42))
+
+    def test_sqlite_store_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.db")
+            cache = ImmutableCache(SQLiteStore(path))
+            cache.put(self.block, id=self.block.id, height=self.block.height)
+            cache.close()
+
+            cache = ImmutableCache(SQLiteStore(path))
+            self.assertEqual(self.block, cache.get(Block, id=self.block.id))
+            self.assertEqual(self.block, cache.get(Block, height=42))
+            self.assertEqual(2, len(cache.store))
+            cache.close()
+
+
+class TestScriptResultCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = AccessAPI(mock.MagicMock())
+        self.client.script_cache = ScriptResultCache()
+        self.response = ExecuteScriptResponse(value=b'{"type":"Int","value":"7"}')
+
+    def _script(self, argument: int = 1) -> Script:
+        return Script(
+            code="pub fun main(a: Int): Int { return a }",
+            arguments=[cadence.Int(argument)],
+        )
+
+    async def test_caches_results_at_block(self):
+        with mock.patch.object(
+            AccessAPIStub,
+            "execute_script_at_block_height",
+            mock.AsyncMock(return_value=self.response),
+        ) as execute:
+            first = await self.client.execute_script(self._script(), at_block_height=5)
+            second = await self.client.execute_script(self._script(), at_block_height=5)
+            await self.client.execute_script(self._script(2), at_block_height=5)
+            await self.client.execute_script(self._script(), at_block_height=6)
+
+        self.assertEqual(cadence.Int(7), first)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(3, execute.await_count)
+
+    async def test_latest_block_is_not_cached(self):
+        with mock.patch.object(
+            AccessAPIStub,
+            "execute_script_at_latest_block",
+            mock.AsyncMock(return_value=self.response),
+        ) as execute:
+            await self.client.execute_script(self._script())
+            await self.client.execute_script(self._script())
+
+        self.assertEqual(2, execute.await_count)
+        self.assertEqual(0, len(self.client.script_cache))
+
+    def test_block_id_and_height_keys_differ(self):
+        key = ScriptResultCache.key
+        self.assertNotEqual(
+            key(b"code", [b"1"], block_height=1), key(b"code", [b"1"], block_id=b"1")
+        )
+        self.assertNotEqual(
+            key(b"code", [b"1", b"2"], block_height=1),
+            key(b"code", [b"12"], block_height=1),
+        )
+
+    def test_evicts_by_size(self):
+        cache = ScriptResultCache(max_bytes=10)
+        cache.put(b"a", b"12345")
+        cache.put(b"b", b"12345")
+        cache.put(b"c", b"123")
+        cache.put(b"d", b"12345678901")
+
+        self.assertIsNone(cache.get(b"a"))
+        self.assertEqual(b"12345", cache.get(b"b"))
+        self.assertIsNone(cache.get(b"d"))
+        self.assertEqual(8, cache.size_bytes)
+        cache.put(b"b", b"1")
+        self.assertEqual(4, cache.size_bytes)
@@ -0,0 +1,47 @@
+import json
+import unittest
+from unittest import mock
+
+from flow_py_sdk import cadence
+from flow_py_sdk.client import entities
+
+_event_payload = b"""{
+  "type": "Event",
+  "value": {
+    "id": "S.test.FooEvent",
+    "fields": [
+      { "name": "a", "value": { "type": "Int", "value": "1" } },
+      { "name": "b", "value": { "type": "String", "value": "foo" } }
+    ]
+  }
+}"""
+
+
+class TestEvent(unittest.TestCase):
+    def test_payload_is_decoded_lazily(self):
+        with mock.patch(
+            "flow_py_sdk.client.entities.decode_json", wraps=cadence.decode_json
+        ) as decode_json:
+            event = entities.Event("S.test.FooEvent", b"", 0, 0, _event_payload)
+            decode_json.assert_not_called()
+
+            value = event.value
+            self.assertIs(value, event.value)
+            decode_json.assert_called_once()
+
+        self.assertEqual(
+            cadence.Event(
+                "S.test.FooEvent", [("a", cadence.Int(1)), ("b", cadence.String("foo"))]
+            ),
+            value,
+        )
+
+    def test_invalid_payload_fails_on_access(self):
+        event = entities.Event("S.test.FooEvent", b"", 0, 0, b"not json")
+
+        with self.assertRaises(json.JSONDecodeError):
+            _ = event.value
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import random
+import unittest
+
+from grpclib.client import Channel
+
+from flow_py_sdk import AccessAPI
+from flow_py_sdk.client import entities
+
+
+class _FakeEventsAPI(AccessAPI):
+    def __init__(self):
+        super().__init__(Channel())
+        self.requests: list[tuple[str, int, int]] = []
+        self.sealed_height = 0
+
+    async def get_latest_block_header(self, *, is_sealed: bool = False):
+        # a new block gets sealed every time the header is requested
+        self.sealed_height += 1
+        return entities.BlockHeader(b"", b"", self.sealed_height, None)
+
+    async def get_events_for_height_range(
+        self, *, type: str = "", start_height: int = 0, end_height: int = 0
+    ) -> list[entities.EventsResponseResult]:
+        self.requests.append((type, start_height, end_height))
+        await asyncio.sleep(random.random() / 100)
+        # every type has an event in every transaction its index divides
+        type_index = int(type.split(".")[-1])
+        results = [
+            entities.EventsResponseResult(
+                height.to_bytes(8, "big"),
+                height,
+                [
+                    entities.Event(type, b"", tx_index, event_index, b"{}")
+                    for tx_index in range(0, 6, type_index)
+                    for event_index in range(type_index, type_index + 2)
+                ],
+                None,
+            )
+            for height in range(start_height, end_height + 1)
+        ]
+        random.shuffle(results)
+        return results
+
+
+class TestScanEvents(unittest.IsolatedAsyncioTestCase):
+    async def test_scan_events(self):
+        client = _FakeEventsAPI()
+
+        results = [
+            r
+            async for r in client.scan_events(
+                type="A.Event.1", start_height=10, end_height=1000
+            )
+        ]
+
+        self.assertEqual(list(range(10, 1001)), [r.block_height for r in results])
+        self.assertTrue(all(end - start < 250 for (_, start, end) in client.requests))
+        self.assertEqual(4, len(client.requests))
+
+    async def test_scan_multiple_event_types(self):
+        client = _FakeEventsAPI()
+        types = ["A.Event.1", "A.Event.2", "A.Event.3"]
+
+        results = [
+            r
+            async for r in client.scan_events(
+                type=types, start_height=0, end_height=300, chunk_size=100
+            )
+        ]
+
+        self.assertEqual(list(range(0, 301)), [r.block_height for r in results])
+        self.assertEqual(12, len(client.requests))
+        for result in results:
+            order = [(e.transaction_index, e.event_index) for e in result.events]
+            self.assertEqual(sorted(order), order)
+            self.assertEqual({e.type for e in result.events}, set(types))
+            self.assertEqual(12 + 6 + 4, len(result.events))
+
+
+class TestFollowEvents(unittest.IsolatedAsyncioTestCase):
+    async def test_follow_and_resume(self):
+        client = _FakeEventsAPI()
+        client.sealed_height = 20
+
+        follower = client.follow_events("A.Event.1", 5, min_interval=0.001)
+        heights = []
+        async for result in follower:
+            heights.append(result.block_height)
+            if result.block_height == 30:
+                break
+
+        self.assertEqual(list(range(5, 31)), heights)
+        self.assertEqual(29, follower.checkpoint)
+
+        resumed = client.follow_events(
+            "A.Event.1", follower.checkpoint + 1, min_interval=0.001
+        )
+        async for result in resumed:
+            self.assertEqual(30, result.block_height)
+            break
+
+
+if __name__ == "__main__":
+    unittest.main()
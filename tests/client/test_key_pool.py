@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+
+from flow_py_sdk import (
+    AccountKey,
+    HashAlgo,
+    ProposerKeyPool,
+    PySDKError,
+    SignAlgo,
+    TransactionPipeline,
+    Tx,
+)
+from flow_py_sdk.cadence import Address
+from flow_py_sdk.client import entities
+from tests.fixtures import SequenceNumberClient, new_signer
+
+
+class _FakeAccountClient(object):
+    def __init__(self, sequence_numbers: dict[int, int], revoked: bool = False):
+        self.sequence_numbers = sequence_numbers
+        self.revoked = revoked
+        self.account_requests = 0
+
+    async def get_account_at_latest_block(
+        self, *, address: bytes, use_cache: bool = True
+    ) -> entities.Account:
+        self.account_requests += 1
+        keys = []
+        for index, sequence_number in self.sequence_numbers.items():
+            key = AccountKey(
+                public_key=b"",
+                sign_algo=SignAlgo.ECDSA_P256,
+                hash_algo=HashAlgo.SHA3_256,
+            )
+            key.index = index
+            key.sequence_number = sequence_number
+            key.revoked = self.revoked
+            keys.append(key)
+        return entities.Account(address, 0, b"", keys, {})
+
+
+def _pool(client, key_ids: list[int]) -> ProposerKeyPool:
+    signer = new_signer()
+    return ProposerKeyPool(
+        client,
+        address=Address.from_hex("01"),
+        keys=[(key_id, signer) for key_id in key_ids],
+    )
+
+
+class TestProposerKeyPool(unittest.IsolatedAsyncioTestCase):
+    async def test_lease_and_release(self):
+        client = _FakeAccountClient({0: 5, 1: 7})
+        pool = _pool(client, [0, 1])
+
+        first = await pool.lease()
+        second = await pool.lease()
+        self.assertEqual(
+            {(0, 5), (1, 7)}, {(l.key_id, l.sequence_number) for l in [first, second]}
+        )
+        self.assertEqual(1, client.account_requests)
+
+        waiting = asyncio.ensure_future(pool.lease())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+
+        pool.release(first)
+        third = await waiting
+        self.assertEqual(first.key_id, third.key_id)
+        self.assertEqual(first.sequence_number + 1, third.sequence_number)
+
+        pool.release(second, used=False)
+        fourth = await pool.lease()
+        self.assertEqual(second.sequence_number, fourth.sequence_number)
+
+    async def test_invalidate(self):
+        client = _FakeAccountClient({0: 5})
+        pool = _pool(client, [0])
+
+        pool.release(await pool.lease())
+        pool.invalidate(0)
+        client.sequence_numbers[0] = 9
+
+        lease = await pool.lease()
+        self.assertEqual(9, lease.sequence_number)
+        self.assertEqual(2, client.account_requests)
+
+    async def test_missing_or_revoked_key(self):
+        with self.subTest(msg="Missing key"):
+            pool = _pool(_FakeAccountClient({0: 5}), [1])
+            with self.assertRaises(PySDKError):
+                await pool.lease()
+
+        with self.subTest(msg="Revoked key"):
+            pool = _pool(_FakeAccountClient({0: 5}, revoked=True), [0])
+            with self.assertRaises(PySDKError):
+                await pool.lease()
+
+    async def test_pipeline_with_key_pool(self):
+        client = SequenceNumberClient(sequence_number=0, reported_sequence_numbers=[0])
+        pool = _pool(client, [0])
+        pipeline = TransactionPipeline(client, key_pool=pool, max_in_flight=5)
+        txs = [Tx(code="transaction {}") for _ in range(4)]
+
+        results = [r async for r in pipeline.submit(txs)]
+
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertEqual(4, client.sequence_number)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from flow_py_sdk import (
+    TransactionPipeline,
+    TransactionError,
+    Tx,
+)
+from flow_py_sdk.cadence import Address
+from tests.fixtures import SequenceNumberClient, new_signer
+
+
+class TestTransactionPipeline(unittest.IsolatedAsyncioTestCase):
+    async def _submit(self, client, txs, **kwargs):
+        pipeline = TransactionPipeline(
+            client,
+            proposer=Address.from_hex("01"),
+            key_id=0,
+            signer=new_signer(),
+            **kwargs,
+        )
+        return [r async for r in pipeline.submit(txs)]
+
+    async def test_assigns_sequence_numbers(self):
+        client = SequenceNumberClient(sequence_number=5, reported_sequence_numbers=[5])
+        txs = [Tx(code="transaction {}") for _ in range(10)]
+
+        results = await self._submit(client, txs, max_in_flight=3)
+
+        self.assertEqual(10, len(results))
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertEqual(15, client.sequence_number)
+        self.assertEqual(3, client.max_in_flight)
+        # the reference block is fetched once for all of the transactions
+        self.assertEqual(1, client.header_requests)
+        self.assertTrue(all(tx.reference_block_id == b"\x01" * 32 for tx in txs))
+        self.assertEqual(
+            list(range(5, 15)),
+            sorted(tx.proposal_key.key_sequence_number for tx in txs),
+        )
+
+    async def test_resyncs_on_sequence_number_mismatch(self):
+        client = SequenceNumberClient(
+            sequence_number=5, reported_sequence_numbers=[3, 5]
+        )
+        txs = [Tx(code="transaction {}")]
+
+        results = await self._submit(client, txs)
+
+        self.assertIsNone(results[0].error)
+        self.assertEqual(6, client.sequence_number)
+        self.assertEqual(5, txs[0].proposal_key.key_sequence_number)
+        self.assertEqual(1, len(txs[0].envelope_signatures))
+
+    async def test_gives_up_after_max_resubmits(self):
+        client = SequenceNumberClient(
+            sequence_number=5, reported_sequence_numbers=[3, 3, 3]
+        )
+        txs = [Tx(code="transaction {}")]
+
+        results = await self._submit(client, txs, max_resubmits=1)
+
+        self.assertIsInstance(results[0].error, TransactionError)
+
+
+if __name__ == "__main__":
+    unittest.main()
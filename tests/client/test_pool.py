@@ -0,0 +1,229 @@
+import asyncio
+import unittest
+from typing import Optional
+
+from grpclib.const import Cardinality, Handler, Status
+from grpclib.exceptions import GRPCError
+from grpclib.server import Server
+
+from flow_py_sdk import ChannelPool, Hedging, pooled_flow_client
+from flow_py_sdk.proto.flow.access import (
+    BlockHeaderResponse,
+    GetLatestBlockHeaderRequest,
+)
+from flow_py_sdk.proto.flow.entities import BlockHeader
+
+
+class _FakeAccessNode(object):
+    # Serves GetLatestBlockHeader, with a configurable delay and failure.
+
+    def __init__(self, height: int, delay: float = 0.0) -> None:
+        self.height = height
+        self.delay = delay
+        self.error: Optional[Status] = None
+        self.calls = 0
+        self.server: Optional[Server] = None
+        self.port = 0
+
+    async def get_latest_block_header(self, stream) -> None:
+        await stream.recv_message()
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise GRPCError(self.error)
+        await stream.send_message(
+            BlockHeaderResponse(block=BlockHeader(height=self.height))
+        )
+
+    def __mapping__(self):
+        return {
+            "/flow.access.AccessAPI/GetLatestBlockHeader": Handler(
+                self.get_latest_block_header,
+                Cardinality.UNARY_UNARY,
+                GetLatestBlockHeaderRequest,
+                BlockHeaderResponse,
+            )
+        }
+
+    async def start(self) -> None:
+        self.server = Server([self])
+        await self.server.start("127.0.0.1", 0)
+        self.port = self.server._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class TestChannelPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.fast = _FakeAccessNode(1)
+        self.slow = _FakeAccessNode(2, delay=0.05)
+        await self.fast.start()
+        await self.slow.start()
+        self.client = pooled_flow_client(
+            [("127.0.0.1", self.fast.port), ("127.0.0.1", self.slow.port)],
+            max_failures=2,
+            cooldown=60.0,
+        )
+        self.pool: ChannelPool = self.client.channel
+
+    async def asyncTearDown(self) -> None:
+        self.pool.close()
+        await self.fast.stop()
+        await self.slow.stop()
+
+    async def test_prefers_lower_latency(self):
+        for _ in range(10):
+            await self.client.get_latest_block_header()
+
+        fast, slow = self.pool.endpoints
+        self.assertEqual(1, self.slow.calls)
+        self.assertEqual(9, self.fast.calls)
+        self.assertLess(fast.latency, slow.latency)
+
+    async def test_spreads_concurrent_calls_before_measuring(self):
+        self.fast.delay = 0.02
+        self.slow.delay = 0.02
+        await asyncio.gather(
+            *[self.client.get_latest_block_header() for _ in range(10)]
+        )
+
+        self.assertEqual((5, 5), (self.fast.calls, self.slow.calls))
+
+    async def test_unmeasured_endpoint_is_probed_one_call_at_a_time(self):
+        fast, slow = self.pool.endpoints
+        fast.latency = 0.01
+        slow.in_flight = 1
+
+        # the probe of slow is assumed to take as long as the average measured call
+        self.assertIs(fast, self.pool.select())
+        fast.in_flight = 1
+        self.assertIs(fast, self.pool.select())
+        fast.in_flight = 2
+        self.assertIs(slow, self.pool.select())
+        slow.in_flight = 0
+        fast.in_flight = 0
+        self.assertIs(slow, self.pool.select())
+
+    async def test_ejects_failing_endpoint(self):
+        self.fast.error = Status.UNAVAILABLE
+        errors = 0
+        heights = []
+        for _ in range(6):
+            try:
+                heights.append((await self.client.get_latest_block_header()).height)
+            except GRPCError:
+                errors += 1
+
+        fast, _ = self.pool.endpoints
+        self.assertEqual(2, errors)
+        self.assertEqual(2, self.fast.calls)
+        self.assertEqual([2, 2, 2, 2], heights)
+        self.assertGreater(fast.ejected_until, 0)
+
+    async def test_request_errors_do_not_eject(self):
+        self.fast.error = Status.NOT_FOUND
+        errors = 0
+        for _ in range(6):
+            try:
+                await self.client.get_latest_block_header()
+            except GRPCError:
+                errors += 1
+
+        fast, _ = self.pool.endpoints
+        self.assertEqual(5, errors)
+        self.assertEqual(5, self.fast.calls)
+        self.assertEqual(0.0, fast.ejected_until)
+        self.assertEqual(0.0, fast.error_rate)
+
+    async def test_uses_ejected_endpoints_if_all_are_ejected(self):
+        self.fast.error = Status.UNAVAILABLE
+        self.slow.error = Status.UNAVAILABLE
+        for _ in range(4):
+            with self.assertRaises(GRPCError):
+                await self.client.get_latest_block_header()
+
+        self.fast.error = None
+        self.slow.error = None
+        self.assertIn((await self.client.get_latest_block_header()).height, [1, 2])
+
+    def test_requires_endpoints(self):
+        with self.assertRaises(ValueError):
+            ChannelPool([])
+
+
+class TestHedging(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.slow = _FakeAccessNode(1, delay=0.5)
+        self.fast = _FakeAccessNode(2)
+        await self.slow.start()
+        await self.fast.start()
+        self.client = pooled_flow_client(
+            [("127.0.0.1", self.slow.port), ("127.0.0.1", self.fast.port)]
+        )
+        self.pool: ChannelPool = self.client.channel
+        self.pool.hedging = Hedging(default_delay=0.02)
+
+    async def asyncTearDown(self) -> None:
+        self.pool.close()
+        await self.slow.stop()
+        await self.fast.stop()
+
+    async def test_slow_call_is_hedged(self):
+        header = await self.client.get_latest_block_header()
+
+        slow, _ = self.pool.endpoints
+        self.assertEqual(2, header.height)
+        self.assertEqual((1, 1), (self.slow.calls, self.fast.calls))
+        hedging = self.pool.hedging
+        self.assertEqual(
+            (1, 1, 1), (hedging.requests, hedging.hedged, hedging.hedge_wins)
+        )
+        # the losing call was cancelled
+        self.assertEqual(0, slow.in_flight)
+        self.assertIsNone(slow.latency)
+
+    async def test_fast_call_is_not_hedged(self):
+        self.slow.delay = 0.0
+        # well above the latency of a call, even on a loaded machine
+        self.pool.hedging.default_delay = 0.5
+        header = await self.client.get_latest_block_header()
+
+        self.assertEqual(1, header.height)
+        self.assertEqual(0, self.fast.calls)
+        self.assertEqual(0, self.pool.hedging.hedged)
+
+    async def test_errors_are_raised_when_all_calls_fail(self):
+        self.slow.error = Status.NOT_FOUND
+        self.fast.error = Status.NOT_FOUND
+        with self.assertRaises(GRPCError):
+            await self.client.get_latest_block_header()
+        self.assertEqual(1, self.pool.hedging.hedged)
+
+    def test_send_transaction_is_not_hedged(self):
+        stream = self.pool.request(
+            "/flow.access.AccessAPI/SendTransaction",
+            Cardinality.UNARY_UNARY,
+            GetLatestBlockHeaderRequest,
+            BlockHeaderResponse,
+        )
+        self.assertIs(self.pool.endpoints[0], stream._endpoint)
+
+
+class TestHedgingDelay(unittest.TestCase):
+    def test_percentile_delay(self):
+        hedging = Hedging(0.9, window=100, min_samples=10, default_delay=1.0)
+        for i in range(9):
+            hedging.record("a", i / 100)
+        self.assertEqual(1.0, hedging.delay("a"))
+        self.assertEqual(1.0, hedging.delay("b"))
+
+        for i in range(9, 200):
+            hedging.record("a", i / 100)
+        # the window holds the last 100 latencies: 1.00 .. 1.99
+        self.assertAlmostEqual(1.89, hedging.delay("a"))
+
+    def test_invalid_percentile(self):
+        with self.assertRaises(ValueError):
+            Hedging(1.0)
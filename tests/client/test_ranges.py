@@ -0,0 +1,55 @@
+import asyncio
+import random
+import unittest
+
+from flow_py_sdk.client.ranges import height_chunks, ordered_fetch
+
+
+class TestHeightChunks(unittest.TestCase):
+    def test_height_chunks(self):
+        cases = [
+            ("Single block", (5, 5, 250), [(5, 5)]),
+            ("Exact chunk", (0, 249, 250), [(0, 249)]),
+            ("Partial last chunk", (0, 250, 250), [(0, 249), (250, 250)]),
+            ("Small chunks", (10, 17, 3), [(10, 12), (13, 15), (16, 17)]),
+            ("Empty range", (10, 9, 3), []),
+        ]
+        for name, args, expected in cases:
+            with self.subTest(msg=name):
+                self.assertEqual(expected, list(height_chunks(*args)))
+
+
+class TestOrderedFetch(unittest.IsolatedAsyncioTestCase):
+    async def test_preserves_order_and_bounds_concurrency(self):
+        running = 0
+        max_running = 0
+
+        async def fetch(key: int) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(random.random() / 100)
+            running -= 1
+            return key * 2
+
+        results = [r async for r in ordered_fetch(range(20), fetch, 4)]
+
+        self.assertEqual([k * 2 for k in range(20)], results)
+        self.assertLessEqual(max_running, 4)
+
+    async def test_backpressure(self):
+        started = []
+
+        async def fetch(key: int) -> int:
+            started.append(key)
+            return key
+
+        stream = ordered_fetch(range(100), fetch, 3)
+        self.assertEqual(0, await stream.__anext__())
+        await asyncio.sleep(0.01)
+        self.assertLessEqual(len(started), 4)
+        await stream.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
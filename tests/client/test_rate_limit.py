@@ -0,0 +1,118 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import betterproto
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from flow_py_sdk import AccessAPI, MethodLimits, RateLimiter
+from flow_py_sdk.client import TokenBucket
+from flow_py_sdk.proto.flow.access import BlockHeaderResponse
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    async def test_limits_rate_after_burst(self):
+        bucket = TokenBucket(100, burst=5)
+        start = time.monotonic()
+        for _ in range(15):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 5 calls of burst, then 10 calls at 100/s
+        self.assertGreater(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
+    async def test_throttling_reduces_rate(self):
+        bucket = TokenBucket(100, min_rate=30, recovery=0.1)
+        bucket.on_throttled()
+        self.assertEqual(50, bucket.rate)
+        bucket.on_throttled()
+        bucket.on_throttled()
+        self.assertEqual(30, bucket.rate)
+        self.assertEqual(3, bucket.throttled)
+
+        for _ in range(3):
+            bucket.on_success()
+        self.assertAlmostEqual(60, bucket.rate)
+        for _ in range(10):
+            bucket.on_success()
+        self.assertEqual(100, bucket.rate)
+
+    async def test_throttling_pauses(self):
+        bucket = TokenBucket(1000, burst=10)
+        bucket.on_throttled(retry_after=0.1)
+        start = time.monotonic()
+        await bucket.acquire()
+        self.assertGreater(time.monotonic() - start, 0.09)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_limits_concurrency_per_method(self):
+        limiter = RateLimiter(
+            MethodLimits(max_in_flight=2), methods={"Ping": MethodLimits()}
+        )
+        in_flight = {"A": 0, "Ping": 0}
+        max_in_flight = {"A": 0, "Ping": 0}
+
+        async def call(method):
+            in_flight[method] += 1
+            max_in_flight[method] = max(max_in_flight[method], in_flight[method])
+            await asyncio.sleep(0.01)
+            in_flight[method] -= 1
+
+        await asyncio.gather(
+            *[
+                limiter.run(f"/flow.access.AccessAPI/{m}", lambda m=m: call(m))
+                for m in ["A", "Ping"] * 5
+            ]
+        )
+        self.assertEqual({"A": 2, "Ping": 5}, max_in_flight)
+
+    async def test_resource_exhausted_feeds_back(self):
+        limiter = RateLimiter(MethodLimits(1000))
+
+        async def throttled():
+            raise GRPCError(Status.RESOURCE_EXHAUSTED)
+
+        async def not_found():
+            raise GRPCError(Status.NOT_FOUND)
+
+        for call in [throttled, not_found]:
+            with self.assertRaises(GRPCError):
+                await limiter.run("/flow.access.AccessAPI/GetBlockByHeight", call)
+
+        bucket = limiter.bucket("GetBlockByHeight")
+        self.assertEqual(1, bucket.throttled)
+        self.assertEqual(500, bucket.rate)
+        self.assertIsNone(RateLimiter().bucket("GetBlockByHeight"))
+
+    async def test_access_api_calls_are_limited(self):
+        client = AccessAPI(mock.MagicMock())
+        client.rate_limiter = RateLimiter(MethodLimits(max_in_flight=1))
+        in_flight = 0
+        max_in_flight = 0
+
+        async def unary_unary(stub, route, request, response_type, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return BlockHeaderResponse()
+
+        with mock.patch.object(
+            betterproto.ServiceStub, "_unary_unary", autospec=True
+        ) as stub_call:
+            stub_call.side_effect = unary_unary
+            await asyncio.gather(
+                *[client.get_block_header_by_height(height=h) for h in range(4)]
+            )
+
+        self.assertEqual(4, stub_call.call_count)
+        self.assertEqual(1, max_in_flight)
@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import betterproto
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+from grpclib.metadata import Deadline
+
+from flow_py_sdk import AccessAPI, RetryPolicy
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(initial_backoff=0.001, max_backoff=0.002, **kwargs)
+
+
+class TestRetryPolicy(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_transient_errors(self):
+        policy = _policy()
+        errors = [GRPCError(Status.UNAVAILABLE), ConnectionResetError()]
+
+        async def call(deadline):
+            if errors:
+                raise errors.pop(0)
+            return "done"
+
+        self.assertEqual("done", await policy.run("/flow.access.AccessAPI/A", call))
+        self.assertEqual((1, 2, 0), (policy.calls, policy.retries, policy.failures))
+        self.assertEqual({"A": 2}, policy.retries_by_method)
+
+    async def test_does_not_retry_other_errors(self):
+        policy = _policy()
+        call = mock.AsyncMock(side_effect=GRPCError(Status.NOT_FOUND))
+
+        with self.assertRaises(GRPCError):
+            await policy.run("/flow.access.AccessAPI/A", call)
+        self.assertEqual(1, call.await_count)
+        self.assertEqual(0, policy.failures)
+
+    async def test_gives_up_after_max_attempts(self):
+        policy = _policy(max_attempts=3)
+        call = mock.AsyncMock(side_effect=GRPCError(Status.UNAVAILABLE))
+
+        with self.assertRaises(GRPCError):
+            await policy.run("/flow.access.AccessAPI/A", call)
+        self.assertEqual(3, call.await_count)
+        self.assertEqual((2, 1), (policy.retries, policy.failures))
+
+    async def test_stops_at_deadline(self):
+        policy = RetryPolicy(100, initial_backoff=0.01, max_backoff=0.01, timeout=0.1)
+        deadlines = []
+
+        async def call(deadline):
+            deadlines.append(deadline)
+            raise GRPCError(Status.UNAVAILABLE)
+
+        with self.assertRaises(GRPCError):
+            await asyncio.wait_for(policy.run("/flow.access.AccessAPI/A", call), 1)
+        self.assertLess(len(deadlines), 100)
+        self.assertEqual(1, len(set(id(d) for d in deadlines)))
+        self.assertEqual(1, policy.failures)
+
+    async def test_uses_earlier_deadline(self):
+        policy = _policy(timeout=100)
+        deadline = Deadline.from_timeout(1)
+        call = mock.AsyncMock(return_value="done")
+
+        await policy.run("/flow.access.AccessAPI/A", call, deadline)
+        call.assert_awaited_once_with(deadline)
+
+    def test_backoff_is_jittered_and_bounded(self):
+        policy = RetryPolicy(initial_backoff=1, max_backoff=4, multiplier=2)
+        backoffs = [policy.backoff(r) for r in range(10) for _ in range(20)]
+        self.assertTrue(all(0 <= b <= 4 for b in backoffs))
+        self.assertGreater(len(set(backoffs)), 1)
+        self.assertTrue(all(policy.backoff(0) <= 1 for _ in range(20)))
+
+
+class TestAccessAPIRetries(unittest.IsolatedAsyncioTestCase):
+    async def _run(self, client, call, failures: int):
+        async def unary_unary(stub, route, request, response_type, **kwargs):
+            if stub_call.call_count <= failures:
+                raise GRPCError(Status.UNAVAILABLE)
+            return response_type()
+
+        with mock.patch.object(
+            betterproto.ServiceStub, "_unary_unary", autospec=True
+        ) as stub_call:
+            stub_call.side_effect = unary_unary
+            try:
+                await call()
+            except GRPCError:
+                pass
+        return stub_call.call_count
+
+    async def test_retries_reads(self):
+        client = AccessAPI(mock.MagicMock())
+        client.retry_policy = _policy()
+        count = await self._run(
+            client, lambda: client.get_block_header_by_height(height=1), 2
+        )
+        self.assertEqual(3, count)
+        self.assertEqual(
+            {"GetBlockHeaderByHeight": 2}, client.retry_policy.retries_by_method
+        )
+
+    async def test_send_transaction_is_not_retried_by_default(self):
+        client = AccessAPI(mock.MagicMock())
+        client.retry_policy = _policy()
+        count = await self._run(client, lambda: client.send_transaction(), 1)
+        self.assertEqual(1, count)
+
+        client.retry_policy = _policy(retry_send_transaction=True)
+        count = await self._run(client, lambda: client.send_transaction(), 1)
+        self.assertEqual(2, count)
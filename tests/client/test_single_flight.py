@@ -0,0 +1,118 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import betterproto
+from grpclib.metadata import Deadline
+
+from flow_py_sdk import AccessAPI, SingleFlight
+from flow_py_sdk.proto.flow.access import BlockHeaderResponse
+from flow_py_sdk.proto.flow.entities import BlockHeader
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_shares_in_flight_calls(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        async def call(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key * 2
+
+        results = await asyncio.gather(
+            *[single_flight.do(k, lambda k=k: call(k)) for k in [1, 1, 2, 1]]
+        )
+
+        self.assertEqual([2, 2, 4, 2], results)
+        self.assertEqual([1, 2], calls)
+        self.assertEqual((2, 2), (single_flight.calls, single_flight.shared))
+        self.assertEqual(0, len(single_flight))
+
+        # completed calls are not reused
+        self.assertEqual(2, await single_flight.do(1, lambda: call(1)))
+        self.assertEqual([1, 2, 1], calls)
+
+    async def test_shares_exceptions(self):
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(
+            single_flight.do("a", call),
+            single_flight.do("a", call),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(1, single_flight.calls)
+
+    async def test_cancelling_a_caller_does_not_cancel_the_call(self):
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(single_flight.do("a", call))
+        second = asyncio.ensure_future(single_flight.do("a", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual("done", await second)
+
+
+class TestAccessAPISingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def _call(self, client, *calls):
+        async def unary_unary(stub, route, request, response_type, **kwargs):
+            await asyncio.sleep(0.01)
+            if response_type is BlockHeaderResponse:
+                return BlockHeaderResponse(block=BlockHeader(height=10))
+            return response_type()
+
+        with mock.patch.object(
+            betterproto.ServiceStub, "_unary_unary", autospec=True
+        ) as stub_call:
+            stub_call.side_effect = unary_unary
+            await asyncio.gather(*[c() for c in calls])
+        return stub_call.call_count
+
+    async def test_coalesces_identical_requests(self):
+        client = AccessAPI(mock.MagicMock())
+        client.single_flight = SingleFlight()
+        count = await self._call(
+            client,
+            *[lambda: client.get_latest_block_header(is_sealed=True)] * 5,
+            lambda: client.get_latest_block_header(is_sealed=False),
+        )
+        self.assertEqual(2, count)
+        self.assertEqual(4, client.single_flight.shared)
+
+    async def test_does_not_coalesce_send_transaction(self):
+        client = AccessAPI(mock.MagicMock())
+        client.single_flight = SingleFlight()
+        count = await self._call(client, *[lambda: client.send_transaction()] * 3)
+        self.assertEqual(3, count)
+
+    async def test_does_not_coalesce_calls_with_options(self):
+        client = AccessAPI(mock.MagicMock(), metadata={"authorization": "a"})
+        client.single_flight = SingleFlight()
+        count = await self._call(
+            client, *[lambda: client.get_latest_block_header(is_sealed=True)] * 3
+        )
+        self.assertEqual(3, count)
+
+        client = AccessAPI(mock.MagicMock(), deadline=Deadline.from_timeout(60))
+        client.single_flight = SingleFlight()
+        count = await self._call(
+            client, *[lambda: client.get_latest_block_header(is_sealed=True)] * 3
+        )
+        self.assertEqual(3, count)
+
+    async def test_off_by_default(self):
+        client = AccessAPI(mock.MagicMock())
+        count = await self._call(
+            client, *[lambda: client.get_latest_block_header(is_sealed=True)] * 3
+        )
+        self.assertEqual(3, count)
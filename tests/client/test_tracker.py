@@ -0,0 +1,162 @@
+import asyncio
+import unittest
+
+from flow_py_sdk import (
+    BlockSealTracker,
+    TransactionError,
+    TransactionStatus,
+    TransactionStatusTracker,
+)
+from flow_py_sdk.client import entities
+
+
+class _FakeClient(object):
+    def __init__(self, statuses: dict[bytes, list[TransactionStatus]]):
+        self.statuses = statuses
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_transaction_result(self, *, id: bytes):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        statuses = self.statuses[id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        error = "failed" if id == b"error" else ""
+        return entities.TransactionResultResponse(id, status.value, 0, error, [])
+
+
+def _tracker(client) -> TransactionStatusTracker:
+    return TransactionStatusTracker(
+        client, max_concurrency=2, min_interval=0.001, max_interval=0.01
+    )
+
+
+class TestTransactionStatusTracker(unittest.IsolatedAsyncioTestCase):
+    async def test_resolves_on_status(self):
+        pending = TransactionStatus.TransactionStatusPending
+        finalized = TransactionStatus.TransactionStatusFinalized
+        sealed = TransactionStatus.TransactionStatusSealed
+        client = _FakeClient(
+            {
+                b"a": [pending, finalized, sealed],
+                b"b": [pending, pending, pending, sealed],
+                b"c": [finalized],
+            }
+        )
+        tracker = _tracker(client)
+
+        results = await asyncio.gather(
+            tracker.watch(b"a"),
+            tracker.watch(b"a", finalized),
+            tracker.watch(b"b"),
+            tracker.watch(b"c", finalized),
+        )
+
+        self.assertEqual(
+            [sealed, finalized, sealed, finalized],
+            [TransactionStatus(r.status) for r in results],
+        )
+        self.assertLessEqual(client.max_in_flight, 2)
+
+    async def test_errors(self):
+        client = _FakeClient(
+            {
+                b"error": [TransactionStatus.TransactionStatusExecuted],
+                b"expired": [TransactionStatus.TransactionStatusExpired],
+            }
+        )
+        tracker = _tracker(client)
+
+        for id in [b"error", b"expired"]:
+            with self.subTest(msg=id.decode()):
+                with self.assertRaises(TransactionError):
+                    await tracker.watch(id)
+
+    async def test_cancelled_watch_stops_polling(self):
+        client = _FakeClient({b"a": [TransactionStatus.TransactionStatusPending]})
+        tracker = _tracker(client)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(tracker.watch(b"a"), 0.05)
+        await asyncio.sleep(0.02)
+        calls = client.calls
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(calls, client.calls)
+
+
+class _FakeChain(object):
+    """Seals one block per header request, each with one collection per transaction id."""
+
+    def __init__(self, blocks: list[list[bytes]]):
+        self.blocks = blocks
+        self.height = 0
+        self.result_requests: list[bytes] = []
+
+    async def get_latest_block_header(self, *, is_sealed: bool = False):
+        self.height = min(self.height + 1, len(self.blocks) - 1)
+        return entities.BlockHeader(b"", b"", self.height, None)
+
+    async def get_block_by_height(self, *, height: int):
+        guarantees = [
+            entities.CollectionGuarantee(bytes([height, i]), [])
+            for i in range(len(self.blocks[height]))
+        ]
+        return entities.Block(b"", b"", height, None, guarantees, [], [])
+
+    async def get_collection_by_i_d(self, *, id: bytes):
+        height, i = id
+        return entities.Collection(id, [self.blocks[height][i]])
+
+    async def get_transaction_result(self, *, id: bytes):
+        self.result_requests.append(id)
+        status = TransactionStatus.TransactionStatusPending
+        if id == b"expired":
+            status = TransactionStatus.TransactionStatusExpired
+        elif any(id in block for block in self.blocks[: self.height + 1]):
+            status = TransactionStatus.TransactionStatusSealed
+        return entities.TransactionResultResponse(id, status.value, 0, "", [])
+
+
+class TestBlockSealTracker(unittest.IsolatedAsyncioTestCase):
+    async def test_resolves_transactions_found_in_blocks(self):
+        chain = _FakeChain([[], [b"x"], [b"a", b"y"], [], [b"b"]])
+        tracker = BlockSealTracker(chain, poll_interval=0.001)
+
+        results = await asyncio.gather(tracker.watch(b"a"), tracker.watch(b"b"))
+
+        self.assertEqual([b"a", b"b"], [r.id for r in results])
+        # once when the transactions start being watched, once when they are found
+        self.assertEqual([b"a", b"b"], chain.result_requests[2:])
+
+    async def test_rewatch_sealed_transaction(self):
+        chain = _FakeChain([[], [b"a"]] + [[]] * 1000)
+        tracker = BlockSealTracker(chain, poll_interval=0.001)
+        finalized = TransactionStatus.TransactionStatusFinalized
+
+        first = await tracker.watch(b"a", finalized)
+        height = chain.height
+        second = await asyncio.wait_for(tracker.watch(b"a"), 1)
+
+        self.assertEqual(b"a", first.id)
+        self.assertEqual(
+            TransactionStatus.TransactionStatusSealed,
+            TransactionStatus(second.status),
+        )
+        self.assertLessEqual(chain.height - height, 1)
+        tracker.close()
+
+    async def test_expired(self):
+        chain = _FakeChain([[]] * 10)
+        tracker = BlockSealTracker(chain, poll_interval=0.001, expiry_blocks=3)
+
+        with self.assertRaises(TransactionError):
+            await tracker.watch(b"expired")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Fixtures shared by the tests."""
+
+import asyncio
+
+import ecdsa
+
+from flow_py_sdk import (
+    AccountKey,
+    HashAlgo,
+    InMemorySigner,
+    SignAlgo,
+    TransactionError,
+)
+from flow_py_sdk.client import entities
+
+
+def new_signer() -> InMemorySigner:
+    """A signer with a new random ECDSA_P256/SHA3_256 key."""
+    return new_account_key(0)[1]
+
+
+def new_account_key(
+    index: int, weight: int = 1000, revoked: bool = False
+) -> tuple[AccountKey, InMemorySigner]:
+    """A new random ECDSA_P256/SHA3_256 account key, and a signer for it."""
+    private_key = ecdsa.SigningKey.generate(curve=ecdsa.NIST256p)
+    signer = InMemorySigner(
+        hash_algo=HashAlgo.SHA3_256,
+        sign_algo=SignAlgo.ECDSA_P256,
+        private_key_hex=private_key.to_string().hex(),
+    )
+    key = AccountKey(
+        public_key=private_key.get_verifying_key().to_string(),
+        sign_algo=SignAlgo.ECDSA_P256,
+        hash_algo=HashAlgo.SHA3_256,
+        weight=weight,
+    )
+    key.index = index
+    key.revoked = revoked
+    return key, signer
+
+
+class SequenceNumberClient(object):
+    """Executes transactions at send time and fails the ones with a wrong sequence number."""
+
+    def __init__(self, *, sequence_number: int, reported_sequence_numbers: list[int]):
+        self.sequence_number = sequence_number
+        self.reported_sequence_numbers = reported_sequence_numbers
+        self.results: dict[bytes, str] = {}
+        self.header_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_account_at_latest_block(
+        self, *, address: bytes, use_cache: bool = True
+    ) -> entities.Account:
+        key = AccountKey(
+            public_key=b"", sign_algo=SignAlgo.ECDSA_P256, hash_algo=HashAlgo.SHA3_256
+        )
+        key.index = 0
+        key.sequence_number = self.reported_sequence_numbers.pop(0)
+        return entities.Account(address, 0, b"", [key], {})
+
+    async def get_latest_block_header(self, *, is_sealed: bool = False):
+        self.header_requests += 1
+        return entities.BlockHeader(b"\x01" * 32, b"", 1, None)
+
+    async def send_transaction(self, *, transaction):
+        tx_id = len(self.results).to_bytes(32, "big")
+        if transaction.proposal_key.sequence_number == self.sequence_number:
+            self.sequence_number += 1
+            self.results[tx_id] = ""
+        else:
+            self.results[tx_id] = "[Error Code: 1007] invalid proposal key"
+        return entities.SendTransactionResponse(tx_id)
+
+    async def wait_for_transaction(self, id, *, status, timeout):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if self.results[id]:
+            raise TransactionError(id, self.results[id])
+        return entities.TransactionResultResponse(id, status.value, 0, "", [])
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from typing import Optional
+
+from flow_py_sdk import (
+    AsyncSigner,
+    ExecutorSigner,
+    InMemorySigner,
+    PySDKError,
+)
+from flow_py_sdk.cadence import Address
+from flow_py_sdk.tx import Tx, ProposalKey
+from tests.fixtures import new_signer
+
+
+class _RemoteSigner(AsyncSigner):
+    # stands in for a signer that signs over the network
+    def __init__(self, signer: InMemorySigner) -> None:
+        super().__init__()
+        self.signer = signer
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def sign(self, message: bytes, tag: Optional[bytes] = None) -> bytes:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.signer.sign(message, tag)
+
+
+def _tx(proposer, authorizer, payer) -> Tx:
+    return (
+        Tx(
+            code="transaction { execute { } }",
+            reference_block_id=b"\x01" * 32,
+            proposal_key=ProposalKey(
+                key_address=Address.from_hex("01"), key_id=0, key_sequence_number=0
+            ),
+            payer=Address.from_hex("03"),
+        )
+        .add_authorizers(Address.from_hex("01"), Address.from_hex("02"))
+        .with_payload_signature(Address.from_hex("01"), 0, proposer)
+        .with_payload_signature(Address.from_hex("02"), 0, authorizer)
+        .with_envelope_signature(Address.from_hex("03"), 0, payer)
+    )
+
+
+class TestAsyncSigner(unittest.IsolatedAsyncioTestCase):
+    async def test_executor_signer(self):
+        signer = new_signer()
+        async_signer = ExecutorSigner(signer)
+
+        self.assertEqual(
+            signer.sign_transaction(b"message"),
+            await async_signer.sign_transaction(b"message"),
+        )
+        self.assertEqual(
+            signer.sign_user_message(b"message"),
+            await async_signer.sign_user_message(b"message"),
+        )
+
+    async def test_tx_signs_with_async_signers(self):
+        proposer, authorizer, payer = new_signer(), new_signer(), new_signer()
+        expected = _tx(proposer, authorizer, payer).to_signed_grpc()
+
+        remote = _RemoteSigner(authorizer)
+        actual = await _tx(
+            _RemoteSigner(proposer), remote, ExecutorSigner(payer)
+        ).to_signed_grpc_async()
+
+        self.assertEqual(expected, actual)
+
+    async def test_async_signers_sign_concurrently(self):
+        remote = _RemoteSigner(new_signer())
+        tx = _tx(remote, remote, new_signer())
+        tx.payload_signers[1].address = Address.from_hex("01")
+        tx.payload_signers[1].key_id = 1
+
+        await tx.to_signed_grpc_async()
+
+        self.assertEqual(2, remote.max_in_flight)
+        self.assertEqual(2, len(tx.payload_signatures))
+
+    async def test_sync_signing_rejects_async_signers(self):
+        tx = _tx(_RemoteSigner(new_signer()), new_signer(), new_signer())
+
+        with self.assertRaises(PySDKError):
+            tx.to_signed_grpc()
+
+
+if __name__ == "__main__":
+    unittest.main()
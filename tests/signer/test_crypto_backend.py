@@ -0,0 +1,91 @@
+import importlib.util
+import pickle
+from unittest import TestCase
+
+import ecdsa
+
+from flow_py_sdk import InMemorySigner, InMemoryVerifier, SignAlgo, HashAlgo
+from flow_py_sdk.signer import UserDomainTag, get_crypto_backend, set_crypto_backend
+from flow_py_sdk.signer.crypto_backend import (
+    CryptoBackend,
+    EcdsaBackend,
+    CryptographyBackend,
+)
+
+
+def _backends() -> list[CryptoBackend]:
+    backends = [EcdsaBackend()]
+    if importlib.util.find_spec("cryptography") is not None:
+        try:
+            backends.append(CryptographyBackend())
+        except ImportError:
+            pass
+    return backends
+
+
+class TestCryptoBackend(TestCase):
+    def test_signatures_verify_across_backends(self):
+        for sign_algo in [SignAlgo.ECDSA_P256, SignAlgo.ECDSA_secp256k1]:
+            for hash_algo in [HashAlgo.SHA2_256, HashAlgo.SHA3_256]:
+                private_key = ecdsa.SigningKey.generate(
+                    curve=sign_algo.get_signing_curve()
+                )
+                public_key = private_key.get_verifying_key().to_string()
+                digest = hash_algo.create_hasher().digest()
+                for signing_backend in _backends():
+                    with self.subTest(
+                        f"{signing_backend.name}, sign_algo: {sign_algo}, hash_algo: {hash_algo}"
+                    ):
+                        key = signing_backend.signing_key(
+                            sign_algo, hash_algo, private_key.to_string()
+                        )
+                        self.assertEqual(public_key, key.public_key())
+
+                        signature = key.sign_digest(digest)
+                        self.assertEqual(64, len(signature))
+                        self.assertEqual(signature, key.sign_digest(digest))
+
+                        for verifying_backend in _backends():
+                            verifying_key = verifying_backend.verifying_key(
+                                sign_algo, hash_algo, public_key
+                            )
+                            self.assertTrue(
+                                verifying_key.verify_digest(signature, digest)
+                            )
+                            self.assertFalse(
+                                verifying_key.verify_digest(
+                                    signature, bytes(len(digest))
+                                )
+                            )
+                            self.assertFalse(
+                                verifying_key.verify_digest(signature[:-1], digest)
+                            )
+
+    def test_signers_can_be_pickled(self):
+        private_key = ecdsa.SigningKey.generate(curve=ecdsa.NIST256p)
+        signer = InMemorySigner(
+            hash_algo=HashAlgo.SHA3_256,
+            sign_algo=SignAlgo.ECDSA_P256,
+            private_key_hex=private_key.to_string().hex(),
+        )
+        verifier = InMemoryVerifier(
+            hash_algo=HashAlgo.SHA3_256,
+            sign_algo=SignAlgo.ECDSA_P256,
+            public_key_hex=private_key.get_verifying_key().to_string().hex(),
+        )
+
+        signer = pickle.loads(pickle.dumps(signer))
+        verifier = pickle.loads(pickle.dumps(verifier))
+
+        signature = signer.sign_user_message(b"message")
+        self.assertTrue(verifier.verify(signature, b"message", UserDomainTag))
+
+    def test_set_crypto_backend(self):
+        previous = get_crypto_backend()
+        try:
+            self.assertEqual("ecdsa", set_crypto_backend("ecdsa").name)
+            self.assertEqual("ecdsa", get_crypto_backend().name)
+            with self.assertRaises(ValueError):
+                set_crypto_backend("unknown")
+        finally:
+            set_crypto_backend(previous.name)
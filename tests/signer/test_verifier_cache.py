@@ -0,0 +1,80 @@
+from unittest import TestCase, mock
+
+from flow_py_sdk import InMemoryVerifier, SignAlgo, HashAlgo
+from flow_py_sdk.signer import VerifierCache, get_crypto_backend, set_crypto_backend
+from tests.fixtures import new_signer
+
+
+class TestVerifierCache(TestCase):
+    def test_verifiers_are_cached(self):
+        signer = new_signer()
+        cache = VerifierCache()
+
+        with mock.patch.object(
+            InMemoryVerifier, "precompute", autospec=True
+        ) as precompute:
+            verifier = cache.get(
+                public_key=signer.verifier.public_key_hex,
+                sign_algo=SignAlgo.ECDSA_P256,
+                hash_algo=HashAlgo.SHA3_256,
+            )
+            same = cache.get(
+                public_key=bytes.fromhex(signer.verifier.public_key_hex),
+                sign_algo=SignAlgo.ECDSA_P256,
+                hash_algo=HashAlgo.SHA3_256,
+            )
+            other_hash = cache.get(
+                public_key=signer.verifier.public_key_hex,
+                sign_algo=SignAlgo.ECDSA_P256,
+                hash_algo=HashAlgo.SHA2_256,
+            )
+
+        self.assertIs(verifier, same)
+        self.assertIsNot(verifier, other_hash)
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+        self.assertEqual(2, precompute.call_count)
+        self.assertTrue(
+            verifier.verify_user_message(
+                signer.sign_user_message(b"message"), b"message"
+            )
+        )
+
+    def test_least_recently_used_is_evicted(self):
+        signers = [new_signer() for _ in range(3)]
+        cache = VerifierCache(2, precompute=False)
+
+        def get(signer):
+            return cache.get(
+                public_key=signer.verifier.public_key_hex,
+                sign_algo=SignAlgo.ECDSA_P256,
+                hash_algo=HashAlgo.SHA3_256,
+            )
+
+        first = get(signers[0])
+        get(signers[1])
+        get(signers[0])
+        get(signers[2])
+
+        self.assertEqual(2, len(cache))
+        self.assertIs(first, get(signers[0]))
+        get(signers[1])
+        self.assertEqual((2, 4), (cache.hits, cache.misses))
+
+    def test_precomputed_verifier_verifies(self):
+        signer = new_signer()
+        signature = signer.sign_user_message(b"message")
+
+        previous = get_crypto_backend()
+        try:
+            # precomputing only does something with the ecdsa backend
+            set_crypto_backend("ecdsa")
+            verifier = VerifierCache().get(
+                public_key=signer.verifier.public_key_hex,
+                sign_algo=SignAlgo.ECDSA_P256,
+                hash_algo=HashAlgo.SHA3_256,
+            )
+        finally:
+            set_crypto_backend(previous.name)
+
+        self.assertTrue(verifier.verify_user_message(signature, b"message"))
+        self.assertFalse(verifier.verify_user_message(signature, b"other message"))
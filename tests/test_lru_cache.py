@@ -0,0 +1,33 @@
+import unittest
+from unittest import mock
+
+from flow_py_sdk.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(2, len(cache))
+        self.assertEqual((3, 1), (cache.hits, cache.misses))
+
+    def test_expires_entries(self):
+        cache = LRUCache()
+        with mock.patch("flow_py_sdk.lru_cache.time.monotonic", return_value=10.0):
+            cache.put("a", 1, ttl=1.0)
+            cache.put("b", 2)
+        with mock.patch("flow_py_sdk.lru_cache.time.monotonic", return_value=11.5):
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(2, cache.get("b"))
+        self.assertEqual(1, len(cache))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(max_size=0)
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from flow_py_sdk import SigningPool, InMemorySigner
+from flow_py_sdk.cadence import Address, Int
+from flow_py_sdk.tx import Tx, ProposalKey
+from tests.fixtures import new_signer
+
+
+def _tx(i: int, proposer: InMemorySigner, payer: InMemorySigner) -> Tx:
+    return (
+        Tx(
+            code="transaction(i: Int) { execute { log(i) } }",
+            reference_block_id=b"\x01" * 32,
+            proposal_key=ProposalKey(
+                key_address=Address.from_hex("01"), key_id=0, key_sequence_number=i
+            ),
+            payer=Address.from_hex("02"),
+        )
+        .add_arguments(Int(i))
+        .add_authorizers(Address.from_hex("01"))
+        .with_payload_signature(Address.from_hex("01"), 0, proposer)
+        .with_envelope_signature(Address.from_hex("02"), 0, payer)
+    )
+
+
+class TestSigningPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.proposer = new_signer()
+        self.payer = new_signer()
+
+    def test_sign_matches_sequential_signing(self):
+        expected = [
+            _tx(i, self.proposer, self.payer).to_signed_grpc() for i in range(20)
+        ]
+
+        with SigningPool([self.proposer, self.payer], max_workers=2) as pool:
+            signed = pool.sign([_tx(i, self.proposer, self.payer) for i in range(20)])
+
+        with mock.patch.object(InMemorySigner, "sign") as sign:
+            actual = [tx.to_signed_grpc() for tx in signed]
+            sign.assert_not_called()
+        self.assertEqual(expected, actual)
+
+    def test_signers_outside_of_the_pool_sign_locally(self):
+        expected = _tx(0, self.proposer, self.payer).to_signed_grpc()
+
+        with SigningPool([self.proposer], max_workers=1) as pool:
+            [tx] = pool.sign([_tx(0, self.proposer, self.payer)])
+
+        self.assertEqual(expected, tx.to_signed_grpc())
+
+    def test_sign_async(self):
+        expected = _tx(0, self.proposer, self.payer).to_signed_grpc()
+
+        with SigningPool([self.proposer, self.payer], max_workers=1) as pool:
+            [tx] = asyncio.run(pool.sign_async([_tx(0, self.proposer, self.payer)]))
+
+        self.assertEqual(expected, tx.to_signed_grpc())
+
+
+if __name__ == "__main__":
+    unittest.main()
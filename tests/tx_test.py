@@ -1,7 +1,15 @@
+import hashlib
 import unittest
+from typing import Optional
+from unittest import mock
 
+import rlp
+
+from flow_py_sdk import cadence
 from flow_py_sdk.cadence import Address, String, Int
+from flow_py_sdk.signer import Signer
 from flow_py_sdk.tx import Tx, TxSignature, ProposalKey
+from tests.fixtures import new_signer
 
 
 class TestTx(unittest.TestCase):
@@ -78,6 +86,84 @@ class TestTx(unittest.TestCase):
                 self.assertEqual(case["payload"], payload)
                 self.assertEqual(case["envelope"], envelope)
 
+    def test_payload_follows_changes(self):
+        tx = base_tx()
+        tx.payload_message()
+
+        tx.reference_block_id = b"\0" * 32
+        tx.add_arguments(String("foo"))
+        tx.arguments.append(Int(42))
+        expected = (
+            base_tx()
+            .with_reference_block_id(b"\0" * 32)
+            .add_arguments(String("foo"), Int(42))
+        )
+
+        self.assertEqual(expected.payload_message(), tx.payload_message())
+        self.assertEqual(expected.envelope_message(), tx.envelope_message())
+
+    def test_arguments_are_encoded_once(self):
+        tx = base_tx().add_arguments(
+            cadence.Array([Int(i) for i in range(100)]), String("foo")
+        )
+        tx.payload_signatures = []
+        tx.add_authorizers(Address.from_hex("02"))
+        tx.with_payload_signature(Address.from_hex("02"), 0, new_signer())
+        tx.with_payload_signature(Address.from_hex("02"), 1, new_signer())
+        tx.with_envelope_signature(Address.from_hex("01"), 4, new_signer())
+
+        with mock.patch(
+            "flow_py_sdk.tx.encode_arguments", wraps=cadence.encode_arguments
+        ) as encode_arguments:
+            signed = tx.to_signed_grpc()
+            encode_arguments.assert_called_once()
+
+        self.assertEqual(cadence.encode_arguments(tx.arguments), signed.arguments)
+        self.assertEqual([1, 1], [s.signer_index for s in tx.payload_signatures])
+        self.assertEqual([0], [s.signer_index for s in tx.envelope_signatures])
+
+    def test_envelope_is_encoded_once(self):
+        tx = base_tx().add_arguments(cadence.Array([Int(i) for i in range(1000)]))
+        tx.payload_signatures = []
+        tx.with_envelope_signature(Address.from_hex("01"), 4, new_signer())
+
+        with mock.patch("flow_py_sdk.tx.rlp.encode", wraps=rlp.encode) as encode:
+            tx.to_signed_grpc()
+            encode.assert_called_once()
+
+    def test_changed_transaction_is_signed_again(self):
+        signer = _DigestSigner()
+        tx = base_tx()
+        tx.add_authorizers(Address.from_hex("02"))
+        tx.with_payload_signature(Address.from_hex("02"), 0, signer)
+        tx.with_envelope_signature(Address.from_hex("01"), 4, signer)
+
+        tx.to_signed_grpc()
+        signatures = tx.payload_signatures + tx.envelope_signatures
+        tx.to_signed_grpc()
+        self.assertEqual(signatures, tx.payload_signatures + tx.envelope_signatures)
+
+        tx.proposal_key.key_sequence_number += 1
+        signed = tx.to_signed_grpc()
+
+        # the signature added directly is kept, the signatures of the signers are replaced
+        self.assertEqual(signatures[0], tx.payload_signatures[0])
+        self.assertEqual(2, len(signed.payload_signatures))
+        self.assertEqual(1, len(signed.envelope_signatures))
+        self.assertEqual(
+            signer.sign_transaction(tx.payload_message()),
+            signed.payload_signatures[1].signature,
+        )
+        self.assertEqual(
+            signer.sign_transaction(tx.envelope_message()),
+            signed.envelope_signatures[0].signature,
+        )
+
+
+class _DigestSigner(Signer):
+    def sign(self, message: bytes, tag: Optional[bytes] = None) -> bytes:
+        return hashlib.sha256((tag or b"") + message).digest()
+
 
 def base_tx() -> Tx:
     sig = bytes.fromhex(
@@ -0,0 +1,106 @@
+import unittest
+
+from flow_py_sdk import AccountKey, PySDKError
+from flow_py_sdk.cadence import Address
+from flow_py_sdk.client import entities
+from flow_py_sdk.utils import CompositeSignature, UserSignatureVerifier
+from tests.fixtures import new_account_key
+
+_address = Address.from_hex("01")
+
+
+class _FakeClient(object):
+    def __init__(self, keys: list[AccountKey]) -> None:
+        self.keys = keys
+        self.calls = 0
+
+    async def get_account_at_latest_block(self, *, address: bytes):
+        self.calls += 1
+        return entities.Account(address, 0, b"", self.keys, {})
+
+
+class TestUserSignatureVerifier(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        keys = [
+            new_account_key(0, 1000),
+            new_account_key(1, 500),
+            new_account_key(2, 500),
+            new_account_key(3, 1000, True),
+        ]
+        self.signers = [s for _, s in keys]
+        self.client = _FakeClient([k for k, _ in keys])
+
+    def _sign(self, message: bytes, *key_ids: int) -> list[CompositeSignature]:
+        return [
+            CompositeSignature(
+                _address.hex(), i, self.signers[i].sign_user_message(message).hex()
+            )
+            for i in key_ids
+        ]
+
+    async def test_verify(self):
+        cases = [
+            ("full weight key", self._sign(b"message", 0), True),
+            ("enough weight", self._sign(b"message", 1, 2), True),
+            ("not enough weight", self._sign(b"message", 1), False),
+            ("same key twice", self._sign(b"message", 1, 1), False),
+            ("revoked key", self._sign(b"message", 0, 3), False),
+            ("wrong message", self._sign(b"other", 0), False),
+            (
+                "one invalid signature",
+                self._sign(b"message", 0) + self._sign(b"other", 1),
+                False,
+            ),
+            ("missing key", [CompositeSignature(_address.hex(), 7, "00")], False),
+            ("no signatures", [], False),
+        ]
+        verifier = UserSignatureVerifier(self.client)
+        for name, signatures, expected in cases:
+            with self.subTest(msg=name):
+                self.assertEqual(
+                    expected, await verifier.verify(b"message", signatures)
+                )
+        self.assertEqual(1, self.client.calls)
+
+    async def test_least_recently_used_account_is_evicted(self):
+        verifier = UserSignatureVerifier(self.client, max_accounts=1)
+        other = Address.from_hex("02")
+        signatures = self._sign(b"message", 0)
+        other_signatures = [
+            CompositeSignature(other.hex(), s.keyId, s.signature) for s in signatures
+        ]
+
+        self.assertTrue(await verifier.verify(b"message", signatures))
+        self.assertTrue(await verifier.verify(b"message", other_signatures))
+        self.assertTrue(await verifier.verify(b"message", signatures))
+
+        self.assertEqual(3, self.client.calls)
+        self.assertEqual(1, len(verifier._accounts))
+
+    async def test_signatures_from_different_addresses(self):
+        signatures = self._sign(b"message", 0)
+        signatures.append(CompositeSignature(Address.from_hex("02").hex(), 0, "00"))
+
+        with self.assertRaises(PySDKError):
+            await UserSignatureVerifier(self.client).verify(b"message", signatures)
+
+    async def test_verify_batch(self):
+        batch = [
+            (b"a", self._sign(b"a", 0)),
+            (b"b", self._sign(b"b", 1)),
+            (b"c", []),
+            (b"d", self._sign(b"d", 1, 2)),
+            (b"e", self._sign(b"x", 0)),
+        ]
+
+        async with UserSignatureVerifier(
+            self.client, max_workers=1, chunk_size=2
+        ) as verifier:
+            results = await verifier.verify_batch(batch)
+
+        self.assertEqual([True, False, False, True, False], results)
+        self.assertEqual(1, self.client.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()